@@ -17,7 +17,9 @@ from flask_jwt_extended import JWTManager, create_access_token, get_jwt, jwt_req
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import threading
-from sqlalchemy import func
+import time
+from sqlalchemy import column, func, table
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.expression import text
 import requests
 import logging
@@ -201,6 +203,7 @@ except Exception:
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scraper')))
 from scraper import menu_scraper
+from scraper.retail_hours import CAMPUS_TZ, OpenHoursIndex
 from errors import (
 	APIError, ValidationError, AuthenticationError, AuthorizationError,
 	NotFoundError, ConflictError, DatabaseError, ExternalAPIError
@@ -250,16 +253,24 @@ class Food(db.Model):
 	id = db.Column(db.Integer, primary_key=True)
 	name = db.Column(db.String(255), nullable=False)
 	calories = db.Column(db.Integer, nullable=False)
-	macros = db.Column(db.JSON, nullable=False)
+	# Written as usual; the database moves the blob into nutrition_facts and stores NULL here
+	macros = db.Column(db.JSON, nullable=True)
+	nutrition_id = db.Column(db.Integer, nullable=True)
 	dining_court = db.Column(db.String(100), nullable=True)
 	station = db.Column(db.String(255), nullable=True)
 	meal_time = db.Column(db.String(50), nullable=True)  # breakfast, lunch, late lunch, dinner
-	next_available = db.Column(db.JSON, nullable=True)  # Array of {date, day_name, meal_time} for next 7 days
 	created_at = db.Column(
 		db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
 	)
 
 
+# Read-only views from db/migrations, joined by the food list instead of calling a function per row.
+# Plain table clauses, so db.create_all() never creates them as tables.
+nutrition_facts_macros = table('nutrition_facts_macros', column('id', db.Integer), column('macros', db.JSON))
+# Array of {date, day_name, meal_time} per food, rebuilt from food_appearances
+food_schedules = table('food_schedules', column('food_id', db.Integer), column('next_available', db.JSON))
+
+
 class Activity(db.Model):
 	__tablename__ = 'activities'
 
@@ -424,9 +435,78 @@ def get_dining_courts():
 		return jsonify({'error': f'Failed to fetch dining courts: {exc}'}), 500
 
 
+# "Open now" index over retail_locations.hours_intervals, rebuilt at most every RETAIL_HOURS_TTL_SECONDS
+_retail_hours = {'index': None, 'locations': [], 'loaded_at': 0.0}
+_retail_hours_lock = threading.Lock()
+
+
+def _retail_hours_index():
+	"""Return (OpenHoursIndex, location rows), loading them from the database when the cache is stale."""
+	try:
+		ttl = float(os.getenv('RETAIL_HOURS_TTL_SECONDS', '300'))
+	except ValueError:
+		ttl = 300.0
+	with _retail_hours_lock:
+		if _retail_hours['index'] is None or time.monotonic() - _retail_hours['loaded_at'] > ttl:
+			rows = db.session.execute(text(
+				'SELECT id, name, hours, hours_intervals FROM retail_locations ORDER BY name'
+			)).fetchall()
+			_retail_hours['locations'] = [
+				{'id': row[0], 'name': row[1], 'hours': row[2], 'hours_intervals': row[3]}
+				for row in rows
+			]
+			_retail_hours['index'] = OpenHoursIndex(
+				(loc['id'], loc['hours_intervals']) for loc in _retail_hours['locations']
+			)
+			_retail_hours['loaded_at'] = time.monotonic()
+		return _retail_hours['index'], _retail_hours['locations']
+
+
+@app.route('/api/retail-locations/open', methods=['GET'])
+def get_open_retail_locations():
+	"""
+	Retail locations open at ?at= (ISO 8601, default now; without an offset it
+	is campus time), answered from the cached weekly hours index.
+	Locations whose hours could not be parsed are listed under 'unknown'.
+	"""
+	at = (request.args.get('at') or '').strip()
+	try:
+		when = datetime.fromisoformat(at) if at else datetime.now(CAMPUS_TZ)
+	except ValueError:
+		return jsonify({'error': 'at must be an ISO 8601 datetime'}), 400
+	if when.tzinfo is None:
+		when = when.replace(tzinfo=CAMPUS_TZ)
+
+	try:
+		index, locations = _retail_hours_index()
+	except Exception as exc:
+		db.session.rollback()
+		return jsonify({'error': f'Failed to load retail hours: {exc}'}), 500
+
+	open_ids = index.open_at(when)
+	return jsonify({
+		'at': when.astimezone(CAMPUS_TZ).isoformat(),
+		'open': [{'id': loc['id'], 'name': loc['name']} for loc in locations if loc['id'] in open_ids],
+		'unknown': [
+			{'id': loc['id'], 'name': loc['name'], 'hours': loc['hours']}
+			for loc in locations if loc['hours_intervals'] is None
+		],
+	}), 200
+
+
 @app.route('/api/foods', methods=['GET'])
 def get_foods():
-	query = Food.query.order_by(Food.name.asc())
+	query = (
+		db.session.query(
+			Food,
+			# Macros to read: the inline blob if present, otherwise the shared nutrition_facts row
+			func.coalesce(Food.macros, nutrition_facts_macros.c.macros, type_=db.JSON),
+			food_schedules.c.next_available,
+		)
+		.outerjoin(nutrition_facts_macros, nutrition_facts_macros.c.id == Food.nutrition_id)
+		.outerjoin(food_schedules, food_schedules.c.food_id == Food.id)
+		.order_by(Food.name.asc())
+	)
 	search = request.args.get('q')
 	if search:
 		like = f"%{search.strip()}%"
@@ -442,20 +522,20 @@ def get_foods():
 	if meal_time:
 		query = query.filter(func.lower(Food.meal_time) == meal_time.strip().lower())
 	
-	foods = query.all()
+	rows = query.all()
 	return (
 		jsonify([
 			{
 				'id': food.id,
 				'name': food.name,
 				'calories': food.calories,
-				'macros': food.macros or {},
+				'macros': macros or {},
 				'dining_court': food.dining_court,
 				'station': food.station,
 				'meal_time': food.meal_time,
-				'next_available': food.next_available or [],
+				'next_available': next_available or [],
 			}
-			for food in foods
+			for food, macros, next_available in rows
 		]),
 		200,
 	)
@@ -491,14 +571,15 @@ def add_food():
 				meal_time = 'dinner'
 			# else leave as is
 
+		food_macros = {
+			'protein': float(macros['protein']),
+			'carbs': float(macros['carbs']),
+			'fats': float(macros['fats']),
+		}
 		food = Food(
 			name=str(data['name']).strip(),
 			calories=int(data['calories']),
-			macros={
-				'protein': float(macros['protein']),
-				'carbs': float(macros['carbs']),
-				'fats': float(macros['fats']),
-			},
+			macros=food_macros,
 			dining_court=data.get('dining_court'),
 			station=data.get('station'),
 			meal_time=meal_time,
@@ -511,11 +592,16 @@ def add_food():
 				'id': food.id,
 				'name': food.name,
 				'calories': food.calories,
-				'macros': food.macros,
+				# The database moves the stored blob to nutrition_facts; it is what was sent
+				'macros': food_macros,
 				'dining_court': food.dining_court,
 				'station': food.station,
 			},
 		}), 201
+	except IntegrityError:
+		# foods.match_key is unique: same court, name, meal and station after normalization
+		db.session.rollback()
+		return jsonify({'error': 'A food with this name, dining court, meal and station already exists'}), 409
 	except Exception as exc:  # pragma: no cover - defensive guard
 		db.session.rollback()
 		return jsonify({'error': f'Failed to add food: {exc}'}), 500
@@ -904,14 +990,19 @@ def run_scraper_background():
 				if existing:
 					# Update if existing item has no nutrition data
 					if existing.calories == 0 and item['calories'] > 0:
-						existing.calories = item['calories']
-						existing.macros = {
-							'protein': item['protein'],
-							'carbs': item['carbs'],
-							'fats': item['fats']
-						}
-						existing.station = item.get('station')
-						updated_count += 1
+						try:
+							with db.session.begin_nested():
+								existing.calories = item['calories']
+								existing.macros = {
+									'protein': item['protein'],
+									'carbs': item['carbs'],
+									'fats': item['fats']
+								}
+								existing.station = item.get('station')
+							updated_count += 1
+						except IntegrityError:
+							# The new station moves the food onto another food's match_key
+							skipped_count += 1
 					else:
 						skipped_count += 1
 				else:
@@ -927,8 +1018,14 @@ def run_scraper_background():
 						dining_court=item.get('dining_court'),
 						station=item.get('station')
 					)
-					db.session.add(food)
-					added_count += 1
+					try:
+						# Savepoint per item, so one duplicate does not roll back the whole scrape
+						with db.session.begin_nested():
+							db.session.add(food)
+						added_count += 1
+					except IntegrityError:
+						# foods.match_key is unique: same court, name, meal and station after normalization
+						skipped_count += 1
 
 			db.session.commit()
 
@@ -1043,14 +1140,19 @@ def scrape_menus_sync():
 			if existing:
 				# Update if existing item has no nutrition data
 				if existing.calories == 0 and item['calories'] > 0:
-					existing.calories = item['calories']
-					existing.macros = {
-						'protein': item['protein'],
-						'carbs': item['carbs'],
-						'fats': item['fats']
-					}
-					existing.station = item.get('station')
-					updated_count += 1
+					try:
+						with db.session.begin_nested():
+							existing.calories = item['calories']
+							existing.macros = {
+								'protein': item['protein'],
+								'carbs': item['carbs'],
+								'fats': item['fats']
+							}
+							existing.station = item.get('station')
+						updated_count += 1
+					except IntegrityError:
+						# The new station moves the food onto another food's match_key
+						skipped_count += 1
 				else:
 					skipped_count += 1
 			else:
@@ -1066,8 +1168,14 @@ def scrape_menus_sync():
 					dining_court=item.get('dining_court'),
 					station=item.get('station')
 				)
-				db.session.add(food)
-				added_count += 1
+				try:
+					# Savepoint per item, so one duplicate does not roll back the whole scrape
+					with db.session.begin_nested():
+						db.session.add(food)
+					added_count += 1
+				except IntegrityError:
+					# foods.match_key is unique: same court, name, meal and station after normalization
+					skipped_count += 1
 
 		db.session.commit()
 
@@ -1,15 +1,28 @@
 import os
+import sys
 from sqlalchemy.engine.create import create_engine
 from sqlalchemy.sql.expression import text
 from sqlalchemy.engine.url import make_url
 
+# Migrations live with the scraper, which shares these tables
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.migrations import apply_migrations  # noqa: E402
+from scraper.seeds import apply_seed_files  # noqa: E402
 
-def run_sql_file(engine, path: str):
+
+def run_sql_file(raw_conn, path: str):
+    """Run a whole SQL file as one statement batch in one transaction."""
     with open(path, 'r', encoding='utf-8') as f:
         sql = f.read()
-    with engine.begin() as conn:  # type: ignore
-        for statement in [s.strip() for s in sql.split(';') if s.strip()]:
-            conn.execute(text(statement))
+    cursor = raw_conn.cursor()
+    try:
+        cursor.execute(sql)
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        cursor.close()
 
 
 def main():
@@ -53,24 +66,24 @@ def main():
     retail_path = os.path.join(repo_root, 'db', 'retail_foods.sql')
     retail_menu_seed_path = os.path.join(repo_root, 'db', 'retail_menu_seed.sql')
 
-    print(f"Applying schema from {schema_path}...")
-    run_sql_file(engine, schema_path)
-    print("Schema applied.")
+    # Seeds are skipped while their checksum matches the one recorded in
+    # seed_files; INIT_DB_FORCE_SEED=1 re-applies them all
+    force_seed = os.getenv('INIT_DB_FORCE_SEED', '').lower() in ('1', 'true', 'yes')
 
-    if os.path.exists(seed_path):
-        print(f"Seeding data from {seed_path}...")
-        run_sql_file(engine, seed_path)
-        print("Seed complete.")
+    raw_conn = engine.raw_connection()
+    try:
+        print(f"Applying schema from {schema_path}...")
+        run_sql_file(raw_conn, schema_path)
+        print("Schema applied.")
 
-    if os.path.exists(retail_path):
-        print(f"Seeding retail foods from {retail_path}...")
-        run_sql_file(engine, retail_path)
-        print("Retail foods seeded.")
+        print("Applying migrations from db/migrations...")
+        applied = apply_migrations(raw_conn)
+        print(f"Migrations applied: {len(applied)}.")
 
-    if os.path.exists(retail_menu_seed_path):
-        print(f"Seeding retail menu snapshots from {retail_menu_seed_path}...")
-        run_sql_file(engine, retail_menu_seed_path)
-        print("Retail menu snapshots seeded.")
+        seeded = apply_seed_files(raw_conn, [seed_path, retail_path, retail_menu_seed_path], force=force_seed)
+        print(f"Seed files applied: {len(seeded)}.")
+    finally:
+        raw_conn.close()
 
     print("Done.")
 
@@ -0,0 +1,46 @@
+-- Tables written by the dining court scraper (scraper/menu_scraper.py).
+-- Written to be safe on databases created from db/schema.sql or by older
+-- scraper versions, which added these columns on every run.
+
+CREATE TABLE IF NOT EXISTS foods (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    calories INT NOT NULL,
+    macros JSONB NOT NULL,
+    dining_court VARCHAR(100),
+    station VARCHAR(255),
+    meal_time VARCHAR(50),
+    next_available JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS meal_time VARCHAR(50);
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS next_available JSONB;
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_foods_dining_court ON foods(dining_court);
+
+CREATE TABLE IF NOT EXISTS menu_snapshots (
+    id SERIAL PRIMARY KEY,
+    menu_date DATE NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    calories INT NOT NULL,
+    macros JSONB NOT NULL,
+    dining_court VARCHAR(100) NOT NULL,
+    dining_court_code VARCHAR(10),
+    station VARCHAR(255),
+    meal_time VARCHAR(50),
+    source VARCHAR(20) DEFAULT 'api',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE menu_snapshots ADD COLUMN IF NOT EXISTS dining_court_code VARCHAR(10);
+ALTER TABLE menu_snapshots ADD COLUMN IF NOT EXISTS source VARCHAR(20) DEFAULT 'api';
+ALTER TABLE menu_snapshots ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS idx_menu_snapshots_date ON menu_snapshots(menu_date);
+CREATE INDEX IF NOT EXISTS idx_menu_snapshots_court ON menu_snapshots(dining_court);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_menu_snapshots_unique
+    ON menu_snapshots(menu_date, dining_court, meal_time, station, name);
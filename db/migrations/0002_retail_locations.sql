@@ -0,0 +1,14 @@
+-- Retail location metadata written by scraper/retail_scraper.py.
+
+CREATE TABLE IF NOT EXISTS retail_locations (
+    id VARCHAR(20) PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    url VARCHAR(512),
+    address VARCHAR(255),
+    city_state_zip VARCHAR(255),
+    hours VARCHAR(255),
+    is_open BOOLEAN DEFAULT FALSE,
+    is_food_court BOOLEAN DEFAULT FALSE,
+    child_locations JSONB,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,5 @@
+-- Hash of the scraped content of a food row (see _food_row in scraper/menu_scraper.py).
+-- The scraper skips updates whose hash is unchanged, so unchanged rows are not
+-- rewritten and updated_at only moves when the data does.
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
@@ -0,0 +1,40 @@
+-- One row per date and meal a food is served, replacing the foods.next_available
+-- JSONB array. Schedule changes touch only the rows that changed, and "what is on
+-- at court X on date D" is an index lookup on date joined to foods.
+--
+-- food_schedule(food_id) rebuilds the old next_available shape
+-- ([{date, day_name, meal_time}, ...] or NULL) for API responses.
+
+CREATE TABLE IF NOT EXISTS food_appearances (
+    food_id INT NOT NULL REFERENCES foods(id) ON DELETE CASCADE,
+    date DATE NOT NULL,
+    meal_time VARCHAR(50) NOT NULL,
+    PRIMARY KEY (food_id, date, meal_time)
+);
+
+CREATE INDEX IF NOT EXISTS idx_food_appearances_date ON food_appearances(date, food_id);
+
+INSERT INTO food_appearances (food_id, date, meal_time)
+SELECT f.id, (slot->>'date')::date, COALESCE(NULLIF(slot->>'meal_time', ''), f.meal_time, 'Unknown')
+FROM foods f
+CROSS JOIN LATERAL jsonb_array_elements(f.next_available) AS slot
+WHERE jsonb_typeof(f.next_available) = 'array'
+  AND slot->>'date' ~ '^\d{4}-\d{2}-\d{2}$'
+ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE FUNCTION food_schedule(p_food_id INT) RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+    SELECT jsonb_agg(
+        jsonb_build_object(
+            'date', to_char(a.date, 'YYYY-MM-DD'),
+            'day_name', to_char(a.date, 'FMDay'),
+            'meal_time', a.meal_time
+        )
+        ORDER BY a.date, a.meal_time
+    )
+    FROM food_appearances a
+    WHERE a.food_id = p_food_id
+$$;
+
+DROP INDEX IF EXISTS idx_foods_next_available;
+ALTER TABLE foods DROP COLUMN IF EXISTS next_available;
@@ -0,0 +1,177 @@
+-- Range-partition menu_snapshots by month.
+--
+-- Date queries only touch the partitions they need, and old months are retired
+-- by detaching whole partitions (retire_menu_snapshot_partitions below) instead
+-- of DELETEs that leave dead tuples behind. Retail menus, stored under the
+-- sentinel date 2099-01-01, get their own partition so they are never retired.
+--
+-- Partitions are created on demand by ensure_menu_snapshots_partition(date);
+-- the scraper calls it for the months it is about to write.
+
+CREATE OR REPLACE FUNCTION ensure_menu_snapshots_partition(p_date DATE) RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+BEGIN
+    IF p_date = DATE '2099-01-01' THEN
+        month_start := p_date;
+        partition_name := 'menu_snapshots_retail';
+    ELSE
+        month_start := date_trunc('month', p_date)::date;
+        partition_name := 'menu_snapshots_' || to_char(month_start, 'YYYY_MM');
+    END IF;
+
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    -- Concurrent writers for the same month wait here instead of racing on CREATE
+    PERFORM pg_advisory_xact_lock(hashtext(partition_name));
+    IF to_regclass(partition_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF menu_snapshots FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            month_start,
+            CASE WHEN partition_name = 'menu_snapshots_retail'
+                 THEN month_start + 1
+                 ELSE (month_start + INTERVAL '1 month')::date END
+        );
+    END IF;
+    RETURN partition_name;
+END;
+$$;
+
+DO $$
+DECLARE
+    id_sequence TEXT;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('menu_snapshots')) = 'p' THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE menu_snapshots RENAME TO menu_snapshots_unpartitioned;
+    DROP INDEX IF EXISTS idx_menu_snapshots_date;
+    DROP INDEX IF EXISTS idx_menu_snapshots_court;
+    DROP INDEX IF EXISTS idx_menu_snapshots_unique;
+
+    -- Keep the existing id sequence so ids stay unique across the move
+    id_sequence := pg_get_serial_sequence('menu_snapshots_unpartitioned', 'id');
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY NONE', id_sequence);
+
+    EXECUTE format($ddl$
+        CREATE TABLE menu_snapshots (
+            id INT NOT NULL DEFAULT nextval(%L),
+            menu_date DATE NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            calories INT NOT NULL,
+            macros JSONB NOT NULL,
+            dining_court VARCHAR(100) NOT NULL,
+            dining_court_code VARCHAR(10),
+            station VARCHAR(255),
+            meal_time VARCHAR(50),
+            source VARCHAR(20) DEFAULT 'api',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) PARTITION BY RANGE (menu_date)
+    $ddl$, id_sequence);
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY menu_snapshots.id', id_sequence);
+
+    CREATE UNIQUE INDEX idx_menu_snapshots_unique
+        ON menu_snapshots(menu_date, dining_court, meal_time, station, name);
+    CREATE INDEX idx_menu_snapshots_court ON menu_snapshots(dining_court);
+
+    PERFORM ensure_menu_snapshots_partition(d)
+    FROM (
+        SELECT DISTINCT CASE WHEN menu_date = DATE '2099-01-01' THEN menu_date
+                             ELSE date_trunc('month', menu_date)::date END AS d
+        FROM menu_snapshots_unpartitioned
+    ) months;
+
+    INSERT INTO menu_snapshots
+        (id, menu_date, name, calories, macros, dining_court, dining_court_code, station, meal_time,
+         source, created_at, updated_at)
+    SELECT id, menu_date, name, calories, macros, dining_court, dining_court_code, station, meal_time,
+           source, created_at, updated_at
+    FROM menu_snapshots_unpartitioned
+    ON CONFLICT DO NOTHING;
+
+    DROP TABLE menu_snapshots_unpartitioned;
+END $$;
+
+SELECT ensure_menu_snapshots_partition(DATE '2099-01-01');
+SELECT ensure_menu_snapshots_partition(CURRENT_DATE);
+SELECT ensure_menu_snapshots_partition((CURRENT_DATE + INTERVAL '1 month')::date);
+
+-- Retired months compacted to one row per item: when and how often it was served
+CREATE TABLE IF NOT EXISTS menu_snapshot_history (
+    month DATE NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    dining_court VARCHAR(100) NOT NULL,
+    station VARCHAR(255),
+    meal_time VARCHAR(50),
+    days_served INT NOT NULL,
+    first_served DATE NOT NULL,
+    last_served DATE NOT NULL,
+    calories INT NOT NULL,
+    macros JSONB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_menu_snapshot_history_month ON menu_snapshot_history(month);
+
+-- Detach every partition whose whole month ended more than keep_days ago, then
+-- either compact it into menu_snapshot_history or drop it. Retention is
+-- month-granular: a month is kept until its last day passes the cutoff.
+CREATE OR REPLACE FUNCTION retire_menu_snapshot_partitions(
+    keep_days INT DEFAULT 7,
+    compact BOOLEAN DEFAULT TRUE,
+    dry_run BOOLEAN DEFAULT FALSE
+) RETURNS TABLE (partition_name TEXT, range_end DATE, row_count BIGINT, action TEXT)
+LANGUAGE plpgsql AS $$
+DECLARE
+    part RECORD;
+BEGIN
+    FOR part IN
+        SELECT c.oid::regclass::text AS relname,
+               substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([0-9-]+)''\)')::date AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'menu_snapshots'::regclass
+        ORDER BY 2
+    LOOP
+        CONTINUE WHEN part.upper_bound IS NULL
+            OR part.upper_bound > CURRENT_DATE - keep_days
+            OR part.upper_bound > DATE '2099-01-01';
+
+        partition_name := part.relname;
+        range_end := part.upper_bound;
+        EXECUTE format('SELECT COUNT(*) FROM %s', part.relname) INTO row_count;
+
+        IF dry_run THEN
+            action := CASE WHEN compact THEN 'would compact' ELSE 'would drop' END;
+            RETURN NEXT;
+            CONTINUE;
+        END IF;
+
+        EXECUTE format('ALTER TABLE menu_snapshots DETACH PARTITION %s', part.relname);
+        IF compact THEN
+            EXECUTE format($sql$
+                INSERT INTO menu_snapshot_history
+                    (month, name, dining_court, station, meal_time, days_served, first_served, last_served,
+                     calories, macros)
+                SELECT date_trunc('month', MIN(menu_date))::date, name, dining_court, station, meal_time,
+                       COUNT(DISTINCT menu_date), MIN(menu_date), MAX(menu_date),
+                       (array_agg(calories ORDER BY menu_date DESC))[1],
+                       (array_agg(macros ORDER BY menu_date DESC))[1]
+                FROM %s
+                GROUP BY name, dining_court, station, meal_time
+            $sql$, part.relname);
+            action := 'compacted';
+        ELSE
+            action := 'dropped';
+        END IF;
+        EXECUTE format('DROP TABLE %s', part.relname);
+        RETURN NEXT;
+    END LOOP;
+END;
+$$;
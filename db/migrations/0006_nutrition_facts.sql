@@ -0,0 +1,153 @@
+-- Store each distinct macros blob once.
+--
+-- The full macros JSONB (nutrients, ingredients, allergens) used to be copied
+-- into every foods and menu_snapshots row, although it rarely changes from day
+-- to day. nutrition_facts keeps one row per distinct blob, keyed by the md5 of
+-- its canonical jsonb text, and the other tables reference it by nutrition_id.
+--
+-- Writers can keep inserting macros: a BEFORE trigger moves the blob into
+-- nutrition_facts, sets nutrition_id and stores NULL in macros. Readers use
+-- COALESCE(macros, nutrition_macros(nutrition_id)) for the original value.
+
+CREATE TABLE IF NOT EXISTS nutrition_facts (
+    id SERIAL PRIMARY KEY,
+    content_hash CHAR(32) NOT NULL UNIQUE,
+    macros JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS nutrition_id INT REFERENCES nutrition_facts(id);
+ALTER TABLE foods ALTER COLUMN macros DROP NOT NULL;
+ALTER TABLE menu_snapshots ADD COLUMN IF NOT EXISTS nutrition_id INT REFERENCES nutrition_facts(id);
+ALTER TABLE menu_snapshots ALTER COLUMN macros DROP NOT NULL;
+ALTER TABLE menu_snapshot_history ADD COLUMN IF NOT EXISTS nutrition_id INT REFERENCES nutrition_facts(id);
+ALTER TABLE menu_snapshot_history ALTER COLUMN macros DROP NOT NULL;
+
+INSERT INTO nutrition_facts (content_hash, macros)
+SELECT DISTINCT ON (md5(macros::text)) md5(macros::text), macros
+FROM (
+    SELECT macros FROM foods WHERE macros IS NOT NULL
+    UNION ALL
+    SELECT macros FROM menu_snapshots WHERE macros IS NOT NULL
+    UNION ALL
+    SELECT macros FROM menu_snapshot_history WHERE macros IS NOT NULL
+) blobs
+ON CONFLICT (content_hash) DO NOTHING;
+
+UPDATE foods t SET nutrition_id = n.id, macros = NULL
+FROM nutrition_facts n
+WHERE t.macros IS NOT NULL AND n.content_hash = md5(t.macros::text);
+
+UPDATE menu_snapshots t SET nutrition_id = n.id, macros = NULL
+FROM nutrition_facts n
+WHERE t.macros IS NOT NULL AND n.content_hash = md5(t.macros::text);
+
+UPDATE menu_snapshot_history t SET nutrition_id = n.id, macros = NULL
+FROM nutrition_facts n
+WHERE t.macros IS NOT NULL AND n.content_hash = md5(t.macros::text);
+
+CREATE OR REPLACE FUNCTION nutrition_macros(p_nutrition_id INT) RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+    SELECT macros FROM nutrition_facts WHERE id = p_nutrition_id
+$$;
+
+CREATE OR REPLACE FUNCTION intern_nutrition_facts() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    blob_hash CHAR(32);
+BEGIN
+    IF NEW.macros IS NULL THEN
+        RETURN NEW;
+    END IF;
+
+    blob_hash := md5(NEW.macros::text);
+    INSERT INTO nutrition_facts (content_hash, macros)
+    VALUES (blob_hash, NEW.macros)
+    ON CONFLICT (content_hash) DO NOTHING;
+
+    SELECT id INTO NEW.nutrition_id FROM nutrition_facts WHERE content_hash = blob_hash;
+    NEW.macros := NULL;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS foods_intern_nutrition ON foods;
+CREATE TRIGGER foods_intern_nutrition
+    BEFORE INSERT OR UPDATE OF macros ON foods
+    FOR EACH ROW EXECUTE FUNCTION intern_nutrition_facts();
+
+DROP TRIGGER IF EXISTS menu_snapshots_intern_nutrition ON menu_snapshots;
+CREATE TRIGGER menu_snapshots_intern_nutrition
+    BEFORE INSERT OR UPDATE OF macros ON menu_snapshots
+    FOR EACH ROW EXECUTE FUNCTION intern_nutrition_facts();
+
+DROP TRIGGER IF EXISTS menu_snapshot_history_intern_nutrition ON menu_snapshot_history;
+CREATE TRIGGER menu_snapshot_history_intern_nutrition
+    BEFORE INSERT OR UPDATE OF macros ON menu_snapshot_history
+    FOR EACH ROW EXECUTE FUNCTION intern_nutrition_facts();
+
+-- Same as 0005, but compacted rows keep the nutrition_id reference, and blobs
+-- no longer referenced anywhere are removed after a retirement run.
+CREATE OR REPLACE FUNCTION retire_menu_snapshot_partitions(
+    keep_days INT DEFAULT 7,
+    compact BOOLEAN DEFAULT TRUE,
+    dry_run BOOLEAN DEFAULT FALSE
+) RETURNS TABLE (partition_name TEXT, range_end DATE, row_count BIGINT, action TEXT)
+LANGUAGE plpgsql AS $$
+DECLARE
+    part RECORD;
+    retired INT := 0;
+BEGIN
+    FOR part IN
+        SELECT c.oid::regclass::text AS relname,
+               substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([0-9-]+)''\)')::date AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'menu_snapshots'::regclass
+        ORDER BY 2
+    LOOP
+        CONTINUE WHEN part.upper_bound IS NULL
+            OR part.upper_bound > CURRENT_DATE - keep_days
+            OR part.upper_bound > DATE '2099-01-01';
+
+        partition_name := part.relname;
+        range_end := part.upper_bound;
+        EXECUTE format('SELECT COUNT(*) FROM %s', part.relname) INTO row_count;
+
+        IF dry_run THEN
+            action := CASE WHEN compact THEN 'would compact' ELSE 'would drop' END;
+            RETURN NEXT;
+            CONTINUE;
+        END IF;
+
+        EXECUTE format('ALTER TABLE menu_snapshots DETACH PARTITION %s', part.relname);
+        IF compact THEN
+            EXECUTE format($sql$
+                INSERT INTO menu_snapshot_history
+                    (month, name, dining_court, station, meal_time, days_served, first_served, last_served,
+                     calories, macros, nutrition_id)
+                SELECT date_trunc('month', MIN(menu_date))::date, name, dining_court, station, meal_time,
+                       COUNT(DISTINCT menu_date), MIN(menu_date), MAX(menu_date),
+                       (array_agg(calories ORDER BY menu_date DESC))[1],
+                       (array_agg(macros ORDER BY menu_date DESC))[1],
+                       (array_agg(nutrition_id ORDER BY menu_date DESC))[1]
+                FROM %s
+                GROUP BY name, dining_court, station, meal_time
+            $sql$, part.relname);
+            action := 'compacted';
+        ELSE
+            action := 'dropped';
+        END IF;
+        EXECUTE format('DROP TABLE %s', part.relname);
+        retired := retired + 1;
+        RETURN NEXT;
+    END LOOP;
+
+    IF retired > 0 THEN
+        DELETE FROM nutrition_facts n
+        WHERE NOT EXISTS (SELECT 1 FROM foods t WHERE t.nutrition_id = n.id)
+          AND NOT EXISTS (SELECT 1 FROM menu_snapshots t WHERE t.nutrition_id = n.id)
+          AND NOT EXISTS (SELECT 1 FROM menu_snapshot_history t WHERE t.nutrition_id = n.id);
+    END IF;
+END;
+$$;
@@ -0,0 +1,152 @@
+-- Store collection components once instead of inside every macros blob.
+--
+-- Collection items ("Build Your Own" stations) carried their full enriched
+-- component list, 17 fields per component, in macros.components, so shared
+-- sauces and toppings were repeated in every blob that listed them.
+-- food_components now holds each component once, keyed by its HFS itemId
+-- (components without one are keyed by 'md5:' plus the hash of their JSON).
+-- A macros blob only lists the keys, in order, under macros.component_ids,
+-- and nutrition_components links each nutrition_facts row to its components.
+--
+-- nutrition_macros(id) puts macros.components back together on read, so
+-- COALESCE(macros, nutrition_macros(nutrition_id)) returns the same shape as
+-- before.
+
+CREATE TABLE IF NOT EXISTS food_components (
+    item_id VARCHAR(100) PRIMARY KEY,
+    details JSONB NOT NULL,
+    content_hash CHAR(32) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS nutrition_components (
+    nutrition_id INT NOT NULL REFERENCES nutrition_facts(id) ON DELETE CASCADE,
+    position INT NOT NULL,
+    item_id VARCHAR(100) NOT NULL REFERENCES food_components(item_id),
+    PRIMARY KEY (nutrition_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_nutrition_components_item ON nutrition_components(item_id);
+
+CREATE OR REPLACE FUNCTION food_component_key(p_component JSONB) RETURNS TEXT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT COALESCE(NULLIF(p_component->>'itemId', ''), 'md5:' || md5(p_component::text))
+$$;
+
+-- Move a blob's inline components into food_components and return the blob
+-- with component_ids in their place. Blobs without components pass through.
+CREATE OR REPLACE FUNCTION split_nutrition_components(p_macros JSONB) RETURNS JSONB
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF jsonb_typeof(p_macros->'components') IS DISTINCT FROM 'array'
+       OR jsonb_array_length(p_macros->'components') = 0 THEN
+        RETURN p_macros;
+    END IF;
+
+    INSERT INTO food_components (item_id, details, content_hash)
+    SELECT DISTINCT ON (food_component_key(c)) food_component_key(c), c, md5(c::text)
+    FROM jsonb_array_elements(p_macros->'components') AS c
+    ORDER BY food_component_key(c)
+    ON CONFLICT (item_id) DO UPDATE
+        SET details = EXCLUDED.details,
+            content_hash = EXCLUDED.content_hash,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE food_components.content_hash IS DISTINCT FROM EXCLUDED.content_hash;
+
+    RETURN (p_macros - 'components') || jsonb_build_object(
+        'component_ids',
+        (SELECT jsonb_agg(food_component_key(c) ORDER BY ord)
+         FROM jsonb_array_elements(p_macros->'components') WITH ORDINALITY AS e(c, ord))
+    );
+END;
+$$;
+
+-- Existing blobs: split them, then merge blobs that became identical
+CREATE TEMP TABLE nutrition_split ON COMMIT DROP AS
+SELECT id, split_nutrition_components(macros) AS macros
+FROM nutrition_facts
+WHERE jsonb_typeof(macros->'components') = 'array'
+  AND jsonb_array_length(macros->'components') > 0;
+
+ALTER TABLE nutrition_split ADD COLUMN content_hash CHAR(32), ADD COLUMN keeper INT;
+UPDATE nutrition_split SET content_hash = md5(macros::text);
+UPDATE nutrition_split s SET keeper = k.keeper
+FROM (SELECT content_hash, MIN(id) AS keeper FROM nutrition_split GROUP BY content_hash) k
+WHERE k.content_hash = s.content_hash;
+
+UPDATE foods t SET nutrition_id = s.keeper
+FROM nutrition_split s WHERE t.nutrition_id = s.id AND s.id <> s.keeper;
+UPDATE menu_snapshots t SET nutrition_id = s.keeper
+FROM nutrition_split s WHERE t.nutrition_id = s.id AND s.id <> s.keeper;
+UPDATE menu_snapshot_history t SET nutrition_id = s.keeper
+FROM nutrition_split s WHERE t.nutrition_id = s.id AND s.id <> s.keeper;
+
+DELETE FROM nutrition_facts n USING nutrition_split s WHERE n.id = s.id AND s.id <> s.keeper;
+UPDATE nutrition_facts n SET macros = s.macros, content_hash = s.content_hash
+FROM nutrition_split s WHERE n.id = s.id;
+
+INSERT INTO nutrition_components (nutrition_id, position, item_id)
+SELECT n.id, c.position, c.item_id
+FROM nutrition_facts n
+CROSS JOIN LATERAL jsonb_array_elements_text(n.macros->'component_ids') WITH ORDINALITY AS c(item_id, position)
+WHERE jsonb_typeof(n.macros->'component_ids') = 'array'
+ON CONFLICT DO NOTHING;
+
+-- New blobs get their links as they are interned, however they were written
+CREATE OR REPLACE FUNCTION link_nutrition_components() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO nutrition_components (nutrition_id, position, item_id)
+    SELECT i.id, c.position, c.item_id
+    FROM inserted i
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(i.macros->'component_ids') = 'array'
+             THEN i.macros->'component_ids' ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS c(item_id, position);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS nutrition_facts_link_components ON nutrition_facts;
+CREATE TRIGGER nutrition_facts_link_components
+    AFTER INSERT ON nutrition_facts
+    REFERENCING NEW TABLE AS inserted
+    FOR EACH STATEMENT EXECUTE FUNCTION link_nutrition_components();
+
+-- Same as 0006, but writers that still send full component lists are split first
+CREATE OR REPLACE FUNCTION intern_nutrition_facts() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    blob_hash CHAR(32);
+BEGIN
+    IF NEW.macros IS NULL THEN
+        RETURN NEW;
+    END IF;
+
+    NEW.macros := split_nutrition_components(NEW.macros);
+    blob_hash := md5(NEW.macros::text);
+    INSERT INTO nutrition_facts (content_hash, macros)
+    VALUES (blob_hash, NEW.macros)
+    ON CONFLICT (content_hash) DO NOTHING;
+
+    SELECT id INTO NEW.nutrition_id FROM nutrition_facts WHERE content_hash = blob_hash;
+    NEW.macros := NULL;
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION nutrition_macros(p_nutrition_id INT) RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+    SELECT CASE
+        WHEN n.macros ? 'component_ids' THEN
+            (n.macros - 'component_ids') || jsonb_build_object('components', COALESCE((
+                SELECT jsonb_agg(c.details ORDER BY l.position)
+                FROM nutrition_components l
+                JOIN food_components c ON c.item_id = l.item_id
+                WHERE l.nutrition_id = n.id
+            ), '[]'::jsonb))
+        ELSE n.macros
+    END
+    FROM nutrition_facts n
+    WHERE n.id = p_nutrition_id
+$$;
@@ -0,0 +1,50 @@
+-- Normalized match key on foods.
+--
+-- Writers matched foods on raw name, meal_time, station and dining_court with
+-- no index behind the lookup, and auto_sync_menus normalized every row in
+-- Python on every run. match_key stores the normalized form once per row as a
+-- generated column, which Postgres keeps current on every write, and a unique
+-- index turns matching into an index probe.
+--
+-- food_match_text() keeps ASCII letters and digits, lowercased, and turns any
+-- other run of characters into one space. scraper/match_keys.py builds the
+-- same strings in Python. Changing these functions does not recompute stored
+-- keys; a migration that changes them must rewrite the column.
+
+CREATE OR REPLACE FUNCTION food_match_text(p_value TEXT) RETURNS TEXT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT btrim(lower(regexp_replace(COALESCE(p_value, ''), '[^A-Za-z0-9]+', ' ', 'g')))
+$$;
+
+CREATE OR REPLACE FUNCTION food_match_key(p_dining_court TEXT, p_name TEXT, p_meal_time TEXT, p_station TEXT)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT food_match_text(p_dining_court) || '|' || food_match_text(p_name) || '|'
+        || food_match_text(COALESCE(p_meal_time, 'Unknown')) || '|'
+        || food_match_text(COALESCE(p_station, 'Unknown'))
+$$;
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS match_key TEXT
+    GENERATED ALWAYS AS (food_match_key(dining_court, name, meal_time, station)) STORED;
+
+-- Rows that only differed in case, punctuation or a NULL station collapse into
+-- the most recently updated one, keeping every appearance
+CREATE TEMP TABLE foods_match_duplicates ON COMMIT DROP AS
+SELECT id, keeper
+FROM (
+    SELECT id, first_value(id) OVER (
+        PARTITION BY match_key ORDER BY updated_at DESC NULLS LAST, id
+    ) AS keeper
+    FROM foods
+) ranked
+WHERE id <> keeper;
+
+INSERT INTO food_appearances (food_id, date, meal_time)
+SELECT d.keeper, a.date, a.meal_time
+FROM food_appearances a
+JOIN foods_match_duplicates d ON d.id = a.food_id
+ON CONFLICT DO NOTHING;
+
+DELETE FROM foods f USING foods_match_duplicates d WHERE f.id = d.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_foods_match_key ON foods(match_key);
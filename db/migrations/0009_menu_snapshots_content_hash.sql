@@ -0,0 +1,9 @@
+-- Content hash on menu_snapshots rows.
+--
+-- retail_menu_scraper used to delete every retail row of a location and insert
+-- them again on each run, although the chain data rarely changes. It now diffs
+-- against the stored rows by (name, station, meal_time) and only rewrites rows
+-- whose content_hash (md5 of calories and macros) differs. Rows written before
+-- this migration have no hash and are rewritten once.
+
+ALTER TABLE menu_snapshots ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
@@ -0,0 +1,122 @@
+-- Menu templates shared by several locations.
+--
+-- retail_menu_scraper wrote the dining court beverage list into each of the 5
+-- dining courts, the Quick Bites list into 3 locations and the Starbucks menu
+-- into both Starbucks locations: identical rows repeated per location. A
+-- template now stores its items once (menu_template_items) and links to the
+-- locations that serve them (menu_template_locations).
+--
+-- menu_snapshot_rows expands the templates at read time. It returns every
+-- menu_snapshots row plus one retail row per template item and linked
+-- location, on the 2099-01-01 retail date, so readers still see per-location
+-- rows. Expanded rows get negative ids, -(item id * 64 + the location's slot),
+-- which stay the same for as long as the item and link exist.
+
+CREATE TABLE IF NOT EXISTS menu_templates (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS menu_template_items (
+    id SERIAL PRIMARY KEY,
+    template_id INT NOT NULL REFERENCES menu_templates(id) ON DELETE CASCADE,
+    name VARCHAR(255) NOT NULL,
+    calories INT NOT NULL,
+    macros JSONB,
+    nutrition_id INT REFERENCES nutrition_facts(id),
+    station VARCHAR(255),
+    meal_time VARCHAR(50),
+    content_hash CHAR(32),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (template_id, meal_time, station, name)
+);
+
+CREATE TABLE IF NOT EXISTS menu_template_locations (
+    template_id INT NOT NULL REFERENCES menu_templates(id) ON DELETE CASCADE,
+    dining_court VARCHAR(100) NOT NULL,
+    slot SMALLINT NOT NULL CHECK (slot BETWEEN 0 AND 63),
+    PRIMARY KEY (template_id, dining_court),
+    UNIQUE (template_id, slot)
+);
+
+DROP TRIGGER IF EXISTS menu_template_items_intern_nutrition ON menu_template_items;
+CREATE TRIGGER menu_template_items_intern_nutrition
+    BEFORE INSERT OR UPDATE OF macros ON menu_template_items
+    FOR EACH ROW EXECUTE FUNCTION intern_nutrition_facts();
+
+CREATE OR REPLACE VIEW menu_snapshot_rows AS
+SELECT id, menu_date, name, calories, macros, nutrition_id, dining_court, dining_court_code,
+       station, meal_time, source
+FROM menu_snapshots
+UNION ALL
+SELECT -(i.id * 64 + l.slot), DATE '2099-01-01', i.name, i.calories, i.macros, i.nutrition_id,
+       l.dining_court, NULL::VARCHAR(10), i.station, i.meal_time, 'retail'::VARCHAR(20)
+FROM menu_template_items i
+JOIN menu_template_locations l ON l.template_id = i.template_id;
+
+-- Same as 0006, but blobs still used by a template item are kept
+CREATE OR REPLACE FUNCTION retire_menu_snapshot_partitions(
+    keep_days INT DEFAULT 7,
+    compact BOOLEAN DEFAULT TRUE,
+    dry_run BOOLEAN DEFAULT FALSE
+) RETURNS TABLE (partition_name TEXT, range_end DATE, row_count BIGINT, action TEXT)
+LANGUAGE plpgsql AS $$
+DECLARE
+    part RECORD;
+    retired INT := 0;
+BEGIN
+    FOR part IN
+        SELECT c.oid::regclass::text AS relname,
+               substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([0-9-]+)''\)')::date AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'menu_snapshots'::regclass
+        ORDER BY 2
+    LOOP
+        CONTINUE WHEN part.upper_bound IS NULL
+            OR part.upper_bound > CURRENT_DATE - keep_days
+            OR part.upper_bound > DATE '2099-01-01';
+
+        partition_name := part.relname;
+        range_end := part.upper_bound;
+        EXECUTE format('SELECT COUNT(*) FROM %s', part.relname) INTO row_count;
+
+        IF dry_run THEN
+            action := CASE WHEN compact THEN 'would compact' ELSE 'would drop' END;
+            RETURN NEXT;
+            CONTINUE;
+        END IF;
+
+        EXECUTE format('ALTER TABLE menu_snapshots DETACH PARTITION %s', part.relname);
+        IF compact THEN
+            EXECUTE format($sql$
+                INSERT INTO menu_snapshot_history
+                    (month, name, dining_court, station, meal_time, days_served, first_served, last_served,
+                     calories, macros, nutrition_id)
+                SELECT date_trunc('month', MIN(menu_date))::date, name, dining_court, station, meal_time,
+                       COUNT(DISTINCT menu_date), MIN(menu_date), MAX(menu_date),
+                       (array_agg(calories ORDER BY menu_date DESC))[1],
+                       (array_agg(macros ORDER BY menu_date DESC))[1],
+                       (array_agg(nutrition_id ORDER BY menu_date DESC))[1]
+                FROM %s
+                GROUP BY name, dining_court, station, meal_time
+            $sql$, part.relname);
+            action := 'compacted';
+        ELSE
+            action := 'dropped';
+        END IF;
+        EXECUTE format('DROP TABLE %s', part.relname);
+        retired := retired + 1;
+        RETURN NEXT;
+    END LOOP;
+
+    IF retired > 0 THEN
+        DELETE FROM nutrition_facts n
+        WHERE NOT EXISTS (SELECT 1 FROM foods t WHERE t.nutrition_id = n.id)
+          AND NOT EXISTS (SELECT 1 FROM menu_snapshots t WHERE t.nutrition_id = n.id)
+          AND NOT EXISTS (SELECT 1 FROM menu_snapshot_history t WHERE t.nutrition_id = n.id)
+          AND NOT EXISTS (SELECT 1 FROM menu_template_items t WHERE t.nutrition_id = n.id);
+    END IF;
+END;
+$$;
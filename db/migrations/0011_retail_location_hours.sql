@@ -0,0 +1,10 @@
+-- Structured weekly hours for retail locations.
+--
+-- retail_locations.hours is CampusDish's free text and is_open the IsOpenNow
+-- flag at scrape time, which is stale minutes later. hours_intervals holds the
+-- hours parsed at ingest by scraper/retail_hours.py: a JSON array of
+-- [start, end) pairs of minutes since Monday 00:00 campus time
+-- (America/Indiana/Indianapolis), sorted and non-overlapping. NULL means the
+-- text had no hours the parser recognized; [] means closed all week.
+
+ALTER TABLE retail_locations ADD COLUMN IF NOT EXISTS hours_intervals JSONB;
@@ -0,0 +1,14 @@
+-- Applied version of each chain catalog.
+--
+-- retail_menu_scraper diffed every chain and beverage catalog against the
+-- database on every run, although the catalogs only change when their
+-- chain_scrapers module does. It now records the content hash of each catalog
+-- it syncs (md5 of its locations and rows, see scraper/chain_catalog.py) and
+-- skips catalogs whose hash matches. A catalog with no row here is synced on
+-- the next run.
+
+CREATE TABLE IF NOT EXISTS chain_catalog_versions (
+    name VARCHAR(100) PRIMARY KEY,
+    content_hash CHAR(32) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
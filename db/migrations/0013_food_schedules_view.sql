@@ -0,0 +1,77 @@
+-- Set-based readers for food schedules and nutrition macros, and
+-- foods.next_available back for one release.
+--
+-- 0004 dropped foods.next_available, which broke readers that still select
+-- it. The column is re-added, deprecated, and backfilled from
+-- food_appearances. Writers do not maintain it row by row: after a save they
+-- call refresh_foods_next_available(food_ids) with the foods whose rows or
+-- schedules that save touched. A later migration drops both.
+--
+-- food_schedule(id) and nutrition_macros(id) run once per row when list
+-- queries call them. The food_schedules and nutrition_facts_macros views
+-- return the same values per food and per nutrition_facts row, so list
+-- queries LEFT JOIN them instead. The functions stay for single-row lookups.
+
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS next_available JSONB;
+
+CREATE OR REPLACE VIEW food_schedules AS
+SELECT a.food_id,
+       jsonb_agg(
+           jsonb_build_object(
+               'date', to_char(a.date, 'YYYY-MM-DD'),
+               'day_name', to_char(a.date, 'FMDay'),
+               'meal_time', a.meal_time
+           )
+           ORDER BY a.date, a.meal_time
+       ) AS next_available
+FROM food_appearances a
+GROUP BY a.food_id;
+
+-- Earlier builds of this change shipped a no-argument version that rewrote every food
+DROP FUNCTION IF EXISTS refresh_foods_next_available();
+
+CREATE OR REPLACE FUNCTION refresh_foods_next_available(p_food_ids INT[]) RETURNS INT
+LANGUAGE sql AS $$
+    WITH changed AS (
+        UPDATE foods f
+        SET next_available = s.next_available
+        FROM (
+            SELECT f.id, s.next_available
+            FROM foods f
+            LEFT JOIN (
+                SELECT * FROM food_schedules WHERE food_id = ANY(p_food_ids)
+            ) s ON s.food_id = f.id
+            WHERE f.id = ANY(p_food_ids)
+        ) s
+        WHERE f.id = s.id AND f.next_available IS DISTINCT FROM s.next_available
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INT FROM changed
+$$;
+
+UPDATE foods f SET next_available = s.next_available
+FROM food_schedules s
+WHERE s.food_id = f.id AND f.next_available IS DISTINCT FROM s.next_available;
+
+COMMENT ON COLUMN foods.next_available IS
+    'Deprecated: read food_schedules instead. Refreshed by refresh_foods_next_available() until it is dropped.';
+
+CREATE OR REPLACE VIEW nutrition_facts_macros AS
+SELECT n.id,
+       CASE
+           WHEN n.macros ? 'component_ids' THEN
+               (n.macros - 'component_ids') || jsonb_build_object('components', COALESCE(c.components, '[]'::jsonb))
+           ELSE n.macros
+       END AS macros
+FROM nutrition_facts n
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(fc.details ORDER BY l.position) AS components
+    FROM nutrition_components l
+    JOIN food_components fc ON fc.item_id = l.item_id
+    WHERE l.nutrition_id = n.id AND n.macros ? 'component_ids'
+) c ON TRUE;
+
+CREATE OR REPLACE FUNCTION nutrition_macros(p_nutrition_id INT) RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+    SELECT macros FROM nutrition_facts_macros WHERE id = p_nutrition_id
+$$;
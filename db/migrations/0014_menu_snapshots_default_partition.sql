@@ -0,0 +1,158 @@
+-- Default partition and primary key for menu_snapshots.
+--
+-- Inserts for a month without a partition failed, so writers that never call
+-- ensure_menu_snapshots_partition (the seed files, the frontend and the
+-- backend) broke at the start of each month. Those rows now land in
+-- menu_snapshots_default and are moved into the month's partition when it is
+-- created. The partitioned table also gets the primary key 0005 left out.
+--
+-- retire_menu_snapshot_partitions is split up: compacting a partition and
+-- cleaning up after a retirement run are separate functions, and later
+-- migrations replace those instead of copying the whole loop again.
+
+CREATE TABLE IF NOT EXISTS menu_snapshots_default PARTITION OF menu_snapshots DEFAULT;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'menu_snapshots'::regclass AND contype = 'p'
+    ) THEN
+        ALTER TABLE menu_snapshots ADD PRIMARY KEY (id, menu_date);
+    END IF;
+END $$;
+
+CREATE OR REPLACE FUNCTION ensure_menu_snapshots_partition(p_date DATE) RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+    has_default_rows BOOLEAN;
+BEGIN
+    IF p_date = DATE '2099-01-01' THEN
+        month_start := p_date;
+        month_end := p_date + 1;
+        partition_name := 'menu_snapshots_retail';
+    ELSE
+        month_start := date_trunc('month', p_date)::date;
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := 'menu_snapshots_' || to_char(month_start, 'YYYY_MM');
+    END IF;
+
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    -- Concurrent writers for the same month wait here instead of racing on CREATE
+    PERFORM pg_advisory_xact_lock(hashtext(partition_name));
+    IF to_regclass(partition_name) IS NULL THEN
+        -- CREATE fails while the default partition holds rows of the new range,
+        -- so move them out first and back in afterwards
+        SELECT EXISTS (
+            SELECT 1 FROM menu_snapshots_default WHERE menu_date >= month_start AND menu_date < month_end
+        ) INTO has_default_rows;
+        IF has_default_rows THEN
+            CREATE TEMP TABLE menu_snapshots_moving (LIKE menu_snapshots) ON COMMIT DROP;
+            INSERT INTO menu_snapshots_moving
+            SELECT * FROM menu_snapshots_default WHERE menu_date >= month_start AND menu_date < month_end;
+            DELETE FROM menu_snapshots_default WHERE menu_date >= month_start AND menu_date < month_end;
+        END IF;
+
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF menu_snapshots FOR VALUES FROM (%L) TO (%L)',
+            partition_name, month_start, month_end
+        );
+
+        IF has_default_rows THEN
+            INSERT INTO menu_snapshots SELECT * FROM menu_snapshots_moving;
+            DROP TABLE menu_snapshots_moving;
+        END IF;
+    END IF;
+    RETURN partition_name;
+END;
+$$;
+
+-- Write one detached partition to menu_snapshot_history, keeping the nutrition_id reference
+CREATE OR REPLACE FUNCTION compact_menu_snapshot_partition(p_partition TEXT) RETURNS VOID
+LANGUAGE plpgsql AS $$
+BEGIN
+    EXECUTE format($sql$
+        INSERT INTO menu_snapshot_history
+            (month, name, dining_court, station, meal_time, days_served, first_served, last_served,
+             calories, macros, nutrition_id)
+        SELECT date_trunc('month', MIN(menu_date))::date, name, dining_court, station, meal_time,
+               COUNT(DISTINCT menu_date), MIN(menu_date), MAX(menu_date),
+               (array_agg(calories ORDER BY menu_date DESC))[1],
+               (array_agg(macros ORDER BY menu_date DESC))[1],
+               (array_agg(nutrition_id ORDER BY menu_date DESC))[1]
+        FROM %s
+        GROUP BY name, dining_court, station, meal_time
+    $sql$, p_partition);
+END;
+$$;
+
+-- Runs once after partitions were retired: remove blobs no longer referenced anywhere
+CREATE OR REPLACE FUNCTION cleanup_retired_menu_snapshots() RETURNS VOID
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM nutrition_facts n
+    WHERE NOT EXISTS (SELECT 1 FROM foods t WHERE t.nutrition_id = n.id)
+      AND NOT EXISTS (SELECT 1 FROM menu_snapshots t WHERE t.nutrition_id = n.id)
+      AND NOT EXISTS (SELECT 1 FROM menu_snapshot_history t WHERE t.nutrition_id = n.id)
+      AND NOT EXISTS (SELECT 1 FROM menu_template_items t WHERE t.nutrition_id = n.id);
+END;
+$$;
+
+-- Same as 0010, but the work per partition and per run is done by the two
+-- functions above
+CREATE OR REPLACE FUNCTION retire_menu_snapshot_partitions(
+    keep_days INT DEFAULT 7,
+    compact BOOLEAN DEFAULT TRUE,
+    dry_run BOOLEAN DEFAULT FALSE
+) RETURNS TABLE (partition_name TEXT, range_end DATE, row_count BIGINT, action TEXT)
+LANGUAGE plpgsql AS $$
+DECLARE
+    part RECORD;
+    retired INT := 0;
+BEGIN
+    FOR part IN
+        SELECT c.oid::regclass::text AS relname,
+               substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([0-9-]+)''\)')::date AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'menu_snapshots'::regclass
+        ORDER BY 2
+    LOOP
+        -- The default partition has no upper bound and is never retired
+        CONTINUE WHEN part.upper_bound IS NULL
+            OR part.upper_bound > CURRENT_DATE - keep_days
+            OR part.upper_bound > DATE '2099-01-01';
+
+        partition_name := part.relname;
+        range_end := part.upper_bound;
+        EXECUTE format('SELECT COUNT(*) FROM %s', part.relname) INTO row_count;
+
+        IF dry_run THEN
+            action := CASE WHEN compact THEN 'would compact' ELSE 'would drop' END;
+            RETURN NEXT;
+            CONTINUE;
+        END IF;
+
+        EXECUTE format('ALTER TABLE menu_snapshots DETACH PARTITION %s', part.relname);
+        IF compact THEN
+            PERFORM compact_menu_snapshot_partition(part.relname);
+            action := 'compacted';
+        ELSE
+            action := 'dropped';
+        END IF;
+        EXECUTE format('DROP TABLE %s', part.relname);
+        retired := retired + 1;
+        RETURN NEXT;
+    END LOOP;
+
+    IF retired > 0 THEN
+        PERFORM cleanup_retired_menu_snapshots();
+    END IF;
+END;
+$$;
@@ -2,8 +2,11 @@
 -- These are static menus (not date-specific) stored with source='retail'
 -- Menu date uses sentinel value '2099-01-01' to distinguish from daily API menus
 
--- Clean up any existing retail data before re-seeding
+-- Clean up any existing retail data before re-seeding. The chain catalogs
+-- recorded as synced lose their rows too, so retail_menu_scraper syncs them all
+-- again on its next run.
 DELETE FROM menu_snapshots WHERE source = 'retail';
+DELETE FROM chain_catalog_versions;
 
 -- ============================================================================
 -- WALK ON'S SPORTS BISTREAUX (Atlas Family Marketplace)
@@ -246,303 +249,38 @@ INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, sta
 -- ============================================================================
 
 INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', '#1 BLT (Regular)', 540, '{"protein":21,"carbs":52,"fats":27}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#2 Jersey Shore''s Favorite (Regular)', 630, '{"protein":31,"carbs":53,"fats":31}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#7 Turkey & Provolone (Regular)', 510, '{"protein":30,"carbs":53,"fats":18}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#8 Club Sub with Mayonnaise (Regular)', 640, '{"protein":38,"carbs":53,"fats":29}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#9 Club Supreme (Regular)', 680, '{"protein":40,"carbs":53,"fats":32}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#13 Original Italian (Regular)', 700, '{"protein":31,"carbs":53,"fats":39}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#14 The Veggie (Regular)', 520, '{"protein":20,"carbs":61,"fats":22}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#1 BLT (Giant)', 1080, '{"protein":42,"carbs":104,"fats":54}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#7 Turkey & Provolone (Giant)', 1020, '{"protein":60,"carbs":106,"fats":36}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#8 Club Sub with Mayonnaise (Giant)', 1280, '{"protein":76,"carbs":106,"fats":58}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#13 Original Italian (Giant)', 1400, '{"protein":62,"carbs":106,"fats":78}', 'Jersey Mike's', 'Cold Subs', 'Lunch', 'retail'),
-('2099-01-01', '#17 Mike''s Famous Philly (Regular)', 730, '{"protein":45,"carbs":58,"fats":34}', 'Jersey Mike's', 'Hot Subs', 'Lunch', 'retail'),
-('2099-01-01', '#26 Bacon Ranch Chicken Cheese Steak (Regular)', 910, '{"protein":50,"carbs":58,"fats":52}', 'Jersey Mike's', 'Hot Subs', 'Lunch', 'retail'),
-('2099-01-01', '#43 Chipotle Cheese Steak (Regular)', 850, '{"protein":47,"carbs":60,"fats":46}', 'Jersey Mike's', 'Hot Subs', 'Lunch', 'retail'),
-('2099-01-01', '#56 Big Kahuna Cheese Steak (Regular)', 880, '{"protein":47,"carbs":62,"fats":48}', 'Jersey Mike's', 'Hot Subs', 'Lunch', 'retail'),
-('2099-01-01', '#17 Mike''s Famous Philly (Giant)', 1460, '{"protein":90,"carbs":116,"fats":68}', 'Jersey Mike's', 'Hot Subs', 'Lunch', 'retail'),
-('2099-01-01', '#26 Bacon Ranch Chicken Cheese Steak (Giant)', 1820, '{"protein":100,"carbs":116,"fats":104}', 'Jersey Mike's', 'Hot Subs', 'Lunch', 'retail'),
-('2099-01-01', '#2 Jersey Shore''s Favorite (Mini)', 390, '{"protein":19,"carbs":36,"fats":19}', 'Jersey Mike's', 'Mini Subs', 'Lunch', 'retail'),
-('2099-01-01', '#7 Turkey & Provolone (Mini)', 320, '{"protein":18,"carbs":36,"fats":11}', 'Jersey Mike's', 'Mini Subs', 'Lunch', 'retail'),
-('2099-01-01', 'Grilled Buffalo Chicken Wrap', 600, '{"protein":45,"carbs":48,"fats":25}', 'Jersey Mike's', 'Wraps', 'Lunch', 'retail'),
-('2099-01-01', 'Grilled Chicken Caesar Wrap', 690, '{"protein":46,"carbs":48,"fats":32}', 'Jersey Mike's', 'Wraps', 'Lunch', 'retail'),
-('2099-01-01', 'Regular Chips', 150, '{"protein":2,"carbs":15,"fats":10}', 'Jersey Mike's', 'Sides', 'Lunch', 'retail'),
-('2099-01-01', 'Pickle', 5, '{"protein":0,"carbs":1,"fats":0}', 'Jersey Mike's', 'Sides', 'Lunch', 'retail'),
-('2099-01-01', 'Chocolate Chip Cookie', 420, '{"protein":5,"carbs":55,"fats":21}', 'Jersey Mike's', 'Desserts', 'Lunch', 'retail');
-
--- ============================================================================
--- STARBUCKS @ MSEE
--- Source: Starbucks nutrition data (starbucks.com/menu)
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', 'Caffe Americano (Grande)', 15, '{"protein":1,"carbs":3,"fats":0}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Caffe Latte (Grande)', 190, '{"protein":13,"carbs":19,"fats":7}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Cappuccino (Grande)', 140, '{"protein":10,"carbs":14,"fats":5}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Flat White (Grande)', 220, '{"protein":15,"carbs":22,"fats":9}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Caffe Mocha (Grande)', 370, '{"protein":13,"carbs":50,"fats":14}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'White Chocolate Mocha (Grande)', 430, '{"protein":14,"carbs":59,"fats":16}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Caramel Macchiato (Grande)', 250, '{"protein":10,"carbs":34,"fats":7}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Pumpkin Spice Latte (Grande)', 380, '{"protein":14,"carbs":52,"fats":14}', 'Starbucks @ MSEE', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Iced Caffe Americano (Grande)', 15, '{"protein":2,"carbs":3,"fats":0}', 'Starbucks @ MSEE', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Iced Latte (Grande)', 130, '{"protein":8,"carbs":13,"fats":5}', 'Starbucks @ MSEE', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Iced Caramel Macchiato (Grande)', 250, '{"protein":9,"carbs":35,"fats":7}', 'Starbucks @ MSEE', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Cold Brew (Grande)', 5, '{"protein":0,"carbs":0,"fats":0}', 'Starbucks @ MSEE', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Vanilla Sweet Cream Cold Brew (Grande)', 110, '{"protein":1,"carbs":14,"fats":5}', 'Starbucks @ MSEE', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Nitro Cold Brew (Grande)', 5, '{"protein":0,"carbs":0,"fats":0}', 'Starbucks @ MSEE', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Caffe Vanilla Frappuccino (Grande)', 400, '{"protein":5,"carbs":66,"fats":13}', 'Starbucks @ MSEE', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Caramel Frappuccino (Grande)', 420, '{"protein":5,"carbs":68,"fats":16}', 'Starbucks @ MSEE', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Mocha Frappuccino (Grande)', 410, '{"protein":6,"carbs":64,"fats":15}', 'Starbucks @ MSEE', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Java Chip Frappuccino (Grande)', 470, '{"protein":6,"carbs":69,"fats":19}', 'Starbucks @ MSEE', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Chai Tea Latte (Grande)', 240, '{"protein":6,"carbs":45,"fats":4}', 'Starbucks @ MSEE', 'Tea', 'Breakfast', 'retail'),
-('2099-01-01', 'Matcha Tea Latte (Grande)', 240, '{"protein":9,"carbs":34,"fats":7}', 'Starbucks @ MSEE', 'Tea', 'Breakfast', 'retail'),
-('2099-01-01', 'Hot Chocolate (Grande)', 370, '{"protein":14,"carbs":47,"fats":15}', 'Starbucks @ MSEE', 'Hot Chocolate', 'Breakfast', 'retail'),
-('2099-01-01', 'Iced Passion Tango Tea (Grande)', 0, '{"protein":0,"carbs":0,"fats":0}', 'Starbucks @ MSEE', 'Tea', 'Lunch', 'retail'),
-('2099-01-01', 'Espresso (Solo)', 5, '{"protein":0,"carbs":1,"fats":0}', 'Starbucks @ MSEE', 'Espresso', 'Breakfast', 'retail'),
-('2099-01-01', 'Espresso (Doppio)', 10, '{"protein":1,"carbs":2,"fats":0}', 'Starbucks @ MSEE', 'Espresso', 'Breakfast', 'retail'),
-('2099-01-01', 'Bacon, Gouda & Egg Sandwich', 360, '{"protein":19,"carbs":33,"fats":16}', 'Starbucks @ MSEE', 'Breakfast Sandwiches', 'Breakfast', 'retail'),
-('2099-01-01', 'Turkey Bacon & Egg White Sandwich', 230, '{"protein":17,"carbs":30,"fats":5}', 'Starbucks @ MSEE', 'Breakfast Sandwiches', 'Breakfast', 'retail'),
-('2099-01-01', 'Spinach, Feta & Egg White Wrap', 290, '{"protein":20,"carbs":33,"fats":10}', 'Starbucks @ MSEE', 'Breakfast Sandwiches', 'Breakfast', 'retail'),
-('2099-01-01', 'Butter Croissant', 310, '{"protein":5,"carbs":32,"fats":18}', 'Starbucks @ MSEE', 'Bakery', 'Breakfast', 'retail'),
-('2099-01-01', 'Blueberry Muffin', 420, '{"protein":6,"carbs":61,"fats":17}', 'Starbucks @ MSEE', 'Bakery', 'Breakfast', 'retail'),
-('2099-01-01', 'Turkey Pesto Panini', 500, '{"protein":28,"carbs":46,"fats":22}', 'Starbucks @ MSEE', 'Lunch', 'Lunch', 'retail'),
-('2099-01-01', 'Chicken Caprese Panini', 490, '{"protein":30,"carbs":45,"fats":20}', 'Starbucks @ MSEE', 'Lunch', 'Lunch', 'retail'),
-('2099-01-01', 'Tomato & Mozzarella Panini', 350, '{"protein":17,"carbs":40,"fats":14}', 'Starbucks @ MSEE', 'Lunch', 'Lunch', 'retail'),
-('2099-01-01', 'Everything Bagel', 290, '{"protein":11,"carbs":56,"fats":3}', 'Starbucks @ MSEE', 'Bakery', 'Breakfast', 'retail'),
-('2099-01-01', 'Chocolate Chip Cookie', 370, '{"protein":4,"carbs":47,"fats":19}', 'Starbucks @ MSEE', 'Bakery', 'Lunch', 'retail'),
-('2099-01-01', 'Double Chocolate Brownie', 480, '{"protein":6,"carbs":61,"fats":25}', 'Starbucks @ MSEE', 'Bakery', 'Lunch', 'retail'),
-('2099-01-01', 'Lemon Loaf', 470, '{"protein":5,"carbs":66,"fats":21}', 'Starbucks @ MSEE', 'Bakery', 'Lunch', 'retail'),
-('2099-01-01', 'Cake Pop', 170, '{"protein":2,"carbs":23,"fats":8}', 'Starbucks @ MSEE', 'Desserts', 'Lunch', 'retail');
-
--- ============================================================================
--- STARBUCKS @ WINIFRED PARKER HALL
--- Source: Starbucks nutrition data (starbucks.com/menu)
--- Same menu as MSEE location
+('2099-01-01', '#1 BLT (Regular)', 540, '{"protein":21,"carbs":52,"fats":27}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#2 Jersey Shore''s Favorite (Regular)', 630, '{"protein":31,"carbs":53,"fats":31}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#7 Turkey & Provolone (Regular)', 510, '{"protein":30,"carbs":53,"fats":18}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#8 Club Sub with Mayonnaise (Regular)', 640, '{"protein":38,"carbs":53,"fats":29}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#9 Club Supreme (Regular)', 680, '{"protein":40,"carbs":53,"fats":32}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#13 Original Italian (Regular)', 700, '{"protein":31,"carbs":53,"fats":39}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#14 The Veggie (Regular)', 520, '{"protein":20,"carbs":61,"fats":22}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#1 BLT (Giant)', 1080, '{"protein":42,"carbs":104,"fats":54}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#7 Turkey & Provolone (Giant)', 1020, '{"protein":60,"carbs":106,"fats":36}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#8 Club Sub with Mayonnaise (Giant)', 1280, '{"protein":76,"carbs":106,"fats":58}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#13 Original Italian (Giant)', 1400, '{"protein":62,"carbs":106,"fats":78}', 'Jersey Mike''s', 'Cold Subs', 'Lunch', 'retail'),
+('2099-01-01', '#17 Mike''s Famous Philly (Regular)', 730, '{"protein":45,"carbs":58,"fats":34}', 'Jersey Mike''s', 'Hot Subs', 'Lunch', 'retail'),
+('2099-01-01', '#26 Bacon Ranch Chicken Cheese Steak (Regular)', 910, '{"protein":50,"carbs":58,"fats":52}', 'Jersey Mike''s', 'Hot Subs', 'Lunch', 'retail'),
+('2099-01-01', '#43 Chipotle Cheese Steak (Regular)', 850, '{"protein":47,"carbs":60,"fats":46}', 'Jersey Mike''s', 'Hot Subs', 'Lunch', 'retail'),
+('2099-01-01', '#56 Big Kahuna Cheese Steak (Regular)', 880, '{"protein":47,"carbs":62,"fats":48}', 'Jersey Mike''s', 'Hot Subs', 'Lunch', 'retail'),
+('2099-01-01', '#17 Mike''s Famous Philly (Giant)', 1460, '{"protein":90,"carbs":116,"fats":68}', 'Jersey Mike''s', 'Hot Subs', 'Lunch', 'retail'),
+('2099-01-01', '#26 Bacon Ranch Chicken Cheese Steak (Giant)', 1820, '{"protein":100,"carbs":116,"fats":104}', 'Jersey Mike''s', 'Hot Subs', 'Lunch', 'retail'),
+('2099-01-01', '#2 Jersey Shore''s Favorite (Mini)', 390, '{"protein":19,"carbs":36,"fats":19}', 'Jersey Mike''s', 'Mini Subs', 'Lunch', 'retail'),
+('2099-01-01', '#7 Turkey & Provolone (Mini)', 320, '{"protein":18,"carbs":36,"fats":11}', 'Jersey Mike''s', 'Mini Subs', 'Lunch', 'retail'),
+('2099-01-01', 'Grilled Buffalo Chicken Wrap', 600, '{"protein":45,"carbs":48,"fats":25}', 'Jersey Mike''s', 'Wraps', 'Lunch', 'retail'),
+('2099-01-01', 'Grilled Chicken Caesar Wrap', 690, '{"protein":46,"carbs":48,"fats":32}', 'Jersey Mike''s', 'Wraps', 'Lunch', 'retail'),
+('2099-01-01', 'Regular Chips', 150, '{"protein":2,"carbs":15,"fats":10}', 'Jersey Mike''s', 'Sides', 'Lunch', 'retail'),
+('2099-01-01', 'Pickle', 5, '{"protein":0,"carbs":1,"fats":0}', 'Jersey Mike''s', 'Sides', 'Lunch', 'retail'),
+('2099-01-01', 'Chocolate Chip Cookie', 420, '{"protein":5,"carbs":55,"fats":21}', 'Jersey Mike''s', 'Desserts', 'Lunch', 'retail');
+
+-- ============================================================================
+-- STARBUCKS, DINING COURT BEVERAGES, QUICK BITES BEVERAGES
+-- These menus are served unchanged at several locations and are stored once
+-- as menu templates (see db/migrations/0010_menu_templates.sql), not as
+-- per-location rows here. Run scraper/retail_menu_scraper.py to load them.
 -- ============================================================================
 
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', 'Caffe Americano (Grande)', 15, '{"protein":1,"carbs":3,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Caffe Latte (Grande)', 190, '{"protein":13,"carbs":19,"fats":7}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Cappuccino (Grande)', 140, '{"protein":10,"carbs":14,"fats":5}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Flat White (Grande)', 220, '{"protein":15,"carbs":22,"fats":9}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Caffe Mocha (Grande)', 370, '{"protein":13,"carbs":50,"fats":14}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'White Chocolate Mocha (Grande)', 430, '{"protein":14,"carbs":59,"fats":16}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Caramel Macchiato (Grande)', 250, '{"protein":10,"carbs":34,"fats":7}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Pumpkin Spice Latte (Grande)', 380, '{"protein":14,"carbs":52,"fats":14}', 'Starbucks @ Winifred Parker Hall', 'Hot Coffee', 'Breakfast', 'retail'),
-('2099-01-01', 'Iced Caffe Americano (Grande)', 15, '{"protein":2,"carbs":3,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Iced Latte (Grande)', 130, '{"protein":8,"carbs":13,"fats":5}', 'Starbucks @ Winifred Parker Hall', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Iced Caramel Macchiato (Grande)', 250, '{"protein":9,"carbs":35,"fats":7}', 'Starbucks @ Winifred Parker Hall', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Cold Brew (Grande)', 5, '{"protein":0,"carbs":0,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Vanilla Sweet Cream Cold Brew (Grande)', 110, '{"protein":1,"carbs":14,"fats":5}', 'Starbucks @ Winifred Parker Hall', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Nitro Cold Brew (Grande)', 5, '{"protein":0,"carbs":0,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Cold Coffee', 'Lunch', 'retail'),
-('2099-01-01', 'Caffe Vanilla Frappuccino (Grande)', 400, '{"protein":5,"carbs":66,"fats":13}', 'Starbucks @ Winifred Parker Hall', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Caramel Frappuccino (Grande)', 420, '{"protein":5,"carbs":68,"fats":16}', 'Starbucks @ Winifred Parker Hall', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Mocha Frappuccino (Grande)', 410, '{"protein":6,"carbs":64,"fats":15}', 'Starbucks @ Winifred Parker Hall', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Java Chip Frappuccino (Grande)', 470, '{"protein":6,"carbs":69,"fats":19}', 'Starbucks @ Winifred Parker Hall', 'Frappuccinos', 'Lunch', 'retail'),
-('2099-01-01', 'Chai Tea Latte (Grande)', 240, '{"protein":6,"carbs":45,"fats":4}', 'Starbucks @ Winifred Parker Hall', 'Tea', 'Breakfast', 'retail'),
-('2099-01-01', 'Matcha Tea Latte (Grande)', 240, '{"protein":9,"carbs":34,"fats":7}', 'Starbucks @ Winifred Parker Hall', 'Tea', 'Breakfast', 'retail'),
-('2099-01-01', 'Hot Chocolate (Grande)', 370, '{"protein":14,"carbs":47,"fats":15}', 'Starbucks @ Winifred Parker Hall', 'Hot Chocolate', 'Breakfast', 'retail'),
-('2099-01-01', 'Iced Passion Tango Tea (Grande)', 0, '{"protein":0,"carbs":0,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Tea', 'Lunch', 'retail'),
-('2099-01-01', 'Espresso (Solo)', 5, '{"protein":0,"carbs":1,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Espresso', 'Breakfast', 'retail'),
-('2099-01-01', 'Espresso (Doppio)', 10, '{"protein":1,"carbs":2,"fats":0}', 'Starbucks @ Winifred Parker Hall', 'Espresso', 'Breakfast', 'retail'),
-('2099-01-01', 'Bacon, Gouda & Egg Sandwich', 360, '{"protein":19,"carbs":33,"fats":16}', 'Starbucks @ Winifred Parker Hall', 'Breakfast Sandwiches', 'Breakfast', 'retail'),
-('2099-01-01', 'Turkey Bacon & Egg White Sandwich', 230, '{"protein":17,"carbs":30,"fats":5}', 'Starbucks @ Winifred Parker Hall', 'Breakfast Sandwiches', 'Breakfast', 'retail'),
-('2099-01-01', 'Spinach, Feta & Egg White Wrap', 290, '{"protein":20,"carbs":33,"fats":10}', 'Starbucks @ Winifred Parker Hall', 'Breakfast Sandwiches', 'Breakfast', 'retail'),
-('2099-01-01', 'Butter Croissant', 310, '{"protein":5,"carbs":32,"fats":18}', 'Starbucks @ Winifred Parker Hall', 'Bakery', 'Breakfast', 'retail'),
-('2099-01-01', 'Blueberry Muffin', 420, '{"protein":6,"carbs":61,"fats":17}', 'Starbucks @ Winifred Parker Hall', 'Bakery', 'Breakfast', 'retail'),
-('2099-01-01', 'Turkey Pesto Panini', 500, '{"protein":28,"carbs":46,"fats":22}', 'Starbucks @ Winifred Parker Hall', 'Lunch', 'Lunch', 'retail'),
-('2099-01-01', 'Chicken Caprese Panini', 490, '{"protein":30,"carbs":45,"fats":20}', 'Starbucks @ Winifred Parker Hall', 'Lunch', 'Lunch', 'retail'),
-('2099-01-01', 'Tomato & Mozzarella Panini', 350, '{"protein":17,"carbs":40,"fats":14}', 'Starbucks @ Winifred Parker Hall', 'Lunch', 'Lunch', 'retail'),
-('2099-01-01', 'Everything Bagel', 290, '{"protein":11,"carbs":56,"fats":3}', 'Starbucks @ Winifred Parker Hall', 'Bakery', 'Breakfast', 'retail'),
-('2099-01-01', 'Chocolate Chip Cookie', 370, '{"protein":4,"carbs":47,"fats":19}', 'Starbucks @ Winifred Parker Hall', 'Bakery', 'Lunch', 'retail'),
-('2099-01-01', 'Double Chocolate Brownie', 480, '{"protein":6,"carbs":61,"fats":25}', 'Starbucks @ Winifred Parker Hall', 'Bakery', 'Lunch', 'retail'),
-('2099-01-01', 'Lemon Loaf', 470, '{"protein":5,"carbs":66,"fats":21}', 'Starbucks @ Winifred Parker Hall', 'Bakery', 'Lunch', 'retail'),
-('2099-01-01', 'Cake Pop', 170, '{"protein":2,"carbs":23,"fats":8}', 'Starbucks @ Winifred Parker Hall', 'Desserts', 'Lunch', 'retail');
-
--- ============================================================================
--- EARHART DINING COURT - BEVERAGES
--- Source: Prairie Farms (milk), Coca-Cola (fountain drinks)
--- Cup size: 8 oz standard dining hall cup
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', '2% Reduced Fat Milk (8 oz)', 120, '{"protein": 8, "carbs": 12, "fats": 5, "saturated_fat": 3, "cholesterol": 25, "sodium": 120, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Reduced fat milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fat Free Skim Milk (8 oz)', 80, '{"protein": 8, "carbs": 12, "fats": 0, "saturated_fat": 0, "cholesterol": 5, "sodium": 130, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Fat free milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', '1% Lowfat Chocolate Milk (8 oz)', 160, '{"protein": 8, "carbs": 26, "fats": 3, "saturated_fat": 2, "cholesterol": 10, "sodium": 190, "fiber": 1, "sugar": 24, "added_sugar": 12, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Lowfat milk, sugar, cocoa (processed with alkali), cornstarch, salt, carrageenan, vanillin, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Earhart', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- FORD DINING COURT - BEVERAGES
--- Source: Prairie Farms (milk), Coca-Cola (fountain drinks)
--- Cup size: 8 oz standard dining hall cup
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', '2% Reduced Fat Milk (8 oz)', 120, '{"protein": 8, "carbs": 12, "fats": 5, "saturated_fat": 3, "cholesterol": 25, "sodium": 120, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Reduced fat milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fat Free Skim Milk (8 oz)', 80, '{"protein": 8, "carbs": 12, "fats": 0, "saturated_fat": 0, "cholesterol": 5, "sodium": 130, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Fat free milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', '1% Lowfat Chocolate Milk (8 oz)', 160, '{"protein": 8, "carbs": 26, "fats": 3, "saturated_fat": 2, "cholesterol": 10, "sodium": 190, "fiber": 1, "sugar": 24, "added_sugar": 12, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Lowfat milk, sugar, cocoa (processed with alkali), cornstarch, salt, carrageenan, vanillin, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Ford', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- HILLENBRAND DINING COURT - BEVERAGES
--- Source: Prairie Farms (milk), Coca-Cola (fountain drinks)
--- Cup size: 8 oz standard dining hall cup
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', '2% Reduced Fat Milk (8 oz)', 120, '{"protein": 8, "carbs": 12, "fats": 5, "saturated_fat": 3, "cholesterol": 25, "sodium": 120, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Reduced fat milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fat Free Skim Milk (8 oz)', 80, '{"protein": 8, "carbs": 12, "fats": 0, "saturated_fat": 0, "cholesterol": 5, "sodium": 130, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Fat free milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', '1% Lowfat Chocolate Milk (8 oz)', 160, '{"protein": 8, "carbs": 26, "fats": 3, "saturated_fat": 2, "cholesterol": 10, "sodium": 190, "fiber": 1, "sugar": 24, "added_sugar": 12, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Lowfat milk, sugar, cocoa (processed with alkali), cornstarch, salt, carrageenan, vanillin, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Hillenbrand', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- WILEY DINING COURT - BEVERAGES
--- Source: Prairie Farms (milk), Coca-Cola (fountain drinks)
--- Cup size: 8 oz standard dining hall cup
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', '2% Reduced Fat Milk (8 oz)', 120, '{"protein": 8, "carbs": 12, "fats": 5, "saturated_fat": 3, "cholesterol": 25, "sodium": 120, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Reduced fat milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fat Free Skim Milk (8 oz)', 80, '{"protein": 8, "carbs": 12, "fats": 0, "saturated_fat": 0, "cholesterol": 5, "sodium": 130, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Fat free milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', '1% Lowfat Chocolate Milk (8 oz)', 160, '{"protein": 8, "carbs": 26, "fats": 3, "saturated_fat": 2, "cholesterol": 10, "sodium": 190, "fiber": 1, "sugar": 24, "added_sugar": 12, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Lowfat milk, sugar, cocoa (processed with alkali), cornstarch, salt, carrageenan, vanillin, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Wiley', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- WINDSOR DINING COURT - BEVERAGES
--- Source: Prairie Farms (milk), Coca-Cola (fountain drinks)
--- Cup size: 8 oz standard dining hall cup
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', '2% Reduced Fat Milk (8 oz)', 120, '{"protein": 8, "carbs": 12, "fats": 5, "saturated_fat": 3, "cholesterol": 25, "sodium": 120, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Reduced fat milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fat Free Skim Milk (8 oz)', 80, '{"protein": 8, "carbs": 12, "fats": 0, "saturated_fat": 0, "cholesterol": 5, "sodium": 130, "fiber": 0, "sugar": 12, "added_sugar": 0, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Fat free milk, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', '1% Lowfat Chocolate Milk (8 oz)', 160, '{"protein": 8, "carbs": 26, "fats": 3, "saturated_fat": 2, "cholesterol": 10, "sodium": 190, "fiber": 1, "sugar": 24, "added_sugar": 12, "is_vegetarian": true, "is_vegan": false, "allergens": ["Milk"], "ingredients": "Lowfat milk, sugar, cocoa (processed with alkali), cornstarch, salt, carrageenan, vanillin, vitamin A palmitate, vitamin D3.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Windsor', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- 1BOWL AT MEREDITH HALL - BEVERAGES
--- Source: Coca-Cola (fountain drinks)
--- Cup size: 8 oz
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', '1bowl at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- PETE'S ZA AT TARKINGTON HALL - BEVERAGES
--- Source: Coca-Cola (fountain drinks)
--- Cup size: 8 oz
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Pete's Za at Tarkington Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
--- ============================================================================
--- SUSHI BOSS AT MEREDITH HALL - BEVERAGES
--- Source: Coca-Cola (fountain drinks)
--- Cup size: 8 oz
--- ============================================================================
-
-INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES
-('2099-01-01', 'Coca-Cola (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural flavors, caffeine.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Diet Coke (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 30, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, aspartame, phosphoric acid, potassium benzoate, natural flavors, citric acid, caffeine.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Coca-Cola Zero Sugar (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, caramel color, phosphoric acid, aspartame, potassium benzoate, natural flavors, potassium citrate, acesulfame potassium, caffeine.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite (8 oz)', 95, '{"protein": 0, "carbs": 26, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 25, "fiber": 0, "sugar": 26, "added_sugar": 26, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, natural flavors, sodium citrate, sodium benzoate.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Sprite Zero (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, citric acid, natural flavors, potassium citrate, aspartame, acesulfame potassium, sodium benzoate.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Dr Pepper (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, phosphoric acid, natural and artificial flavors, sodium benzoate, caffeine.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Fanta Orange (8 oz)', 110, '{"protein": 0, "carbs": 30, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 30, "added_sugar": 30, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, citric acid, sodium benzoate, natural flavors, modified food starch, glycerol ester of rosin, yellow 6, red 40.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Barq''s Root Beer (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 38, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, caramel color, sodium benzoate, citric acid, caffeine, artificial and natural flavors, acacia.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Mello Yello (8 oz)', 110, '{"protein": 0, "carbs": 29, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 29, "added_sugar": 29, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Carbonated water, high fructose corn syrup, concentrated orange juice, citric acid, natural flavors, caffeine, sodium benzoate, gum arabic, glycerol ester of rosin, calcium disodium EDTA, yellow 5.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Hi-C Flashin'' Fruit Punch (8 oz)', 100, '{"protein": 0, "carbs": 27, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 28, "fiber": 0, "sugar": 27, "added_sugar": 27, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, natural flavors, modified cornstarch, fruit juice for color, glycerol ester of rosin, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Powerade Mountain Berry Blast (8 oz)', 50, '{"protein": 0, "carbs": 13, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 75, "fiber": 0, "sugar": 13, "added_sugar": 13, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, citric acid, salt, natural flavors, potassium citrate, modified food starch, calcium disodium EDTA, medium chain triglycerides, sucrose acetate isobutyrate, blue 1.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Minute Maid Lemonade (8 oz)', 90, '{"protein": 0, "carbs": 25, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 20, "fiber": 0, "sugar": 24, "added_sugar": 24, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water, high fructose corn syrup, lemon juice from concentrate, citric acid, natural flavors, sodium citrate, ascorbic acid (vitamin C).", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail'),
-('2099-01-01', 'Water (8 oz)', 0, '{"protein": 0, "carbs": 0, "fats": 0, "saturated_fat": 0, "cholesterol": 0, "sodium": 0, "fiber": 0, "sugar": 0, "added_sugar": 0, "is_vegetarian": true, "is_vegan": true, "allergens": [], "ingredients": "Water.", "serving_size": "8 oz"}', 'Sushi Boss at Meredith Hall', 'Beverages', 'breakfast/lunch/dinner', 'retail');
-
 -- ============================================================================
 -- LAWSON ON-THE-GO! - BEVERAGES
 -- Source: Standard coffee preparation / commercial ingredient labels
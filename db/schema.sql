@@ -1,11 +1,11 @@
-CREATE TABLE users (
+CREATE TABLE IF NOT EXISTS users (
     id SERIAL PRIMARY KEY,
     email VARCHAR(255) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE TABLE meals (
+CREATE TABLE IF NOT EXISTS meals (
     id SERIAL PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     calories INT NOT NULL,
@@ -15,7 +15,7 @@ CREATE TABLE meals (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE TABLE logs (
+CREATE TABLE IF NOT EXISTS logs (
     id SERIAL PRIMARY KEY,
     user_id INT REFERENCES users(id) ON DELETE CASCADE,
     meal_id INT REFERENCES meals(id) ON DELETE CASCADE,
@@ -54,7 +54,6 @@ CREATE TABLE IF NOT EXISTS menu_snapshots (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_menu_snapshots_date ON menu_snapshots(menu_date);
 CREATE INDEX IF NOT EXISTS idx_menu_snapshots_court ON menu_snapshots(dining_court);
 CREATE UNIQUE INDEX IF NOT EXISTS idx_menu_snapshots_unique
     ON menu_snapshots(menu_date, dining_court, meal_time, station, name);
@@ -1,4 +1,4 @@
-import { ensureSchema, query, getDatabaseCapacityStatus } from '../../../utils/db';
+import { ensureSchema, query, getDatabaseCapacityStatus, pruneMenuSnapshots } from '../../../utils/db';
 
 function isAuthorizedCron(req) {
   const secret = process.env.CRON_SECRET;
@@ -24,9 +24,7 @@ export default async function handler(req, res) {
     const retentionDays = Number.isFinite(retentionDaysRaw) && retentionDaysRaw > 0 ? retentionDaysRaw : 30;
     const cutoffMs = Date.now() - (retentionDays * 24 * 60 * 60 * 1000);
 
-    const snapshotsResult = await query(
-      `DELETE FROM menu_snapshots WHERE menu_date < CURRENT_DATE - INTERVAL '7 days'`
-    );
+    const snapshotsRetired = await pruneMenuSnapshots();
 
     const syncResult = await query(
       `DELETE FROM sync_data WHERE updated_at < $1`,
@@ -37,7 +35,7 @@ export default async function handler(req, res) {
 
     return res.status(200).json({
       ok: true,
-      snapshots_deleted: snapshotsResult.rowCount || 0,
+      snapshots_deleted: snapshotsRetired,
       stale_sync_rows_deleted: syncResult.rowCount || 0,
       sync_retention_days: retentionDays,
       db_guard: dbGuard,
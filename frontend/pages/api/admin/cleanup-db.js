@@ -1,5 +1,5 @@
 import { requireAdmin } from '../../../utils/jwt';
-import { ensureSchema, query } from '../../../utils/db';
+import { ensureSchema, pruneMenuSnapshots, query } from '../../../utils/db';
 import { csrfCheck } from '../../../utils/csrf';
 
 export default async function handler(req, res) {
@@ -11,10 +11,8 @@ export default async function handler(req, res) {
     await requireAdmin(req);
     await ensureSchema();
 
-    // Delete menu snapshots older than 7 days
-    const snapshotResult = await query(
-      `DELETE FROM menu_snapshots WHERE menu_date < CURRENT_DATE - INTERVAL '7 days'`
-    );
+    // Retire menu snapshots past the retention window
+    const snapshotsRetired = await pruneMenuSnapshots();
 
     // Get current table sizes
     const sizeResult = await query(`
@@ -32,7 +30,7 @@ export default async function handler(req, res) {
 
     return res.status(200).json({
       ok: true,
-      snapshots_deleted: snapshotResult.rowCount,
+      snapshots_deleted: snapshotsRetired,
       db_size: dbSizeResult.rows[0]?.db_size,
       tables: sizeResult.rows.map(r => ({ name: r.table_name, size: r.total_size })),
     });
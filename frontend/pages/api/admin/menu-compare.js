@@ -1,4 +1,4 @@
-import { ensureSchema, query } from '../../../utils/db';
+import { ensureSchema, requireSchemaVersion, query } from '../../../utils/db';
 import { requireAdmin } from '../../../utils/jwt';
 import { DINING_LOCATIONS } from '../../../utils/diningLocations';
 
@@ -130,6 +130,8 @@ export default async function handler(req, res) {
   try {
     await requireAdmin(req);
     await ensureSchema();
+    // food_schedules and nutrition_facts_macros (db/migrations/0013)
+    await requireSchemaVersion(13);
 
     const now = new Date();
     const todayUtc = new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth(), now.getUTCDate()));
@@ -150,14 +152,25 @@ export default async function handler(req, res) {
     const limit = Math.max(5, Math.min(50, Number(req.query.limit) || 20));
 
     const { rows: snapshotRows } = await query(
-      `SELECT menu_date, name, calories, macros, dining_court, dining_court_code, station, meal_time
-       FROM menu_snapshots WHERE menu_date BETWEEN $1 AND $2`,
+      `SELECT t.menu_date, t.name, t.calories, COALESCE(t.macros, n.macros) AS macros,
+              t.dining_court, t.dining_court_code, t.station, t.meal_time
+       FROM menu_snapshots t
+       LEFT JOIN nutrition_facts_macros n ON n.id = t.nutrition_id
+       WHERE t.menu_date BETWEEN $1 AND $2`,
       [startStr, endStr]
     );
 
     const { rows: foodRows } = await query(
-      `SELECT name, calories, macros, dining_court, station, meal_time, next_available
-       FROM foods WHERE next_available IS NOT NULL`
+      `SELECT f.name, f.calories, COALESCE(f.macros, n.macros) AS macros,
+              f.dining_court, f.station, f.meal_time, s.next_available
+       FROM foods f
+       LEFT JOIN nutrition_facts_macros n ON n.id = f.nutrition_id
+       LEFT JOIN food_schedules s ON s.food_id = f.id
+       WHERE EXISTS (
+         SELECT 1 FROM food_appearances a
+         WHERE a.food_id = f.id AND a.date BETWEEN $1 AND $2
+       )`,
+      [startStr, endStr]
     );
 
     const locationMap = new Map();
@@ -1,4 +1,4 @@
-import { ensureSchema, query } from '../../utils/db';
+import { ensureSchema, requireSchemaVersion, query } from '../../utils/db';
 
 export default async function handler(req, res) {
   if (req.method !== 'GET') return res.status(405).json({ error: 'Method not allowed' });
@@ -8,28 +8,30 @@ export default async function handler(req, res) {
   
   try {
     await ensureSchema();
+    // menu_snapshot_rows (db/migrations/0010)
+    await requireSchemaVersion(10);
     const mealTime = (req.query.meal_time || '').trim();
     const date = (req.query.date || '').trim();
 
     let sql, params = [];
 
     if (date) {
-      // Date-specific: query menu_snapshots only
-      sql = `SELECT DISTINCT dining_court FROM menu_snapshots WHERE dining_court IS NOT NULL AND menu_date = $1`;
+      // Date-specific: query menu_snapshot_rows only
+      sql = `SELECT DISTINCT dining_court FROM menu_snapshot_rows WHERE dining_court IS NOT NULL AND menu_date = $1`;
       params = [date];
       if (mealTime) {
         params.push(mealTime.toLowerCase());
         sql += ` AND LOWER(meal_time) = $${params.length}`;
       }
     } else {
-      // No date: union foods + menu_snapshots so locations show even if one table is sparse
+      // No date: union foods + menu_snapshot_rows so locations show even if one table is sparse
       if (mealTime) {
         params = [mealTime.toLowerCase()];
         sql = `
           SELECT DISTINCT dining_court FROM (
             SELECT dining_court FROM foods WHERE dining_court IS NOT NULL AND LOWER(meal_time) = $1
             UNION ALL
-            SELECT dining_court FROM menu_snapshots WHERE dining_court IS NOT NULL AND LOWER(meal_time) = $1
+            SELECT dining_court FROM menu_snapshot_rows WHERE dining_court IS NOT NULL AND LOWER(meal_time) = $1
           ) combined
         `;
       } else {
@@ -37,7 +39,7 @@ export default async function handler(req, res) {
           SELECT DISTINCT dining_court FROM (
             SELECT dining_court FROM foods WHERE dining_court IS NOT NULL
             UNION ALL
-            SELECT dining_court FROM menu_snapshots WHERE dining_court IS NOT NULL
+            SELECT dining_court FROM menu_snapshot_rows WHERE dining_court IS NOT NULL
           ) combined
         `;
       }
@@ -48,6 +50,6 @@ export default async function handler(req, res) {
     const courts = rows.map(r => r.dining_court).filter(Boolean);
     return res.status(200).json(courts);
   } catch (err) {
-    return res.status(500).json({ error: 'Failed to fetch dining courts' });
+    return res.status(err.status || 500).json({ error: 'Failed to fetch dining courts' });
   }
 }
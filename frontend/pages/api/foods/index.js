@@ -1,4 +1,4 @@
-import { ensureSchema, query } from '../../../utils/db';
+import { ensureSchema, requireSchemaVersion, query } from '../../../utils/db';
 import { requireAdmin } from '../../../utils/jwt';
 
 export default async function handler(req, res) {
@@ -8,18 +8,23 @@ export default async function handler(req, res) {
 
     try {
       await ensureSchema();
+      // food_schedules and nutrition_facts_macros (db/migrations/0013)
+      await requireSchemaVersion(13);
       const { q, dining_court, meal_time, station, group, date } = req.query;
       const conditions = [];
       const params = [];
 
-      // When a date is provided, query menu_snapshots (date-specific menus)
+      // When a date is provided, query menu_snapshot_rows (date-specific menus plus
+      // shared retail menu templates expanded per location)
       // Otherwise fall back to the general foods catalog
       const useSnapshots = !!date;
-      const table = useSnapshots ? 'menu_snapshots' : 'foods';
+      const table = useSnapshots ? 'menu_snapshot_rows' : 'foods';
 
       if (useSnapshots) {
         params.push(date);
-        conditions.push(`(menu_date = $${params.length} OR source = 'retail')`);
+        // Retail menus live under the 2099-01-01 sentinel; keying both arms on menu_date lets
+        // Postgres prune to the requested month's partition plus the retail partition
+        conditions.push(`(menu_date = $${params.length} OR (menu_date = DATE '2099-01-01' AND source = 'retail'))`);
       }
 
       if (q) {
@@ -54,11 +59,16 @@ export default async function handler(req, res) {
 
       const where = conditions.length ? `WHERE ${conditions.join(' AND ')}` : '';
 
+      // macros are stored once in nutrition_facts; rows keep only a nutrition_id.
+      // Both lookups are joins, not per-row function calls.
       const selectCols = useSnapshots
-        ? 'id, name, calories, macros, dining_court, station, meal_time'
-        : 'id, name, calories, macros, dining_court, station, meal_time, next_available';
+        ? 't.id, t.name, t.calories, COALESCE(t.macros, n.macros) AS macros, t.dining_court, t.station, t.meal_time'
+        : 't.id, t.name, t.calories, COALESCE(t.macros, n.macros) AS macros, t.dining_court, t.station, t.meal_time, s.next_available';
+      const joins = useSnapshots
+        ? 'LEFT JOIN nutrition_facts_macros n ON n.id = t.nutrition_id'
+        : 'LEFT JOIN nutrition_facts_macros n ON n.id = t.nutrition_id LEFT JOIN food_schedules s ON s.food_id = t.id';
 
-      const sql = `SELECT ${selectCols} FROM ${table} ${where} ORDER BY dining_court, meal_time, station, name`;
+      const sql = `SELECT ${selectCols} FROM ${table} t ${joins} ${where} ORDER BY t.dining_court, t.meal_time, t.station, t.name`;
       const { rows } = await query(sql, params);
 
       if (group) {
@@ -84,7 +94,7 @@ export default async function handler(req, res) {
         meal_time: r.meal_time, ...(r.next_available != null && { next_available: r.next_available }),
       })));
     } catch (err) {
-      return res.status(500).json({ error: 'Failed to fetch foods', detail: err.message });
+      return res.status(err.status || 500).json({ error: 'Failed to fetch foods', detail: err.message });
     }
   }
 
@@ -92,17 +102,23 @@ export default async function handler(req, res) {
     try {
       await requireAdmin(req);
       await ensureSchema();
+      // unique foods.match_key (db/migrations/0008) and nutrition_macros()
+      await requireSchemaVersion(8);
       const body = req.body || {};
       const { name, calories, macros, dining_court, station, meal_time } = body;
       if (!name || calories == null || !macros) {
         return res.status(400).json({ error: 'Missing required fields' });
       }
       const result = await query(
-        `INSERT INTO foods (name, calories, macros, dining_court, station, meal_time) VALUES ($1,$2,$3,$4,$5,$6) RETURNING id, name, calories, macros, dining_court, station, meal_time`,
+        `INSERT INTO foods (name, calories, macros, dining_court, station, meal_time) VALUES ($1,$2,$3,$4,$5,$6) RETURNING id, name, calories, COALESCE(macros, nutrition_macros(nutrition_id)) AS macros, dining_court, station, meal_time`,
         [String(name).trim(), Number(calories), macros, dining_court || null, station || null, meal_time || null]
       );
       return res.status(201).json({ message: 'Food added successfully!', food: result.rows[0] });
     } catch (err) {
+      // foods.match_key is unique: same court, name, meal and station after normalization
+      if (err.code === '23505') {
+        return res.status(409).json({ error: 'A food with this name, dining court, meal and station already exists' });
+      }
       const status = err.status || 500;
       return res.status(status).json({ error: err.message || 'Failed to add food' });
     }
@@ -97,83 +97,38 @@ export async function query(text, params) {
   }
 }
 
+// Highest db/migrations version seen in this serverless instance
+let schemaVersion = 0;
+
+// Routes that read objects created by db/migrations call this with the
+// version that created them, so a database that is behind fails only those
+// routes (503) instead of every route.
+export async function requireSchemaVersion(required) {
+  if (schemaVersion >= required) return;
+
+  const { rows } = await query(`SELECT to_regclass('schema_version') IS NOT NULL AS present`);
+  if (rows[0]?.present) {
+    const result = await query(`SELECT COALESCE(MAX(version), 0) AS version FROM schema_version`);
+    schemaVersion = Number(result.rows[0]?.version) || 0;
+  }
+  if (schemaVersion >= required) return;
+
+  const err = new Error(
+    `Database schema is at version ${schemaVersion}, but this route needs version ${required}. `
+    + 'Run `python backend/init_db.py` (or any scraper) to apply db/migrations.'
+  );
+  err.status = 503;
+  err.code = 'DB_SCHEMA_OUTDATED';
+  throw err;
+}
+
 export async function ensureSchema() {
   // Skip if already initialized in this serverless instance
   if (schemaInitialized) return;
   
   try {
-    // Create tables if they don't exist
-    await query(`
-    CREATE TABLE IF NOT EXISTS foods (
-      id SERIAL PRIMARY KEY,
-      name VARCHAR(255) NOT NULL,
-      calories INT NOT NULL,
-      macros JSONB NOT NULL,
-      dining_court VARCHAR(100),
-      station VARCHAR(255),
-      meal_time VARCHAR(50),
-      next_available JSONB,
-      created_at TIMESTAMPTZ DEFAULT NOW(),
-      updated_at TIMESTAMPTZ DEFAULT NOW()
-    );
-  `);
-
-  // Add columns missing from older deployments
-  await query(`
-    DO $$
-    BEGIN
-      IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name='foods' AND column_name='next_available') THEN
-        ALTER TABLE foods ADD COLUMN next_available JSONB;
-      END IF;
-      IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name='foods' AND column_name='updated_at') THEN
-        ALTER TABLE foods ADD COLUMN updated_at TIMESTAMPTZ DEFAULT NOW();
-      END IF;
-    END $$;
-  `);
-
-  // Useful indexes
-  await query(`CREATE INDEX IF NOT EXISTS idx_foods_dining_meal ON foods(dining_court, meal_time);`);
-  await query(`CREATE INDEX IF NOT EXISTS idx_foods_next_available ON foods USING GIN (next_available);`);
-
-  await query(`
-    CREATE TABLE IF NOT EXISTS menu_snapshots (
-      id SERIAL PRIMARY KEY,
-      menu_date DATE NOT NULL,
-      name VARCHAR(255) NOT NULL,
-      calories INT NOT NULL,
-      macros JSONB NOT NULL,
-      dining_court VARCHAR(100) NOT NULL,
-      dining_court_code VARCHAR(10),
-      station VARCHAR(255),
-      meal_time VARCHAR(50),
-      source VARCHAR(20) DEFAULT 'api',
-      created_at TIMESTAMPTZ DEFAULT NOW(),
-      updated_at TIMESTAMPTZ DEFAULT NOW()
-    );
-  `);
-
-  await query(`
-    DO $$
-    BEGIN
-      IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name='menu_snapshots' AND column_name='dining_court_code') THEN
-        ALTER TABLE menu_snapshots ADD COLUMN dining_court_code VARCHAR(10);
-      END IF;
-      IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name='menu_snapshots' AND column_name='source') THEN
-        ALTER TABLE menu_snapshots ADD COLUMN source VARCHAR(20) DEFAULT 'api';
-      END IF;
-      IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name='menu_snapshots' AND column_name='updated_at') THEN
-        ALTER TABLE menu_snapshots ADD COLUMN updated_at TIMESTAMPTZ DEFAULT NOW();
-      END IF;
-    END $$;
-  `);
-
-  await query(`CREATE INDEX IF NOT EXISTS idx_menu_snapshots_date ON menu_snapshots(menu_date);`);
-  await query(`CREATE INDEX IF NOT EXISTS idx_menu_snapshots_court ON menu_snapshots(dining_court);`);
-  await query(`CREATE UNIQUE INDEX IF NOT EXISTS idx_menu_snapshots_unique ON menu_snapshots(menu_date, dining_court, meal_time, station, name);`);
-
-  // Prune snapshots older than 7 days to keep the table small
-  await query(`DELETE FROM menu_snapshots WHERE menu_date < CURRENT_DATE - INTERVAL '7 days'`);
-
+    // The scraper tables (foods, menu_snapshots, ...) belong to db/migrations;
+    // routes that read them check the version with requireSchemaVersion()
   await query(`
     CREATE TABLE IF NOT EXISTS activities (
       id SERIAL PRIMARY KEY,
@@ -245,6 +200,30 @@ export async function ensureSchema() {
   }
 }
 
+// Retire old menu snapshots. On databases migrated to monthly partitions
+// (db/migrations/0005) whole past months are detached and compacted into
+// menu_snapshot_history; older schemas fall back to deleting rows.
+export async function pruneMenuSnapshots() {
+  const keepDaysRaw = Number.parseInt(process.env.SNAPSHOT_RETENTION_DAYS || '7', 10);
+  const keepDays = Number.isFinite(keepDaysRaw) && keepDaysRaw > 0 ? keepDaysRaw : 7;
+
+  try {
+    const { rows } = await query(
+      `SELECT row_count FROM retire_menu_snapshot_partitions($1, TRUE, FALSE)`,
+      [keepDays]
+    );
+    return rows.reduce((total, r) => total + (Number(r.row_count) || 0), 0);
+  } catch (err) {
+    // 42883 = undefined_function: partitioning migration not applied yet
+    if (err.code !== '42883') throw err;
+    const result = await query(
+      `DELETE FROM menu_snapshots WHERE menu_date < CURRENT_DATE - ($1::int * INTERVAL '1 day')`,
+      [keepDays]
+    );
+    return result.rowCount || 0;
+  }
+}
+
 export async function getDatabaseCapacityStatus() {
   const maxBytes =
     parseBytesEnv(process.env.DB_CAPACITY_BYTES)
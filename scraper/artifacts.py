@@ -0,0 +1,106 @@
+"""
+Scrape artifacts: the output of a scrape run written to disk instead of the database.
+
+An artifact is a gzip-compressed NDJSON file. The first line is a meta record and
+every following line is either an item (a unique food with its next_appearances
+schedule, destined for the foods table) or a snapshot (one per-date menu row,
+destined for menu_snapshots):
+
+    {"type": "meta", "format_version": 1, "created_at": "...", "items": 812, "snapshots": 9120, ...}
+    {"type": "item", "data": {...}}
+    {"type": "snapshot", "data": {...}}
+
+scripts/ingest_artifacts.py loads one or more artifacts into the database, so a
+scrape and its database write can be retried, replayed and timed separately.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+
+ARTIFACT_FORMAT_VERSION = 1
+
+
+def write_artifact(path, items, snapshots, **meta):
+    """
+    Write scraped items and snapshots to a gzip NDJSON artifact.
+
+    The file is written next to its destination and renamed into place, so a
+    crashed run never leaves a truncated artifact behind.
+
+    Args:
+        path: Destination file (conventionally *.ndjson.gz)
+        items: Unique items with schedule information
+        snapshots: Per-date snapshot items
+        **meta: Extra fields stored in the meta record (e.g. start_date, days)
+
+    Returns:
+        The meta record that was written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    header = {
+        'type': 'meta',
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'items': len(items),
+        'snapshots': len(snapshots),
+    }
+    header.update(meta)
+
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps(header) + '\n')
+        for item in items:
+            f.write(json.dumps({'type': 'item', 'data': item}) + '\n')
+        for snapshot in snapshots:
+            # Schedules belong to foods; snapshots only need the per-date row
+            row = {k: v for k, v in snapshot.items() if k != 'next_appearances'}
+            f.write(json.dumps({'type': 'snapshot', 'data': row}) + '\n')
+    os.replace(tmp_path, path)
+
+    print(f"Wrote artifact {path}: {len(items)} items, {len(snapshots)} snapshots")
+    return header
+
+
+def read_artifact(path):
+    """
+    Read an artifact written by write_artifact.
+
+    Returns:
+        (meta, items, snapshots)
+
+    Raises:
+        ValueError: If the file is not an artifact or uses another format version
+    """
+    meta = None
+    items = []
+    snapshots = []
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            kind = record.get('type')
+
+            if meta is None:
+                if kind != 'meta':
+                    raise ValueError(f"{path}: first record is not a meta record")
+                if record.get('format_version') != ARTIFACT_FORMAT_VERSION:
+                    raise ValueError(f"{path}: unsupported artifact format {record.get('format_version')}")
+                meta = record
+            elif kind == 'item':
+                items.append(record['data'])
+            elif kind == 'snapshot':
+                snapshots.append(record['data'])
+            else:
+                raise ValueError(f"{path}:{line_no}: unknown record type {kind!r}")
+
+    if meta is None:
+        raise ValueError(f"{path}: empty artifact")
+
+    return meta, items, snapshots
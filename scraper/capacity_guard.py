@@ -0,0 +1,246 @@
+"""
+Database capacity guard shared by the scrape and sync scripts.
+
+Scraping pauses once the database reaches DB_PAUSE_THRESHOLD_PERCENT of its
+plan limit (DB_CAPACITY_BYTES, or DATABASE_CAPACITY_BYTES/POSTGRES_MAX_BYTES).
+pg_database_size() walks every relation file, so a CapacityGuard measures it
+once and keeps a running estimate afterwards: each check adds the pending
+write's size (rows x DB_GUARD_ROW_BYTES) to the last measurement. The real size
+is measured again only after DB_GUARD_REMEASURE_BYTES of estimated growth, or
+when the estimate says the write would cross the threshold, so the guard never
+pauses a run on an estimate alone.
+
+    guard = CapacityGuard.from_env(database_url=database_url)
+    guard.check('before scrape')
+    guard.check('before database write', pending_rows=len(items))
+    guard.report()
+
+report() measures once more at the end of the run and projects how many more
+runs of the same size fit before the threshold is reached.
+"""
+
+import os
+
+DEFAULT_THRESHOLD_PERCENT = 95.0
+# Rough on-disk cost of one foods/menu_snapshots row including its index entries
+DEFAULT_ROW_BYTES = 1024
+DEFAULT_REMEASURE_BYTES = 8 * 1024 * 1024
+
+
+def parse_bytes_env(name):
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        n = int(value)
+        return n if n > 0 else None
+    except ValueError:
+        return None
+
+
+def strict_capacity_mode():
+    raw = (os.getenv('DB_CAPACITY_STRICT', 'true') or '').strip().lower()
+    return raw not in ('0', 'false', 'no', 'off')
+
+
+def threshold_percent_from_env():
+    """DB_PAUSE_THRESHOLD_PERCENT, falling back to 95 when unset or outside (0, 100]."""
+    try:
+        threshold_percent = float(os.getenv('DB_PAUSE_THRESHOLD_PERCENT', DEFAULT_THRESHOLD_PERCENT))
+    except ValueError:
+        threshold_percent = DEFAULT_THRESHOLD_PERCENT
+    if threshold_percent <= 0 or threshold_percent > 100:
+        threshold_percent = DEFAULT_THRESHOLD_PERCENT
+    return threshold_percent
+
+
+def format_bytes(n):
+    """Human-readable byte count (e.g. '12.3 MiB')."""
+    value = float(n)
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if abs(value) < 1024 or unit == 'GiB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+class CapacityGuard:
+    """
+    Cached capacity check for one database.
+
+    Pass either an open psycopg2 connection (conn) or a database_url; with a
+    URL, measurements borrow a pooled connection from scraper.db. error_class
+    is what check() raises when the threshold is reached, so scripts that
+    exit on a full database can pass SystemExit.
+    """
+
+    def __init__(self, max_bytes, threshold_percent=DEFAULT_THRESHOLD_PERCENT, conn=None, database_url=None,
+                 strict=True, row_bytes=DEFAULT_ROW_BYTES, remeasure_bytes=DEFAULT_REMEASURE_BYTES,
+                 error_class=RuntimeError, log=print):
+        self.max_bytes = max_bytes
+        self.threshold_percent = threshold_percent
+        self.conn = conn
+        self.database_url = database_url
+        self.strict = strict
+        self.row_bytes = max(1, row_bytes)
+        self.remeasure_bytes = max(0, remeasure_bytes)
+        self.error_class = error_class
+        self.log = log
+
+        self.used_bytes = None        # last pg_database_size() result
+        self.estimated_growth = 0     # estimated bytes written since that measurement
+        self.measurements = 0
+        self._first_used = None
+        self._warned_unconfigured = False
+
+    @classmethod
+    def from_env(cls, conn=None, database_url=None, error_class=RuntimeError, log=print):
+        """
+        Build a guard from DB_CAPACITY_BYTES (or DATABASE_CAPACITY_BYTES/
+        POSTGRES_MAX_BYTES), DB_PAUSE_THRESHOLD_PERCENT, DB_CAPACITY_STRICT,
+        DB_GUARD_ROW_BYTES and DB_GUARD_REMEASURE_BYTES.
+        """
+        max_bytes = (
+            parse_bytes_env('DB_CAPACITY_BYTES')
+            or parse_bytes_env('DATABASE_CAPACITY_BYTES')
+            or parse_bytes_env('POSTGRES_MAX_BYTES')
+        )
+        remeasure_bytes = os.getenv('DB_GUARD_REMEASURE_BYTES')
+        return cls(
+            max_bytes,
+            threshold_percent_from_env(),
+            conn=conn,
+            database_url=database_url,
+            strict=strict_capacity_mode(),
+            row_bytes=parse_bytes_env('DB_GUARD_ROW_BYTES') or DEFAULT_ROW_BYTES,
+            # 0 is allowed here and means "measure on every check"
+            remeasure_bytes=int(remeasure_bytes) if (remeasure_bytes or '').isdigit() else DEFAULT_REMEASURE_BYTES,
+            error_class=error_class,
+            log=log,
+        )
+
+    @property
+    def threshold_bytes(self):
+        return self.max_bytes * self.threshold_percent / 100.0
+
+    def _query_size(self):
+        if self.conn is not None:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT pg_database_size(current_database())')
+            used_bytes = int(cursor.fetchone()[0])
+            cursor.close()
+            return used_bytes
+
+        from scraper.db import connection
+
+        with connection(self.database_url) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT pg_database_size(current_database())')
+            used_bytes = int(cursor.fetchone()[0])
+            cursor.close()
+        return used_bytes
+
+    def measure(self):
+        """Query the real database size and reset the running estimate. Returns the size in bytes."""
+        self.used_bytes = self._query_size()
+        self.estimated_growth = 0
+        self.measurements += 1
+        if self._first_used is None:
+            self._first_used = self.used_bytes
+        return self.used_bytes
+
+    def record(self, rows=0, nbytes=0):
+        """Add writes that were not announced to check() beforehand to the running estimate."""
+        self.estimated_growth += rows * self.row_bytes + nbytes
+
+    def check(self, stage, pending_rows=0, pending_bytes=0):
+        """
+        Raise error_class if the database is, or after the pending write would
+        be, at or above the pause threshold.
+
+        Args:
+            stage: Label for the log line
+            pending_rows: Rows the caller is about to write
+            pending_bytes: Extra bytes the caller is about to write
+
+        Returns:
+            Estimated bytes in use after the pending write, or None when no
+            capacity limit is configured
+        """
+        if self.max_bytes is None:
+            if self.strict:
+                raise self.error_class(
+                    'DB capacity guard is strict and no capacity limit is configured. '
+                    'Set DB_CAPACITY_BYTES (or DATABASE_CAPACITY_BYTES/POSTGRES_MAX_BYTES).'
+                )
+            if not self._warned_unconfigured:
+                self.log('[db-guard] Capacity limit not configured; guard is running in non-strict mode.')
+                self._warned_unconfigured = True
+            return None
+
+        pending = pending_rows * self.row_bytes + pending_bytes
+        measured = False
+        if (
+            self.used_bytes is None
+            or self.estimated_growth >= self.remeasure_bytes
+            or self.used_bytes + self.estimated_growth + pending >= self.threshold_bytes
+        ):
+            self.measure()
+            measured = True
+
+        projected = self.used_bytes + self.estimated_growth + pending
+        projected_percent = (projected / self.max_bytes) * 100.0
+        source = 'measured' if measured else 'estimated'
+        self.log(
+            f"[db-guard] {stage}: using {projected_percent:.2f}% ({projected}/{self.max_bytes} bytes, {source}), "
+            f"threshold={self.threshold_percent:.2f}%"
+        )
+        if projected >= self.threshold_bytes:
+            raise self.error_class(
+                f"DB capacity guard triggered at {projected_percent:.2f}% "
+                f"(threshold {self.threshold_percent:.2f}%). Scraping paused."
+            )
+
+        self.record(pending_rows, pending_bytes)
+        return projected
+
+    def projection(self):
+        """
+        Project when the threshold will be reached if every run grows the database like this one.
+
+        Returns:
+            Dict with headroom_bytes, growth_bytes (estimated for this run so
+            far) and runs_left (runs of the same size before the threshold, or
+            None if nothing was written), or None when nothing was measured
+        """
+        if self.max_bytes is None or self.used_bytes is None:
+            return None
+
+        current = self.used_bytes + self.estimated_growth
+        headroom = max(0, int(self.threshold_bytes - current))
+        growth = max(0, current - self._first_used)
+        return {
+            'headroom_bytes': headroom,
+            'growth_bytes': growth,
+            'runs_left': int(headroom // growth) if growth > 0 else None,
+        }
+
+    def report(self):
+        """
+        Measure once more and log the projection from projection(), so it
+        reflects the run's real growth rather than the estimate.
+        """
+        if self.max_bytes is None or self.used_bytes is None:
+            return
+        try:
+            self.measure()
+        except Exception as e:
+            self.log(f"[db-guard] Could not measure database size for the projection: {e}")
+            return
+        projection = self.projection()
+        line = (
+            f"[db-guard] {format_bytes(projection['headroom_bytes'])} left before the "
+            f"{self.threshold_percent:.0f}% threshold; this run added {format_bytes(projection['growth_bytes'])}"
+        )
+        if projection['runs_left'] is not None:
+            line += f", so about {projection['runs_left']} more runs like it fit"
+        self.log(f"{line} ({self.measurements} size queries).")
@@ -0,0 +1,331 @@
+"""
+Registry of the chain restaurant catalogs, their rows and their bulk-load artifacts.
+
+The chain_scrapers getters return static item lists. CATALOGS lists every
+catalog with the locations that serve it; its module is the one chain_scrapers
+exports the getter from, imported and built on first use only. A catalog's
+content hash covers its declaration and its module's source, so it is computed
+without importing anything. retail_menu_scraper syncs the catalogs whose hash
+differs from the one recorded in chain_catalog_versions (or whose rows are no
+longer stored), and generate_chain_sql writes them to disk. Anything else that
+rewrites retail rows (db/retail_menu_seed.sql, load_artifacts) clears
+chain_catalog_versions so the next run syncs every catalog again.
+
+An artifact is one CSV file per location, in COPY ... WITH (FORMAT csv) layout
+with the columns in ARTIFACT_COLUMNS and no header. Text is always quoted and
+NULL is an unquoted empty field, so COPY keeps '' and NULL apart:
+
+    "2099-01-01","Chipotle Chicken Avocado Melt",890,"{""carbs"": 82, ...}","Panera","Sandwiches","Lunch","retail","4f1c..."
+
+load_artifacts() streams any number of them into the database with a single
+COPY and merges them like retail_menu_scraper does, so reloading an unchanged
+catalog rewrites nothing.
+"""
+
+import csv
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import re
+
+# Retail menus do not change by date; their rows live on this sentinel date
+RETAIL_MENU_DATE = '2099-01-01'
+
+STARBUCKS_LOCATIONS = ["Starbucks @ MSEE", "Starbucks @ Winifred Parker Hall"]
+
+_SCRAPERS_PACKAGE = f"{__package__}.chain_scrapers" if __package__ else 'chain_scrapers'
+_scrapers = importlib.import_module(_SCRAPERS_PACKAGE)
+
+ARTIFACT_COLUMNS = (
+    'menu_date', 'name', 'calories', 'macros', 'dining_court', 'station', 'meal_time', 'source', 'content_hash'
+)
+
+
+def menu_item_macros(item):
+    """Macros stored for a chain restaurant item."""
+    return {
+        'protein': item['protein'],
+        'carbs': item['carbs'],
+        'fats': item['fats']
+    }
+
+
+def beverage_item_macros(item):
+    """Full macros stored for a beverage item."""
+    return {
+        'protein': item['protein'],
+        'carbs': item['carbs'],
+        'fats': item['fats'],
+        'saturated_fat': item.get('saturated_fat', 0),
+        'cholesterol': item.get('cholesterol', 0),
+        'sodium': item.get('sodium', 0),
+        'fiber': item.get('fiber', 0),
+        'sugar': item.get('sugar', 0),
+        'added_sugar': item.get('added_sugar', 0),
+        'is_vegetarian': item.get('is_vegetarian', False),
+        'is_vegan': item.get('is_vegan', False),
+        'allergens': item.get('allergens', []),
+        'ingredients': item.get('ingredients', ''),
+        'serving_size': item.get('serving_size', ''),
+    }
+
+
+def content_hash(calories, macros):
+    """menu_snapshots.content_hash for a retail row: md5 of its calories and macros."""
+    return hashlib.md5(json.dumps([calories, macros], sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def catalog_rows(items, dining_court, build_macros=menu_item_macros):
+    """
+    Retail menu_snapshots rows for one location, in ARTIFACT_COLUMNS order.
+
+    Items repeating a (name, station, meal_time) key collapse to the last, as
+    they do in retail_menu_scraper.
+
+    Returns:
+        List of tuples; macros are dicts
+    """
+    rows = {}
+    for item in items:
+        macros = build_macros(item)
+        rows[(item['name'], item['station'], item['meal_time'])] = (
+            RETAIL_MENU_DATE, item['name'], item['calories'], macros, dining_court, item['station'],
+            item['meal_time'], 'retail', content_hash(item['calories'], macros)
+        )
+    return list(rows.values())
+
+
+class ChainCatalog:
+    """
+    One catalog of chain_scrapers items and the locations that serve it.
+
+    The module is imported and its items built on first use, then kept for the
+    rest of the process.
+    """
+
+    def __init__(self, name, getter, locations, build_macros=menu_item_macros, template=False):
+        """
+        Args:
+            name: Catalog name; for a template, menu_templates.name
+            getter: chain_scrapers export returning the items
+            locations: Location names, or the name of a chain_scrapers export
+                listing them
+            build_macros: Builds the stored macros for an item
+            template: Store the items once as a menu template linked to every
+                location, instead of once per location
+        """
+        self.name = name
+        self.getter = getter
+        self.module = _scrapers.submodule(getter)
+        self._locations = locations
+        self.build_macros = build_macros
+        self.template = template
+        self._items = None
+
+    def __repr__(self):
+        return f"ChainCatalog({self.name!r})"
+
+    def items(self):
+        """The catalog's items, built once per process."""
+        if self._items is None:
+            self._items = getattr(_scrapers, self.getter)()
+        return self._items
+
+    def locations(self):
+        """Names of the locations that serve the catalog."""
+        if isinstance(self._locations, str):
+            return list(getattr(_scrapers, self._locations))
+        return list(self._locations)
+
+    def rows(self, dining_court):
+        """Retail menu_snapshots rows for one of the catalog's locations."""
+        return catalog_rows(self.items(), dining_court, self.build_macros)
+
+    def content_hash(self):
+        """
+        md5 over the catalog's declaration and the source of the modules it reads.
+
+        Nothing is imported, so checking an unchanged catalog costs one file
+        read. Edits to code those modules import are not seen; sync with force
+        to pick them up.
+        """
+        modules = {self.module}
+        if isinstance(self._locations, str):
+            modules.add(_scrapers.submodule(self._locations))
+        sources = []
+        for module in sorted(modules):
+            spec = importlib.util.find_spec(f"{_SCRAPERS_PACKAGE}.{module}")
+            with open(spec.origin, 'rb') as f:
+                sources.append(hashlib.md5(f.read()).hexdigest())
+        payload = [self.getter, self._locations, self.template, inspect.getsource(self.build_macros), sources]
+        return hashlib.md5(json.dumps(payload).encode('utf-8')).hexdigest()
+
+
+CATALOGS = [
+    ChainCatalog('Panera', 'get_panera_items', ['Panera']),
+    ChainCatalog('Qdoba', 'get_qdoba_items', ['Qdoba']),
+    ChainCatalog("Jersey Mike's", 'get_jersey_mikes_items', ["Jersey Mike's"]),
+    ChainCatalog('Lawson On-the-GO!', 'get_lawson_beverage_items', ['Lawson On-the-GO!']),
+    # Menus served unchanged at several locations are stored once as templates
+    ChainCatalog('Starbucks', 'get_starbucks_items', STARBUCKS_LOCATIONS, template=True),
+    # Beverages at all dining courts
+    ChainCatalog('Dining court beverages', 'get_dining_court_beverage_items', 'DINING_COURTS',
+                 beverage_item_macros, template=True),
+    # Quick Bites locations (fountain drinks + water, no milk)
+    ChainCatalog('Quick Bites beverages', 'get_quick_bites_beverage_items', 'QUICK_BITES_LOCATIONS',
+                 beverage_item_macros, template=True),
+]
+
+
+def artifact_filename(dining_court):
+    """File name for a location's artifact, e.g. "Jersey Mike's" -> 'jersey-mike-s.csv'."""
+    return re.sub(r'[^a-z0-9]+', '-', dining_court.lower()).strip('-') + '.csv'
+
+
+def write_artifact(path, rows):
+    """
+    Write catalog rows to a CSV artifact.
+
+    The file is written next to its destination and renamed into place, so a
+    crashed run never leaves a truncated artifact behind.
+
+    Returns:
+        Number of rows written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+        for row in rows:
+            writer.writerow([
+                json.dumps(value, ensure_ascii=False, sort_keys=True) if isinstance(value, dict) else value
+                for value in row
+            ])
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+class _ConcatenatedFiles:
+    """Read several files as one stream, for a single copy_expert() call."""
+
+    def __init__(self, paths):
+        self._paths = iter(paths)
+        self._current = None
+
+    def read(self, size=-1):
+        while True:
+            if self._current is None:
+                path = next(self._paths, None)
+                if path is None:
+                    return ''
+                self._current = open(path, 'r', encoding='utf-8', newline='')
+            data = self._current.read(size)
+            if data:
+                return data
+            self._current.close()
+            self._current = None
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+
+def load_artifacts(cursor, paths):
+    """
+    Load catalog artifacts into menu_snapshots.
+
+    All files go to a temp table in one COPY. Rows repeating an item of a menu
+    template linked to the same location are set aside, since
+    menu_snapshot_rows already returns those. Each location then ends up with
+    exactly the remaining rows of its artifact: stored retail rows missing from
+    them are deleted, and rows are inserted or rewritten only where
+    content_hash differs. A key repeated across the files keeps its last row,
+    in the order the paths are given. If any row changed, the catalog versions
+    recorded in chain_catalog_versions are cleared.
+
+    Args:
+        cursor: Cursor in the caller's transaction
+        paths: Artifact files
+
+    Returns:
+        (rows staged, rows written, stale rows deleted, rows served by a template)
+    """
+    cursor.execute("""
+        CREATE TEMP TABLE chain_catalog_stage (
+            menu_date DATE,
+            name VARCHAR(255),
+            calories INT,
+            macros JSONB,
+            dining_court VARCHAR(100),
+            station VARCHAR(255),
+            meal_time VARCHAR(50),
+            source VARCHAR(20),
+            content_hash CHAR(32),
+            seq BIGSERIAL
+        ) ON COMMIT DROP
+    """)
+    stream = _ConcatenatedFiles(paths)
+    try:
+        cursor.copy_expert(
+            f"COPY chain_catalog_stage ({', '.join(ARTIFACT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", stream
+        )
+    finally:
+        stream.close()
+    staged = cursor.rowcount
+    cursor.execute("SELECT array_agg(DISTINCT dining_court) FROM chain_catalog_stage")
+    locations = cursor.fetchone()[0] or []
+
+    # Items a linked template already serves at the location are not stored again
+    cursor.execute("""
+        DELETE FROM chain_catalog_stage c
+        USING menu_template_items i
+        JOIN menu_template_locations l ON l.template_id = i.template_id
+        WHERE c.dining_court = l.dining_court AND c.name = i.name
+          AND c.station IS NOT DISTINCT FROM i.station
+          AND c.meal_time IS NOT DISTINCT FROM i.meal_time
+    """)
+    templated = cursor.rowcount
+
+    cursor.execute("""
+        DELETE FROM menu_snapshots s
+        WHERE s.menu_date = %s AND s.source = 'retail' AND s.dining_court = ANY(%s)
+          AND NOT EXISTS (
+              SELECT 1 FROM chain_catalog_stage c
+              WHERE c.dining_court = s.dining_court AND c.name = s.name
+                AND c.station IS NOT DISTINCT FROM s.station
+                AND c.meal_time IS NOT DISTINCT FROM s.meal_time
+          )
+    """, (RETAIL_MENU_DATE, locations))
+    deleted = cursor.rowcount
+
+    cursor.execute(f"""
+        INSERT INTO menu_snapshots ({', '.join(ARTIFACT_COLUMNS)})
+        SELECT DISTINCT ON (dining_court, meal_time, station, name) {', '.join(ARTIFACT_COLUMNS)}
+        FROM chain_catalog_stage
+        ORDER BY dining_court, meal_time, station, name, seq DESC
+        ON CONFLICT (menu_date, dining_court, meal_time, station, name)
+        DO UPDATE SET
+            calories = EXCLUDED.calories,
+            macros = EXCLUDED.macros,
+            nutrition_id = EXCLUDED.nutrition_id,
+            source = EXCLUDED.source,
+            content_hash = EXCLUDED.content_hash,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE menu_snapshots.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    """)
+    written = cursor.rowcount
+
+    # The rows no longer match the recorded catalog hashes; the next
+    # retail_menu_scraper run syncs every catalog again
+    if written or deleted:
+        cursor.execute("DELETE FROM chain_catalog_versions")
+
+    cursor.execute("DROP TABLE chain_catalog_stage")
+    return staged, written, deleted, templated
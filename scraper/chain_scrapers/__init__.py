@@ -1,25 +1,41 @@
-"""Chain restaurant scrapers for common items at Purdue Food Co locations."""
-
-from .panera import get_panera_items
-from .qdoba import get_qdoba_items
-from .jersey_mikes import get_jersey_mikes_items
-from .starbucks import get_starbucks_items
-from .dining_court_beverages import (
-    get_dining_court_beverage_items,
-    get_quick_bites_beverage_items,
-    DINING_COURTS,
-    QUICK_BITES_LOCATIONS,
-)
-from .lawson_beverages import get_lawson_beverage_items
-
-__all__ = [
-    'get_panera_items',
-    'get_qdoba_items',
-    'get_jersey_mikes_items',
-    'get_starbucks_items',
-    'get_dining_court_beverage_items',
-    'get_quick_bites_beverage_items',
-    'get_lawson_beverage_items',
-    'DINING_COURTS',
-    'QUICK_BITES_LOCATIONS',
-]
+"""Chain restaurant scrapers for common items at Purdue Food Co locations.
+
+Submodules are imported on first use of one of their names, so importing the
+package (or one chain) does not load every chain's item lists.
+"""
+
+import importlib
+
+# Exported name -> submodule defining it; scraper/chain_catalog.py finds each
+# catalog's module here
+_EXPORTS = {
+    'get_panera_items': 'panera',
+    'get_qdoba_items': 'qdoba',
+    'get_jersey_mikes_items': 'jersey_mikes',
+    'get_starbucks_items': 'starbucks',
+    'get_dining_court_beverage_items': 'dining_court_beverages',
+    'get_quick_bites_beverage_items': 'dining_court_beverages',
+    'DINING_COURTS': 'dining_court_beverages',
+    'QUICK_BITES_LOCATIONS': 'dining_court_beverages',
+    'get_lawson_beverage_items': 'lawson_beverages',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def submodule(name):
+    """Name of the submodule defining an exported name, without importing it."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return module
+
+
+def __getattr__(name):
+    value = getattr(importlib.import_module(f'.{submodule(name)}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
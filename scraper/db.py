@@ -0,0 +1,206 @@
+"""
+Shared Postgres connections for the scraper.
+
+Every DB-touching function in a scrape run borrows connections from one small
+pool per database URL, so the run pays for the SSL handshake once rather than
+on every call.
+
+transaction() is re-entrant per thread: a nested transaction() (or
+connection()) for the same database reuses the outer connection and leaves the
+commit to the outermost block. Several write functions can therefore share one
+atomic transaction:
+
+    with transaction(database_url):
+        save_to_database(items, database_url)
+        save_menu_snapshots(snapshots, database_url)
+
+The write functions catch and print their own errors, so a failure inside a
+nested block is recorded. The outermost block then rolls back and raises
+TransactionFailed, even if the original exception was swallowed on the way out.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+import psycopg2
+
+DEFAULT_POOL_SIZE = 8
+
+_pools = {}
+_pools_lock = threading.Lock()
+_local = threading.local()
+
+
+class TransactionFailed(RuntimeError):
+    """Raised by the outermost transaction() when a nested block failed and everything was rolled back."""
+
+
+def resolve_database_url(database_url=None):
+    """DATABASE_URL fallback plus the postgres:// -> postgresql:// rewrite. Returns None if unset."""
+    if not database_url:
+        database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        return None
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+    return database_url
+
+
+def _pool_size():
+    try:
+        return max(1, int(os.getenv('DB_POOL_SIZE', DEFAULT_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+class _Pool:
+    """
+    Lazily opened connections for one database, at most size of them at a time.
+
+    Callers wait for a free connection instead of failing when all are in use.
+    Idle connections are kept for reuse until close_all().
+    """
+
+    def __init__(self, database_url, size):
+        self.database_url = database_url
+        self.idle = []
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(size)
+
+    def getconn(self):
+        self.slots.acquire()
+        try:
+            with self.lock:
+                if self.idle:
+                    return self.idle.pop()
+            return psycopg2.connect(self.database_url)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def putconn(self, conn, close=False):
+        try:
+            if close or conn.closed:
+                conn.close()
+            else:
+                with self.lock:
+                    self.idle.append(conn)
+        finally:
+            self.slots.release()
+
+    def closeall(self):
+        with self.lock:
+            for conn in self.idle:
+                conn.close()
+            self.idle = []
+
+
+def _get_pool(database_url):
+    with _pools_lock:
+        pool = _pools.get(database_url)
+        if pool is None:
+            pool = _Pool(database_url, _pool_size())
+            _pools[database_url] = pool
+        return pool
+
+
+def _active():
+    """This thread's open transactions, keyed by database URL."""
+    if not hasattr(_local, 'active'):
+        _local.active = {}
+    return _local.active
+
+
+def _checkout(database_url):
+    pool = _get_pool(database_url)
+    conn = pool.getconn()
+    if conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    return pool, conn
+
+
+def _checkin(pool, conn):
+    # Broken connections are dropped instead of handed to the next caller
+    broken = bool(conn.closed) or conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+    if not broken and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+        conn.rollback()
+    pool.putconn(conn, close=broken)
+
+
+@contextmanager
+def transaction(database_url=None):
+    """
+    Run a block in one transaction on a pooled connection. Yields the connection.
+
+    Commits when the outermost block exits cleanly and rolls back otherwise.
+    Nested blocks on the same thread join the outer transaction.
+    """
+    database_url = resolve_database_url(database_url)
+    if not database_url:
+        raise RuntimeError('DATABASE_URL not set')
+
+    active = _active()
+    state = active.get(database_url)
+    if state is not None:
+        state['depth'] += 1
+        try:
+            yield state['conn']
+        except BaseException:
+            state['failed'] = True
+            raise
+        finally:
+            state['depth'] -= 1
+        return
+
+    pool, conn = _checkout(database_url)
+    state = {'conn': conn, 'depth': 1, 'failed': False}
+    active[database_url] = state
+    try:
+        yield conn
+        if state['failed']:
+            conn.rollback()
+            raise TransactionFailed('A nested database write failed; the transaction was rolled back')
+        conn.commit()
+    except BaseException:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        del active[database_url]
+        _checkin(pool, conn)
+
+
+@contextmanager
+def connection(database_url=None, shared=True):
+    """
+    Borrow a pooled connection for reads or self-managed commits. Yields the connection.
+
+    Inside a transaction() on the same thread this yields the transaction's
+    connection, and the caller must not commit or roll it back. Pass
+    shared=False to always get a separate connection (e.g. for DDL that must
+    commit on its own).
+    """
+    database_url = resolve_database_url(database_url)
+    if not database_url:
+        raise RuntimeError('DATABASE_URL not set')
+
+    state = _active().get(database_url) if shared else None
+    if state is not None:
+        yield state['conn']
+        return
+
+    pool, conn = _checkout(database_url)
+    try:
+        yield conn
+    finally:
+        _checkin(pool, conn)
+
+
+def close_all():
+    """Close every pooled connection (e.g. at the end of a script)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
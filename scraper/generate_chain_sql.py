@@ -1,162 +1,91 @@
-"""Generate SQL INSERT statements from chain restaurant scrapers."""
+"""
+Write the chain restaurant catalog as bulk-load artifacts, or as SQL.
 
+By default one CSV artifact per location is written to --out-dir (see
+scraper/chain_catalog.py); scripts/load_chain_catalog.py streams them into
+menu_snapshots with COPY. --sql prints INSERT statements instead, for
+hand-maintained seed files such as db/retail_menu_seed.sql; template catalogs
+are left out, since retail_menu_scraper stores them once as menu templates.
+
+Usage:
+    python scraper/generate_chain_sql.py [--out-dir DIR]
+    python scraper/generate_chain_sql.py --sql > chain.sql
+"""
+
+import argparse
 import json
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-from chain_scrapers import (
-    get_panera_items,
-    get_qdoba_items,
-    get_jersey_mikes_items,
-    get_starbucks_items,
-    get_dining_court_beverage_items,
-    get_quick_bites_beverage_items,
-    get_lawson_beverage_items,
-    DINING_COURTS,
-    QUICK_BITES_LOCATIONS,
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.chain_catalog import (
+    ARTIFACT_COLUMNS,
+    CATALOGS,
+    artifact_filename,
+    write_artifact,
 )
 
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.artifacts',
+                               'chain_catalog')
+
+
+def write_catalog_artifacts(out_dir=DEFAULT_OUT_DIR):
+    """
+    Write one CSV artifact per location.
+
+    Returns:
+        List of artifact paths
+    """
+    paths = []
+    for catalog in CATALOGS:
+        for dining_court in catalog.locations():
+            path = os.path.join(out_dir, artifact_filename(dining_court))
+            count = write_artifact(path, catalog.rows(dining_court))
+            print(f"{dining_court}: {count} rows -> {path}")
+            paths.append(path)
+    return paths
+
 
-def generate_sql_insert(item, dining_court):
-    """Generate a single SQL INSERT statement for a menu item."""
-    name = item['name'].replace("'", "''")  # Escape single quotes
-    calories = item['calories']
-    protein = item['protein']
-    carbs = item['carbs']
-    fats = item['fats']
-    station = item['station']
-    meal_time = item['meal_time']
-
-    macros = f'{{"protein":{protein},"carbs":{carbs},"fats":{fats}}}'
-
-    return (f"('2099-01-01', '{name}', {calories}, '{macros}', "
-            f"'{dining_court}', '{station}', '{meal_time}', 'retail')")
-
-
-def generate_beverage_sql_insert(item, dining_court):
-    """Generate a SQL INSERT with full nutrition macros for a beverage."""
-    name = item['name'].replace("'", "''")
-    calories = item['calories']
-    station = item['station']
-    meal_time = item['meal_time']
-
-    macros = json.dumps({
-        "protein": item["protein"],
-        "carbs": item["carbs"],
-        "fats": item["fats"],
-        "saturated_fat": item.get("saturated_fat", 0),
-        "cholesterol": item.get("cholesterol", 0),
-        "sodium": item.get("sodium", 0),
-        "fiber": item.get("fiber", 0),
-        "sugar": item.get("sugar", 0),
-        "added_sugar": item.get("added_sugar", 0),
-        "is_vegetarian": item.get("is_vegetarian", False),
-        "is_vegan": item.get("is_vegan", False),
-        "allergens": item.get("allergens", []),
-        "ingredients": item.get("ingredients", ""),
-        "serving_size": item.get("serving_size", "16 oz"),
-    }, ensure_ascii=False).replace("'", "''")
-
-    return (f"('2099-01-01', '{name}', {calories}, '{macros}', "
-            f"'{dining_court}', '{station}', '{meal_time}', 'retail')")
+def _sql_literal(value):
+    """Quote one value for an SQL VALUES list."""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, dict):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return "'" + str(value).replace("'", "''") + "'"
 
 
 def generate_chain_sql():
-    """Generate SQL for all chain restaurants."""
-    
-    # Panera
-    print("-- ============================================================================")
-    print("-- PANERA BREAD")
-    print("-- Source: Panera nutrition data (panerabread.com)")
-    print("-- ============================================================================\n")
-    
-    panera_items = get_panera_items()
-    print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-    sql_lines = [generate_sql_insert(item, 'Panera') for item in panera_items]
-    print(",\n".join(sql_lines) + ";\n")
-    
-    # Qdoba
-    print("-- ============================================================================")
-    print("-- QDOBA MEXICAN EATS")
-    print("-- Source: Qdoba nutrition calculator (qdoba.com/nutrition)")
-    print("-- ============================================================================\n")
-    
-    qdoba_items = get_qdoba_items()
-    print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-    sql_lines = [generate_sql_insert(item, 'Qdoba') for item in qdoba_items]
-    print(",\n".join(sql_lines) + ";\n")
-    
-    # Jersey Mike's
-    print("-- ============================================================================")
-    print("-- JERSEY MIKE'S SUBS")
-    print("-- Source: Jersey Mike's nutrition guide (jerseymikes.com/menu/nutrition)")
-    print("-- ============================================================================\n")
-    
-    jersey_items = get_jersey_mikes_items()
-    print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-    sql_lines = [generate_sql_insert(item, "Jersey Mike's") for item in jersey_items]
-    print(",\n".join(sql_lines) + ";\n")
-    
-    # Starbucks (both locations)
-    print("-- ============================================================================")
-    print("-- STARBUCKS @ MSEE")
-    print("-- Source: Starbucks nutrition data (starbucks.com/menu)")
-    print("-- ============================================================================\n")
-    
-    starbucks_items = get_starbucks_items()
-    print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-    sql_lines = [generate_sql_insert(item, 'Starbucks @ MSEE') for item in starbucks_items]
-    print(",\n".join(sql_lines) + ";\n")
-    
-    print("-- ============================================================================")
-    print("-- STARBUCKS @ WINIFRED PARKER HALL")
-    print("-- Source: Starbucks nutrition data (starbucks.com/menu)")
-    print("-- Same menu as MSEE location")
-    print("-- ============================================================================\n")
-    
-    print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-    sql_lines = [generate_sql_insert(item, 'Starbucks @ Winifred Parker Hall') for item in starbucks_items]
-    print(",\n".join(sql_lines) + ";\n")
-
-    # Dining Court Beverages (all five courts)
-    beverage_items = get_dining_court_beverage_items()
-    for court in DINING_COURTS:
-        print("-- ============================================================================")
-        print(f"-- {court.upper()} DINING COURT - BEVERAGES")
-        print("-- Source: Prairie Farms (milk), Coca-Cola (fountain drinks)")
-        print("-- Cup size: 8 oz standard dining hall cup")
-        print("-- ============================================================================\n")
-
-        print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-        sql_lines = [generate_beverage_sql_insert(item, court) for item in beverage_items]
-        print(",\n".join(sql_lines) + ";\n")
-
-    # Quick Bites Beverages (Coca-Cola fountain + water, same machine as dining courts)
-    quick_bites_items = get_quick_bites_beverage_items()
-    for location in QUICK_BITES_LOCATIONS:
-        label = location.upper()
-        print("-- ============================================================================")
-        print(f"-- {label} - BEVERAGES")
-        print("-- Source: Coca-Cola (fountain drinks)")
-        print("-- Cup size: 8 oz")
-        print("-- ============================================================================\n")
-
-        print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-        sql_lines = [generate_beverage_sql_insert(item, location) for item in quick_bites_items]
-        print(",\n".join(sql_lines) + ";\n")
-
-    # Lawson On-the-GO! Beverages (coffee kiosk)
-    print("-- ============================================================================")
-    print("-- LAWSON ON-THE-GO! - BEVERAGES")
-    print("-- Source: Standard coffee preparation / commercial ingredient labels")
-    print("-- ============================================================================\n")
-
-    lawson_items = get_lawson_beverage_items()
-    print("INSERT INTO menu_snapshots (menu_date, name, calories, macros, dining_court, station, meal_time, source) VALUES")
-    sql_lines = [generate_sql_insert(item, 'Lawson On-the-GO!') for item in lawson_items]
-    print(",\n".join(sql_lines) + ";\n")
+    """Print INSERT statements for the chain restaurants stored per location."""
+    for catalog in CATALOGS:
+        if catalog.template:
+            print(f"-- {catalog.name}: stored as a menu template by scraper/retail_menu_scraper.py\n")
+            continue
+        for dining_court in catalog.locations():
+            print("-- ============================================================================")
+            print(f"-- {dining_court.upper()}")
+            print(f"-- Catalog: {catalog.name} (scraper/chain_scrapers/{catalog.module}.py)")
+            print("-- ============================================================================\n")
+
+            print(f"INSERT INTO menu_snapshots ({', '.join(ARTIFACT_COLUMNS)}) VALUES")
+            sql_lines = [
+                '(' + ', '.join(_sql_literal(value) for value in row) + ')'
+                for row in catalog.rows(dining_court)
+            ]
+            print(",\n".join(sql_lines) + ";\n")
 
 
 if __name__ == "__main__":
-    generate_chain_sql()
+    parser = argparse.ArgumentParser(description='Write the chain restaurant catalog for bulk loading')
+    parser.add_argument('--out-dir', default=DEFAULT_OUT_DIR, help=f'Artifact directory (default: {DEFAULT_OUT_DIR})')
+    parser.add_argument('--sql', action='store_true', help='Print SQL INSERT statements to stdout instead')
+    args = parser.parse_args()
+
+    if args.sql:
+        generate_chain_sql()
+    else:
+        write_catalog_artifacts(args.out_dir)
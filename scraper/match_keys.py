@@ -0,0 +1,30 @@
+"""
+Normalized match keys for foods.
+
+foods.match_key (db/migrations/0008) is a generated column holding
+food_match_key(dining_court, name, meal_time, station), with a unique index.
+Writers look foods up by the key instead of comparing the raw columns, so
+"Mac-N-Cheese" at " Comfort " matches "Mac N Cheese" at "Comfort".
+
+The functions here build the same strings in Python as the SQL functions of
+the same names; keep the two in step.
+"""
+
+import re
+
+_NON_ALNUM = re.compile(r'[^A-Za-z0-9]+')
+
+
+def match_text(value):
+    """Keep ASCII letters and digits, lowercased; any other run of characters becomes one space."""
+    return _NON_ALNUM.sub(' ', value or '').lower().strip()
+
+
+def food_match_key(dining_court, name, meal_time, station):
+    """foods.match_key for a row; a missing meal_time or station counts as 'Unknown'."""
+    return '|'.join((
+        match_text(dining_court),
+        match_text(name),
+        match_text('Unknown' if meal_time is None else meal_time),
+        match_text('Unknown' if station is None else station),
+    ))
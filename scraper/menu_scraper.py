@@ -1,9 +1,11 @@
 import requests
 from bs4 import BeautifulSoup
-import psycopg2
+import hashlib
+import io
 import os
 import sys
 import re
+from contextlib import ExitStack
 from datetime import datetime
 import json
 import time
@@ -14,7 +16,38 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from scraper.artifacts import write_artifact
+from scraper.db import connection, resolve_database_url, transaction
+from scraper.migrations import ensure_schema
 from scraper.dining_locations import DINING_LOCATIONS
+from scraper.match_keys import food_match_key
+from scraper.nutrition_store import (
+    adopt_item_id,
+    default_store_path,
+    load_nutrition_store,
+    name_key,
+    RefreshPolicy,
+    lookup_nutrition,
+    remember_nutrition,
+    save_nutrition_store,
+)
+
+# HTTP client for all HFS API calls. scraper.replay swaps in a recording or
+# replaying session; anything with requests-style get/post works.
+_http = requests
+
+
+def set_http_client(client):
+    """
+    Route HFS API calls through another client and return the previous one.
+
+    A client with browser_fallback = False also disables the Selenium fallback,
+    so a run depends only on the responses the client returns.
+    """
+    global _http
+    previous = _http
+    _http = client
+    return previous
 
 
 def get_nutrition_cache(database_url=None):
@@ -24,31 +57,33 @@ def get_nutrition_cache(database_url=None):
     Returns:
         Dictionary mapping (name, dining_court) -> nutrition data
     """
-    if not database_url:
-        database_url = os.getenv('DATABASE_URL')
-    
+    database_url = resolve_database_url(database_url)
     if not database_url:
         return {}
     
-    # Convert postgres:// to postgresql://
-    if database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql://', 1)
-    
     cache = {}
     
     try:
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-        
-        # Fetch all existing food items
-        cursor.execute("""
-            SELECT name, dining_court, calories, macros
-            FROM foods
-        """)
+        with connection(database_url) as conn:
+            cursor = conn.cursor()
+            
+            # Fetch all existing food items
+            cursor.execute("""
+                SELECT f.name, f.dining_court, f.calories, COALESCE(f.macros, n.macros)
+                FROM foods f
+                LEFT JOIN nutrition_facts n ON n.id = f.nutrition_id
+            """)
+            rows = cursor.fetchall()
+            cursor.close()
         
-        for row in cursor.fetchall():
+        # foods.updated_at only moves when an item's content changes, so it
+        # says nothing about when its nutrition was last checked. Entries from
+        # the database count as fetched now; sampling refreshes them over time
+        # instead of a cold start re-fetching every item older than the TTL.
+        loaded_at = time.time()
+        for row in rows:
             name, dining_court, calories, macros = row
-            key = (name.lower().strip(), dining_court.lower().strip() if dining_court else '')
+            key = name_key(name, dining_court)
             
             macros_dict = macros if isinstance(macros, dict) else {}
             
@@ -68,11 +103,9 @@ def get_nutrition_cache(database_url=None):
                 'is_vegan': macros_dict.get('is_vegan', False),
                 'allergens': macros_dict.get('allergens', []),
                 'ingredients': macros_dict.get('ingredients', ''),
+                'fetched_at': loaded_at,
             }
         
-        cursor.close()
-        conn.close()
-        
         print(f"Loaded {len(cache)} items from nutrition cache")
         
     except Exception as e:
@@ -94,7 +127,7 @@ def fetch_item_nutrition(item_id, headers):
     """
     try:
         item_url = f"https://api.hfs.purdue.edu/menus/v2/items/{item_id}"
-        response = requests.get(item_url, headers=headers, timeout=10)
+        response = _http.get(item_url, headers=headers, timeout=10)
         response.raise_for_status()
 
         item_data = response.json()
@@ -212,7 +245,7 @@ def fetch_components_graphql(location_name, date_str, headers=None):
             "variables": {"name": location_name, "date": date_str}
         })
 
-        resp = requests.post(
+        resp = _http.post(
             GRAPHQL_URL,
             data=payload,
             headers={"Content-Type": "application/json", "Accept": "application/json"},
@@ -246,7 +279,8 @@ def fetch_components_graphql(location_name, date_str, headers=None):
 
 
 def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=None,
-                           display_name=None, court_code=None, available_date=None):
+                           display_name=None, court_code=None, available_date=None,
+                           refresh_policy=None):
     """
     Scrape Purdue dining menu using the API endpoint directly.
     Uses cached nutrition data when available.
@@ -255,6 +289,7 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
         dining_court: The dining court name
         date_str: Date in YYYY-MM-DD format (defaults to today)
         nutrition_cache: Dictionary of cached nutrition data (optional)
+        refresh_policy: RefreshPolicy choosing cached entries to re-fetch (optional)
     
     Returns:
         List of food items with nutrition info
@@ -281,7 +316,7 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
                 'Accept': 'application/json'
             }
             print(f"  Fetching from API: {api_url}")
-            response = requests.get(api_url, headers=headers, timeout=15)
+            response = _http.get(api_url, headers=headers, timeout=15)
             response.raise_for_status()
             candidate_data = response.json()
             meals = candidate_data.get('Meals', [])
@@ -345,6 +380,7 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
         items_needing_fetch = [i for i in items_to_fetch if i['nutrition_ready']]
         cached_count = 0
         fetched_count = 0
+        refreshed_count = 0
         
         print(f"  Processing {len(items_to_fetch)} items ({len(items_needing_fetch)} have nutrition)...")
         
@@ -378,12 +414,58 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
                     elif tag_name:
                         allergens.append(tag_name)
 
-            # Check cache first
-            cache_key = (item_info['name'].lower().strip(), item_info['dining_court'].lower().strip())
+            # Check cache first (by name and court, then by HFS item ID); cached
+            # entries that are stale or sampled for this run are re-fetched
+            cached_nutrition = lookup_nutrition(nutrition_cache, item_info['name'],
+                                                item_info['dining_court'], item_info['item_id'])
+            nutrition = None
+            if item_info['nutrition_ready'] and item_info['item_id'] and (
+                cached_nutrition is None
+                or (refresh_policy is not None and refresh_policy.claim(cached_nutrition, item_info['item_id']))
+            ):
+                nutrition = fetch_item_nutrition(item_info['item_id'], headers)
+                if nutrition and cached_nutrition is not None:
+                    refreshed_count += 1
+                elif nutrition:
+                    fetched_count += 1
 
-            if cache_key in nutrition_cache:
-                # Use cached data
-                cached_nutrition = nutrition_cache[cache_key]
+            if nutrition:
+                calories = nutrition.get('calories', 0)
+                protein = nutrition.get('protein', 0.0)
+                carbs = nutrition.get('carbs', 0.0)
+                fats = nutrition.get('fats', 0.0)
+                serving_size = nutrition.get('serving_size', '1 serving')
+                saturated_fat = nutrition.get('saturated_fat', 0.0)
+                cholesterol = nutrition.get('cholesterol', 0.0)
+                sodium = nutrition.get('sodium', 0.0)
+                fiber = nutrition.get('fiber', 0.0)
+                sugar = nutrition.get('sugar', 0.0)
+                added_sugar = nutrition.get('added_sugar', 0.0)
+                is_vegetarian = nutrition.get('is_vegetarian', is_vegetarian)
+                is_vegan = nutrition.get('is_vegan', is_vegan)
+                allergens = nutrition.get('allergens', allergens) or allergens
+                ingredients = nutrition.get('ingredients', '')
+
+                # Add to cache for this session
+                remember_nutrition(nutrition_cache, item_info['name'], item_info['dining_court'], {
+                    'calories': calories,
+                    'protein': protein,
+                    'carbs': carbs,
+                    'fats': fats,
+                    'serving_size': serving_size,
+                    'saturated_fat': saturated_fat,
+                    'cholesterol': cholesterol,
+                    'sodium': sodium,
+                    'fiber': fiber,
+                    'sugar': sugar,
+                    'added_sugar': added_sugar,
+                    'is_vegetarian': is_vegetarian,
+                    'is_vegan': is_vegan,
+                    'allergens': allergens,
+                    'ingredients': ingredients,
+                }, item_info['item_id'])
+            elif cached_nutrition is not None:
+                # Use cached data (also the fallback when a refresh fetch fails)
                 calories = cached_nutrition['calories']
                 protein = cached_nutrition['protein']
                 carbs = cached_nutrition['carbs']
@@ -399,46 +481,9 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
                 is_vegan = cached_nutrition.get('is_vegan', is_vegan)
                 allergens = cached_nutrition.get('allergens', allergens) or allergens
                 ingredients = cached_nutrition.get('ingredients', '')
+                adopt_item_id(nutrition_cache, item_info['name'], item_info['dining_court'], cached_nutrition,
+                              item_info['item_id'])
                 cached_count += 1
-            elif item_info['nutrition_ready'] and item_info['item_id']:
-                # Fetch from API
-                nutrition = fetch_item_nutrition(item_info['item_id'], headers)
-                if nutrition:
-                    calories = nutrition.get('calories', 0)
-                    protein = nutrition.get('protein', 0.0)
-                    carbs = nutrition.get('carbs', 0.0)
-                    fats = nutrition.get('fats', 0.0)
-                    serving_size = nutrition.get('serving_size', '1 serving')
-                    saturated_fat = nutrition.get('saturated_fat', 0.0)
-                    cholesterol = nutrition.get('cholesterol', 0.0)
-                    sodium = nutrition.get('sodium', 0.0)
-                    fiber = nutrition.get('fiber', 0.0)
-                    sugar = nutrition.get('sugar', 0.0)
-                    added_sugar = nutrition.get('added_sugar', 0.0)
-                    is_vegetarian = nutrition.get('is_vegetarian', is_vegetarian)
-                    is_vegan = nutrition.get('is_vegan', is_vegan)
-                    allergens = nutrition.get('allergens', allergens) or allergens
-                    ingredients = nutrition.get('ingredients', '')
-                    fetched_count += 1
-
-                    # Add to cache for this session
-                    nutrition_cache[cache_key] = {
-                        'calories': calories,
-                        'protein': protein,
-                        'carbs': carbs,
-                        'fats': fats,
-                        'serving_size': serving_size,
-                        'saturated_fat': saturated_fat,
-                        'cholesterol': cholesterol,
-                        'sodium': sodium,
-                        'fiber': fiber,
-                        'sugar': sugar,
-                        'added_sugar': added_sugar,
-                        'is_vegetarian': is_vegetarian,
-                        'is_vegan': is_vegan,
-                        'allergens': allergens,
-                        'ingredients': ingredients,
-                    }
 
             menu_items.append({
                 'name': item_info['name'],
@@ -464,8 +509,8 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
                 'available_date': available_date or date_str
             })
         
-        if cached_count > 0 or fetched_count > 0:
-            print(f"  Used cache: {cached_count}, Fetched new: {fetched_count}")
+        if cached_count > 0 or fetched_count > 0 or refreshed_count > 0:
+            print(f"  Used cache: {cached_count}, Fetched new: {fetched_count}, Refreshed: {refreshed_count}")
 
         # Fetch component data via GraphQL v3 API
         component_map = fetch_components_graphql(api_location, date_str, headers)
@@ -519,10 +564,47 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
 
                     if comp_item_id:
                         # Check nutrition cache
-                        comp_cache_key = (comp_name.lower().strip(),
-                                          (display_name or api_location).lower().strip())
-                        if comp_cache_key in nutrition_cache:
-                            cn = nutrition_cache[comp_cache_key]
+                        comp_court = display_name or api_location
+                        cn = lookup_nutrition(nutrition_cache, comp_name, comp_court, comp_item_id)
+                        nutrition = None
+                        if cn is None or (refresh_policy is not None and refresh_policy.claim(cn, comp_item_id)):
+                            nutrition = fetch_item_nutrition(comp_item_id, headers)
+                        if nutrition:
+                            comp_entry['calories'] = nutrition.get('calories', 0)
+                            comp_entry['protein'] = nutrition.get('protein', 0.0)
+                            comp_entry['carbs'] = nutrition.get('carbs', 0.0)
+                            comp_entry['fats'] = nutrition.get('fats', 0.0)
+                            comp_entry['saturated_fat'] = nutrition.get('saturated_fat', 0.0)
+                            comp_entry['cholesterol'] = nutrition.get('cholesterol', 0.0)
+                            comp_entry['sodium'] = nutrition.get('sodium', 0.0)
+                            comp_entry['fiber'] = nutrition.get('fiber', 0.0)
+                            comp_entry['sugar'] = nutrition.get('sugar', 0.0)
+                            comp_entry['added_sugar'] = nutrition.get('added_sugar', 0.0)
+                            comp_entry['serving_size'] = nutrition.get('serving_size', '1 serving')
+                            comp_entry['is_vegetarian'] = nutrition.get('is_vegetarian', comp_is_veg)
+                            comp_entry['is_vegan'] = nutrition.get('is_vegan', comp_is_vegan)
+                            comp_entry['allergens'] = nutrition.get('allergens', [])
+                            comp_entry['ingredients'] = nutrition.get('ingredients', '')
+                            # Cache for this session
+                            remember_nutrition(nutrition_cache, comp_name, comp_court, {
+                                'calories': comp_entry['calories'],
+                                'protein': comp_entry['protein'],
+                                'carbs': comp_entry['carbs'],
+                                'fats': comp_entry['fats'],
+                                'serving_size': comp_entry['serving_size'],
+                                'saturated_fat': comp_entry['saturated_fat'],
+                                'cholesterol': comp_entry['cholesterol'],
+                                'sodium': comp_entry['sodium'],
+                                'fiber': comp_entry['fiber'],
+                                'sugar': comp_entry['sugar'],
+                                'added_sugar': comp_entry['added_sugar'],
+                                'is_vegetarian': comp_entry['is_vegetarian'],
+                                'is_vegan': comp_entry['is_vegan'],
+                                'allergens': comp_entry['allergens'],
+                                'ingredients': comp_entry['ingredients'],
+                            }, comp_item_id)
+                            comp_fetched += 1
+                        elif cn is not None:
                             comp_entry['calories'] = cn.get('calories', 0)
                             comp_entry['protein'] = cn.get('protein', 0.0)
                             comp_entry['carbs'] = cn.get('carbs', 0.0)
@@ -538,48 +620,12 @@ def scrape_purdue_menu_api(api_location='Wiley', date_str=None, nutrition_cache=
                             comp_entry['is_vegan'] = cn.get('is_vegan', comp_is_vegan)
                             comp_entry['allergens'] = cn.get('allergens', [])
                             comp_entry['ingredients'] = cn.get('ingredients', '')
+                            adopt_item_id(nutrition_cache, comp_name, comp_court, cn, comp_item_id)
                             comp_cached += 1
-                        else:
-                            nutrition = fetch_item_nutrition(comp_item_id, headers)
-                            if nutrition:
-                                comp_entry['calories'] = nutrition.get('calories', 0)
-                                comp_entry['protein'] = nutrition.get('protein', 0.0)
-                                comp_entry['carbs'] = nutrition.get('carbs', 0.0)
-                                comp_entry['fats'] = nutrition.get('fats', 0.0)
-                                comp_entry['saturated_fat'] = nutrition.get('saturated_fat', 0.0)
-                                comp_entry['cholesterol'] = nutrition.get('cholesterol', 0.0)
-                                comp_entry['sodium'] = nutrition.get('sodium', 0.0)
-                                comp_entry['fiber'] = nutrition.get('fiber', 0.0)
-                                comp_entry['sugar'] = nutrition.get('sugar', 0.0)
-                                comp_entry['added_sugar'] = nutrition.get('added_sugar', 0.0)
-                                comp_entry['serving_size'] = nutrition.get('serving_size', '1 serving')
-                                comp_entry['is_vegetarian'] = nutrition.get('is_vegetarian', comp_is_veg)
-                                comp_entry['is_vegan'] = nutrition.get('is_vegan', comp_is_vegan)
-                                comp_entry['allergens'] = nutrition.get('allergens', [])
-                                comp_entry['ingredients'] = nutrition.get('ingredients', '')
-                                # Cache for this session
-                                nutrition_cache[comp_cache_key] = {
-                                    'calories': comp_entry['calories'],
-                                    'protein': comp_entry['protein'],
-                                    'carbs': comp_entry['carbs'],
-                                    'fats': comp_entry['fats'],
-                                    'serving_size': comp_entry['serving_size'],
-                                    'saturated_fat': comp_entry['saturated_fat'],
-                                    'cholesterol': comp_entry['cholesterol'],
-                                    'sodium': comp_entry['sodium'],
-                                    'fiber': comp_entry['fiber'],
-                                    'sugar': comp_entry['sugar'],
-                                    'added_sugar': comp_entry['added_sugar'],
-                                    'is_vegetarian': comp_entry['is_vegetarian'],
-                                    'is_vegan': comp_entry['is_vegan'],
-                                    'allergens': comp_entry['allergens'],
-                                    'ingredients': comp_entry['ingredients'],
-                                }
-                                comp_fetched += 1
 
                     enriched_components.append(comp_entry)
 
-                # Store components in the menu item (will be saved into macros JSON)
+                # Store components in the menu item (saved once each to food_components)
                 menu_item['components'] = enriched_components
 
             if comp_fetched > 0 or comp_cached > 0:
@@ -830,34 +876,55 @@ def extract_item_data_selenium(item_div, dining_court, meal_name='Unknown', stat
     except Exception as e:
         return None
 
-def _scrape_all_dining_courts_internal(date=None, use_cache=True, days_ahead=7,
-                                       include_snapshots=False, schedule_start_date=None):
+def _load_nutrition_cache(use_cache=True, database_url=None, cache_file=None):
     """
-    Scrape all Purdue dining courts for menus using the API.
+    Build the nutrition cache for a scrape run.
 
-    Args:
-        date: Date in YYYY/MM/DD format (optional, defaults to today)
-        use_cache: Whether to use the nutrition cache from database (default: True)
-        days_ahead: Number of days to scrape ahead
-        include_snapshots: Whether to return per-date snapshot items
-        schedule_start_date: Earliest date to include in next_appearances
+    A local cache file (cache_file or NUTRITION_CACHE_FILE) is restored first;
+    the foods table is only read when no usable file exists. Items missing from
+    the cache are fetched from the API as they are encountered.
+    """
+    if not use_cache:
+        return {}
+
+    cache_file = cache_file or default_store_path()
+    if cache_file:
+        cache = load_nutrition_store(cache_file)
+        if cache:
+            return cache
+
+    print("\nLoading nutrition cache from database...")
+    return get_nutrition_cache(database_url)
+
+def _resolve_refresh_policy(use_cache=True, refresh_policy=None):
+    """Refresh policy for a run; built from the environment unless one is given."""
+    if not use_cache:
+        return None  # every item is fetched anyway
+    if refresh_policy is None:
+        refresh_policy = RefreshPolicy.from_env()
+    ttl = f"{refresh_policy.ttl_seconds / 86400:g} days" if refresh_policy.ttl_seconds else "off"
+    print(f"Nutrition refresh: TTL {ttl}, sampling {refresh_policy.sample_rate:.1%} of cached items")
+    return refresh_policy
+
+def _persist_nutrition_cache(nutrition_cache, cache_file=None):
+    """Write the run's nutrition cache to the local cache file, if one is configured."""
+    cache_file = cache_file or default_store_path()
+    if not cache_file or not nutrition_cache:
+        return
+    try:
+        save_nutrition_store(cache_file, nutrition_cache)
+    except Exception as e:
+        print(f"Warning: Could not save nutrition cache file {cache_file}: {e}")
+
+def _resolve_scrape_window(date=None, schedule_start_date=None):
+    """
+    Resolve the first date to scrape and the earliest date kept in schedules.
 
     Returns:
-        If include_snapshots is False: list of unique menu items with schedule
-        If include_snapshots is True: (items_with_schedule, snapshot_items)
+        (start_date as datetime, schedule_start_date as date)
     """
-    from datetime import datetime, timedelta
-    
-    all_items = []
-    food_schedules = {}  # Track when each food appears: {(name, dining_court, meal_time): [(date, meal_time)]}
-    
-    # Load nutrition cache from database
-    nutrition_cache = {}
-    if use_cache:
-        print("\nLoading nutrition cache from database...")
-        nutrition_cache = get_nutrition_cache()
-    
-    # Determine start date
+    from datetime import datetime
+
     if date:
         start_date = datetime.strptime(date.replace('/', '-'), '%Y-%m-%d')
     else:
@@ -867,89 +934,90 @@ def _scrape_all_dining_courts_internal(date=None, use_cache=True, days_ahead=7,
         schedule_start_date = datetime.now().date()
     elif isinstance(schedule_start_date, str):
         schedule_start_date = datetime.strptime(schedule_start_date, '%Y-%m-%d').date()
-    
-    print(f"\nStarting scrape for {days_ahead} days ahead...")
-    
-    # Scrape each day
-    for day_offset in range(days_ahead):
-        current_date = start_date + timedelta(days=day_offset)
-        date_str = current_date.strftime('%Y-%m-%d')
-        day_name = current_date.strftime('%A')  # Monday, Tuesday, etc.
-        
-        print(f"\n{'='*60}")
-        print(f"Scraping for {day_name}, {current_date.strftime('%B %d, %Y')}")
-        print(f"{'='*60}")
-        
-        for court in DINING_LOCATIONS:
-            display_name = court['display_name']
-            api_name = court['api_name']
-            court_code = court['code']
-            print(f"\n  {display_name} ({court_code})...")
-            items = scrape_purdue_menu_api(
-                api_location=api_name,
-                date_str=date_str,
-                nutrition_cache=nutrition_cache,
-                display_name=display_name,
-                court_code=court_code,
-                available_date=date_str
-            )
-            
-            if not items:
-                print(f"    API failed, trying web scraping...")
-                # Fallback to Selenium scraping if API fails
-                # In CI environments (like GitHub Actions), Chrome/ChromeDriver may not be available.
-                # Gracefully skip the fallback if the driver cannot be created.
+
+    return start_date, schedule_start_date
+
+def _scrape_location_day(court, date_str, nutrition_cache, refresh_policy=None):
+    """
+    Scrape one dining court for one date, falling back to Selenium if the API fails.
+
+    Returns:
+        List of food items (may be empty)
+    """
+    display_name = court['display_name']
+    api_name = court['api_name']
+    court_code = court['code']
+    print(f"\n  {display_name} ({court_code})...")
+    items = scrape_purdue_menu_api(
+        api_location=api_name,
+        date_str=date_str,
+        nutrition_cache=nutrition_cache,
+        display_name=display_name,
+        court_code=court_code,
+        available_date=date_str,
+        refresh_policy=refresh_policy
+    )
+
+    if not items and not getattr(_http, 'browser_fallback', True):
+        print("    API returned no items; browser fallback disabled for this client")
+    elif not items:
+        print(f"    API failed, trying web scraping...")
+        # Fallback to Selenium scraping if API fails
+        # In CI environments (like GitHub Actions), Chrome/ChromeDriver may not be available.
+        # Gracefully skip the fallback if the driver cannot be created.
+        try:
+            driver = create_driver()
+            try:
+                items = scrape_purdue_menu(api_name, None, driver)
+            finally:
                 try:
-                    driver = create_driver()
-                    try:
-                        items = scrape_purdue_menu(api_name, None, driver)
-                    finally:
-                        try:
-                            driver.quit()
-                        except Exception:
-                            pass
-                except Exception as e:
-                    print(f"    Selenium fallback unavailable: {e}")
-                    print("    Skipping web scraping for this location/date and continuing...")
-            
-            # Track schedule for each item
-            for item in items:
-                meal_time = item.get('meal_period', 'Unknown')
-                station_name = item.get('station', 'Unknown')
-                key = (
-                    item['name'].lower().strip(),
-                    item['dining_court'].lower().strip() if item.get('dining_court') else '',
-                    meal_time.lower() if isinstance(meal_time, str) else 'unknown',
-                    station_name.lower().strip() if isinstance(station_name, str) else 'unknown'
-                )
+                    driver.quit()
+                except Exception:
+                    pass
+        except Exception as e:
+            print(f"    Selenium fallback unavailable: {e}")
+            print("    Skipping web scraping for this location/date and continuing...")
+
+    print(f"    Found {len(items)} items")
+    return items
 
-                if key not in food_schedules:
-                    food_schedules[key] = []
+def _schedule_key(item):
+    """Key identifying a unique food across days: (name, dining_court, meal_time, station)."""
+    meal_time = item.get('meal_period', 'Unknown')
+    station_name = item.get('station', 'Unknown')
+    return (
+        item['name'].lower().strip(),
+        item['dining_court'].lower().strip() if item.get('dining_court') else '',
+        meal_time.lower() if isinstance(meal_time, str) else 'unknown',
+        station_name.lower().strip() if isinstance(station_name, str) else 'unknown'
+    )
 
-                if current_date.date() >= schedule_start_date:
-                    food_schedules[key].append({
-                        'date': date_str,
-                        'day_name': day_name,
-                        'meal_time': meal_time
-                    })
-            
-            all_items.extend(items)
-            print(f"    Found {len(items)} items")
-    
-    # Add schedule information to items
+def _record_appearances(food_schedules, items, current_date, schedule_start_date):
+    """Track the dates each item appears on, skipping dates before schedule_start_date."""
+    date_str = current_date.strftime('%Y-%m-%d')
+    day_name = current_date.strftime('%A')  # Monday, Tuesday, etc.
+
+    for item in items:
+        key = _schedule_key(item)
+
+        if key not in food_schedules:
+            food_schedules[key] = []
+
+        if current_date.date() >= schedule_start_date:
+            food_schedules[key].append({
+                'date': date_str,
+                'day_name': day_name,
+                'meal_time': item.get('meal_period', 'Unknown')
+            })
+
+def _attach_schedules(all_items, food_schedules):
+    """Deduplicate scraped items and attach their next_appearances schedule."""
     print(f"\n\nProcessing {len(food_schedules)} unique food items...")
     items_with_schedule = []
-    
+
     seen = set()
     for item in all_items:
-        meal_time = item.get('meal_period', 'Unknown')
-        station_name = item.get('station', 'Unknown')
-        key = (
-            item['name'].lower().strip(),
-            item['dining_court'].lower().strip() if item.get('dining_court') else '',
-            meal_time.lower() if isinstance(meal_time, str) else 'unknown',
-            station_name.lower().strip() if isinstance(station_name, str) else 'unknown'
-        )
+        key = _schedule_key(item)
         schedule = food_schedules.get(key, [])
 
         if key in seen:
@@ -959,12 +1027,63 @@ def _scrape_all_dining_courts_internal(date=None, use_cache=True, days_ahead=7,
         if schedule:
             item['next_appearances'] = schedule
         items_with_schedule.append(item)
-    
+
+    return items_with_schedule
+
+def _scrape_all_dining_courts_internal(date=None, use_cache=True, days_ahead=7,
+                                       include_snapshots=False, schedule_start_date=None,
+                                       cache_file=None, refresh_policy=None):
+    """
+    Scrape all Purdue dining courts for menus using the API.
+
+    Args:
+        date: Date in YYYY/MM/DD format (optional, defaults to today)
+        use_cache: Whether to use the nutrition cache from database (default: True)
+        days_ahead: Number of days to scrape ahead
+        include_snapshots: Whether to return per-date snapshot items
+        schedule_start_date: Earliest date to include in next_appearances
+        cache_file: Local nutrition cache file (defaults to NUTRITION_CACHE_FILE)
+        refresh_policy: RefreshPolicy for re-fetching cached entries (defaults to env settings)
+
+    Returns:
+        If include_snapshots is False: list of unique menu items with schedule
+        If include_snapshots is True: (items_with_schedule, snapshot_items)
+    """
+    from datetime import timedelta
+
+    all_items = []
+    food_schedules = {}  # Track when each food appears: {(name, dining_court, meal_time, station): [{date, day_name, meal_time}]}
+
+    nutrition_cache = _load_nutrition_cache(use_cache, cache_file=cache_file)
+    refresh_policy = _resolve_refresh_policy(use_cache, refresh_policy)
+
+    start_date, schedule_start_date = _resolve_scrape_window(date, schedule_start_date)
+
+    print(f"\nStarting scrape for {days_ahead} days ahead...")
+
+    # Scrape each day
+    for day_offset in range(days_ahead):
+        current_date = start_date + timedelta(days=day_offset)
+        date_str = current_date.strftime('%Y-%m-%d')
+        day_name = current_date.strftime('%A')  # Monday, Tuesday, etc.
+
+        print(f"\n{'='*60}")
+        print(f"Scraping for {day_name}, {current_date.strftime('%B %d, %Y')}")
+        print(f"{'='*60}")
+
+        for court in DINING_LOCATIONS:
+            items = _scrape_location_day(court, date_str, nutrition_cache, refresh_policy)
+            _record_appearances(food_schedules, items, current_date, schedule_start_date)
+            all_items.extend(items)
+
+    _persist_nutrition_cache(nutrition_cache, cache_file)
+    items_with_schedule = _attach_schedules(all_items, food_schedules)
+
     if include_snapshots:
         return items_with_schedule, all_items
     return items_with_schedule
 
-def scrape_all_dining_courts(date=None, use_cache=True, days_ahead=7):
+def scrape_all_dining_courts(date=None, use_cache=True, days_ahead=7, cache_file=None, refresh_policy=None):
     """
     Scrape all Purdue dining courts for upcoming menus using the API.
 
@@ -975,10 +1094,13 @@ def scrape_all_dining_courts(date=None, use_cache=True, days_ahead=7):
         date=date,
         use_cache=use_cache,
         days_ahead=days_ahead,
-        include_snapshots=False
+        include_snapshots=False,
+        cache_file=cache_file,
+        refresh_policy=refresh_policy
     )
 
-def scrape_all_dining_courts_with_snapshots(date=None, use_cache=True, days_ahead=7, schedule_start_date=None):
+def scrape_all_dining_courts_with_snapshots(date=None, use_cache=True, days_ahead=7, schedule_start_date=None,
+                                            cache_file=None, refresh_policy=None):
     """
     Scrape all dining courts and return unique items plus per-date snapshots.
     """
@@ -987,11 +1109,25 @@ def scrape_all_dining_courts_with_snapshots(date=None, use_cache=True, days_ahea
         use_cache=use_cache,
         days_ahead=days_ahead,
         include_snapshots=True,
-        schedule_start_date=schedule_start_date
+        schedule_start_date=schedule_start_date,
+        cache_file=cache_file,
+        refresh_policy=refresh_policy
     )
 
+def _component_key(component):
+    """food_components key for a collection component: its HFS itemId, else 'md5:' plus a hash of its fields."""
+    if component.get('itemId'):
+        return str(component['itemId'])
+    return 'md5:' + hashlib.md5(json.dumps(component, sort_keys=True).encode('utf-8')).hexdigest()
+
 def _build_macros_dict(item):
-    """Build the macros dictionary for a menu item, including components if present."""
+    """
+    Build the macros dictionary for a menu item.
+
+    Collection components are stored once in food_components (see
+    _save_components); the blob only lists their keys in component_ids, and
+    the nutrition_facts_macros view restores macros.components on read.
+    """
     macros = {
         'protein': item['protein'],
         'carbs': item['carbs'],
@@ -1009,274 +1145,678 @@ def _build_macros_dict(item):
         'ingredients': item.get('ingredients', ''),
     }
     if item.get('components'):
-        macros['components'] = item['components']
+        macros['component_ids'] = [_component_key(component) for component in item['components']]
     return macros
 
 
-def save_to_database(menu_items, database_url=None):
+def _copy_value(value):
+    """Format one value for COPY ... FROM STDIN in text format."""
+    if value is None:
+        return '\\N'
+    text = str(value)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def _copy_rows(cursor, table, columns, rows):
+    """Stream rows into a table with a single COPY. Returns the number of rows sent."""
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(value) for value in row))
+        buffer.write('\n')
+        count += 1
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    return count
+
+def _save_components(cursor, menu_items):
     """
-    Save menu items to the database.
-    - Adds new items
-    - Updates existing items if they have no nutrition data (calories = 0)
+    Upsert the distinct collection components of a batch into food_components.
+
+    Each component is sent once per batch however many items list it, and
+    existing rows are only rewritten when the component changed. This runs
+    before the items' nutrition blobs are interned, since their
+    nutrition_components links reference these rows. Rows are upserted in
+    item_id order, so concurrent writers lock shared components in the same
+    order and cannot deadlock on them.
+
+    Returns:
+        Number of distinct components sent
     """
-    if not database_url:
-        database_url = os.getenv('DATABASE_URL')
-    
-    if not database_url:
-        print("ERROR: No DATABASE_URL provided")
-        return
-    
-    # Convert postgres:// to postgresql://
-    if database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql://', 1)
-    
-    try:
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-        
-        # Create foods table if it doesn't exist
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS foods (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                calories INT NOT NULL,
-                macros JSONB NOT NULL,
-                dining_court VARCHAR(100),
-                station VARCHAR(255),
-                meal_time VARCHAR(50),
-                next_available JSONB,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Add next_available column if it doesn't exist (for existing databases)
-        cursor.execute("""
-            DO $$ 
-            BEGIN
-                IF NOT EXISTS (
-                    SELECT 1 FROM information_schema.columns 
-                    WHERE table_name='foods' AND column_name='next_available'
-                ) THEN
-                    ALTER TABLE foods ADD COLUMN next_available JSONB;
-                END IF;
-            END $$;
-        """)
-        
-        added_count = 0
-        updated_count = 0
-        skipped_count = 0
-        
-        for item in menu_items:
-            
-            # Prepare schedule data
-            schedule_data = item.get('next_appearances', [])
-            primary_meal_time = item.get('meal_period', 'Unknown') or 'Unknown'
-            
-            # If we have schedule but meal_period is missing, fall back to schedule
-            if (not primary_meal_time or primary_meal_time == 'Unknown') and schedule_data:
-                primary_meal_time = schedule_data[0]['meal_time']
-
-            display_court = item.get('dining_court')
-            court_code = item.get('dining_court_code')
-            court_for_storage = display_court or court_code
-            possible_courts = [court_for_storage] if court_for_storage else []
-            if court_code and court_code not in possible_courts:
-                possible_courts.append(court_code)
-            if display_court and display_court not in possible_courts:
-                possible_courts.append(display_court)
-            possible_courts = [c for c in possible_courts if c]
-            if not possible_courts:
-                possible_courts = ['Unknown']
-            if not court_for_storage:
-                court_for_storage = possible_courts[0]
-            
-            station_name = item.get('station', 'Unknown')
-            
-            # Check if item already exists (match by name, dining_court, meal_time, AND station)
-            placeholders = ','.join(['%s'] * len(possible_courts))
-            params = [item['name'], primary_meal_time, station_name]
-            params.extend(possible_courts)
-            cursor.execute(
-                f"SELECT id, calories, dining_court FROM foods WHERE name = %s AND meal_time = %s AND station = %s AND dining_court IN ({placeholders}) LIMIT 1",
-                tuple(params)
-            )
-            
-            existing = cursor.fetchone()
-            
-            if existing:
-                existing_id, existing_calories, existing_court_value = existing
-                
-                macros_json = json.dumps(_build_macros_dict(item))
+    components = {}
+    for item in menu_items:
+        for component in item.get('components') or []:
+            components[_component_key(component)] = component
+    if not components:
+        return 0
+
+    cursor.execute("""
+        CREATE TEMP TABLE food_components_stage (
+            item_id VARCHAR(100) PRIMARY KEY,
+            details JSONB NOT NULL
+        ) ON COMMIT DROP
+    """)
+    _copy_rows(
+        cursor,
+        'food_components_stage',
+        ('item_id', 'details'),
+        ((key, json.dumps(component)) for key, component in components.items())
+    )
+    cursor.execute("""
+        INSERT INTO food_components (item_id, details, content_hash)
+        SELECT item_id, details, md5(details::text)
+        FROM food_components_stage
+        ORDER BY item_id
+        ON CONFLICT (item_id) DO UPDATE
+            SET details = EXCLUDED.details,
+                content_hash = EXCLUDED.content_hash,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE food_components.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    """)
+    cursor.execute("DROP TABLE food_components_stage")
+    return len(components)
+
+def _intern_staged_nutrition(cursor, stage_table):
+    """
+    Add a staging table's macros blobs to nutrition_facts and set each staged row's nutrition_id.
+
+    The merge then writes nutrition_id with NULL macros, so the per-row intern
+    trigger (db/migrations/0006) has nothing left to do. Blobs are inserted in
+    content_hash order, so concurrent writers interning the same blobs wait on
+    each other in the same order instead of deadlocking.
+    """
+    cursor.execute(f"""
+        INSERT INTO nutrition_facts (content_hash, macros)
+        SELECT DISTINCT ON (md5(macros::text)) md5(macros::text), macros
+        FROM {stage_table}
+        ORDER BY md5(macros::text)
+        ON CONFLICT (content_hash) DO NOTHING
+    """)
+    cursor.execute(f"""
+        UPDATE {stage_table} s SET nutrition_id = n.id
+        FROM nutrition_facts n
+        WHERE n.content_hash = md5(s.macros::text)
+    """)
+
+def _food_row(item):
+    """
+    Resolve how a scraped item is matched against and stored in foods.
 
-                # Always update with new schedule information
+    Returns:
+        Dict with the values to store plus match_keys, the foods.match_key
+        values an existing row may have: the key for court_for_storage first,
+        then the keys for the court code and display name (either may be
+        stored). appearances holds the (date, meal_time) pairs for
+        food_appearances.
+    """
+    schedule_data = item.get('next_appearances', [])
+    primary_meal_time = item.get('meal_period', 'Unknown') or 'Unknown'
+
+    # If we have schedule but meal_period is missing, fall back to schedule
+    if (not primary_meal_time or primary_meal_time == 'Unknown') and schedule_data:
+        primary_meal_time = schedule_data[0]['meal_time']
+
+    display_court = item.get('dining_court')
+    court_code = item.get('dining_court_code')
+    court_for_storage = display_court or court_code
+    possible_courts = [court_for_storage] if court_for_storage else []
+    if court_code and court_code not in possible_courts:
+        possible_courts.append(court_code)
+    if display_court and display_court not in possible_courts:
+        possible_courts.append(display_court)
+    possible_courts = [c for c in possible_courts if c]
+    if not possible_courts:
+        possible_courts = ['Unknown']
+    if not court_for_storage:
+        court_for_storage = possible_courts[0]
+
+    row = {
+        'name': item['name'],
+        'calories': item['calories'],
+        'macros': json.dumps(_build_macros_dict(item)),
+        'display_court': display_court,
+        'court_for_storage': court_for_storage,
+        'station': item.get('station'),
+        'meal_time': primary_meal_time,
+        'appearances': sorted({
+            (slot['date'], slot.get('meal_time') or primary_meal_time)
+            for slot in schedule_data if slot.get('date')
+        }),
+    }
+    row['match_keys'] = []
+    for court in possible_courts:
+        key = food_match_key(court, row['name'], row['meal_time'], row['station'])
+        if key not in row['match_keys']:
+            row['match_keys'].append(key)
+    # Everything an update would write to foods; an existing row with the same hash is left alone.
+    # Schedules live in food_appearances and are diffed separately.
+    row['content_hash'] = hashlib.md5(json.dumps([
+        row['calories'], row['macros'], row['station'], row['meal_time'], row['display_court'],
+    ]).encode('utf-8')).hexdigest()
+    return row
+
+def _refresh_next_available(cursor, food_ids):
+    """Copy food_schedules into the deprecated foods.next_available for the given foods (db/migrations/0013)."""
+    if food_ids:
+        cursor.execute("SELECT refresh_foods_next_available(%s::int[])", (sorted(food_ids),))
+
+def _replace_appearances(cursor, food_id, appearances):
+    """
+    Make food_appearances for one food match appearances, touching only the rows that differ.
+
+    Returns:
+        True if any row was inserted or deleted
+    """
+    cursor.execute("SELECT date::text, meal_time FROM food_appearances WHERE food_id = %s", (food_id,))
+    existing = set(cursor.fetchall())
+    wanted = set(appearances)
+
+    stale = existing - wanted
+    if stale:
+        cursor.execute(
+            "DELETE FROM food_appearances WHERE food_id = %s AND (date, meal_time) IN %s",
+            (food_id, tuple(stale))
+        )
+    for date_str, meal_time in sorted(wanted - existing):
+        cursor.execute(
+            "INSERT INTO food_appearances (food_id, date, meal_time) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING",
+            (food_id, date_str, meal_time)
+        )
+    return wanted != existing
+
+def _save_foods_rowwise(cursor, menu_items):
+    """
+    Upsert foods one item at a time (one SELECT plus one UPDATE or INSERT each),
+    then sync each food's food_appearances rows and the deprecated
+    foods.next_available of the foods it touched.
+
+    Returns:
+        (added, changed, unchanged, skipped)
+    """
+    added_count = 0
+    updated_count = 0
+    unchanged_count = 0
+    skipped_count = 0
+    touched = set()
+
+    for item in menu_items:
+        if not item.get('name'):
+            skipped_count += 1
+            continue
+
+        row = _food_row(item)
+
+        # Check if item already exists (match by name, dining_court, meal_time, AND station),
+        # preferring the row already stored under court_for_storage
+        cursor.execute(
+            """
+            SELECT id, content_hash, dining_court FROM foods
+            WHERE match_key = ANY(%s)
+            ORDER BY match_key = %s DESC, id
+            LIMIT 1
+            """,
+            (row['match_keys'], row['match_keys'][0])
+        )
+
+        existing = cursor.fetchone()
+
+        if existing:
+            existing_id, existing_hash, existing_court_value = existing
+            food_id = existing_id
+
+            if existing_hash == row['content_hash']:
+                unchanged_count += 1
+            else:
+                new_court = row['display_court'] or existing_court_value
+                # Skip the update if another food already holds the match key it would move this one to
                 cursor.execute(
                     """
                     UPDATE foods
                     SET calories = %s, macros = %s, station = %s, meal_time = %s,
                         dining_court = %s,
-                        next_available = %s, updated_at = CURRENT_TIMESTAMP
+                        content_hash = %s, updated_at = CURRENT_TIMESTAMP
                     WHERE id = %s
+                      AND NOT EXISTS (SELECT 1 FROM foods o WHERE o.match_key = %s AND o.id <> %s)
                     """,
                     (
-                        item['calories'],
-                        macros_json,
-                        item.get('station'),
-                        primary_meal_time,
-                        display_court or existing_court_value,
-                        json.dumps(schedule_data) if schedule_data else None,
+                        row['calories'],
+                        row['macros'],
+                        row['station'],
+                        row['meal_time'],
+                        new_court,
+                        row['content_hash'],
+                        existing_id,
+                        food_match_key(new_court, row['name'], row['meal_time'], row['station']),
                         existing_id
                     )
                 )
-                updated_count += 1
-            else:
-                macros_json = json.dumps(_build_macros_dict(item))
-
-                # Insert new food item
-                cursor.execute(
-                    """
-                    INSERT INTO foods (name, calories, macros, dining_court, station, meal_time, next_available)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        item['name'],
-                        item['calories'],
-                        macros_json,
-                        court_for_storage,
-                        item.get('station'),
-                        primary_meal_time,
-                        json.dumps(schedule_data) if schedule_data else None
-                    )
+                if cursor.rowcount:
+                    updated_count += 1
+                    touched.add(food_id)
+                else:
+                    skipped_count += 1
+        else:
+            # Insert new food item
+            cursor.execute(
+                """
+                INSERT INTO foods (name, calories, macros, dining_court, station, meal_time, content_hash)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                RETURNING id
+                """,
+                (
+                    row['name'],
+                    row['calories'],
+                    row['macros'],
+                    row['court_for_storage'],
+                    row['station'],
+                    row['meal_time'],
+                    row['content_hash']
                 )
-                added_count += 1
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+            )
+            food_id = cursor.fetchone()[0]
+            added_count += 1
+            touched.add(food_id)
+
+        if _replace_appearances(cursor, food_id, row['appearances']):
+            touched.add(food_id)
+
+    _refresh_next_available(cursor, touched)
+    return added_count, updated_count, unchanged_count, skipped_count
+
+def _save_foods_bulk(cursor, menu_items):
+    """
+    Upsert foods with one COPY into a temp table and a few set-based statements.
+
+    Matching follows the row-wise path: foods.match_key equal to one of the
+    item's match keys, preferring the key for court_for_storage. Matched rows
+    are only rewritten when their content_hash differs. Items that repeat a
+    match key within the batch collapse to the last occurrence and are counted
+    as skipped, as are updates that would move a food onto another food's
+    match key. food_appearances is then diffed against the staged schedules:
+    only missing rows are inserted and only dropped rows are deleted.
+    foods.next_available is refreshed for the foods written or rescheduled.
+
+    Returns:
+        (added, changed, unchanged, skipped)
+    """
+    staged = {}
+    skipped_count = 0
+    for item in menu_items:
+        if not item.get('name'):
+            skipped_count += 1
+            continue
+        row = _food_row(item)
+        key = row['match_keys'][0]
+        if key in staged:
+            skipped_count += 1
+        staged[key] = row
+
+    if not staged:
+        return 0, 0, 0, skipped_count
+
+    cursor.execute("""
+        CREATE TEMP TABLE foods_stage (
+            seq INT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            calories INT NOT NULL,
+            macros JSONB NOT NULL,
+            display_court VARCHAR(100),
+            court_for_storage VARCHAR(100),
+            match_key TEXT NOT NULL,
+            match_key_alt_1 TEXT,
+            match_key_alt_2 TEXT,
+            station VARCHAR(255),
+            meal_time VARCHAR(50),
+            content_hash CHAR(32),
+            nutrition_id INT
+        ) ON COMMIT DROP
+    """)
+    _copy_rows(
+        cursor,
+        'foods_stage',
+        ('seq', 'name', 'calories', 'macros', 'display_court', 'court_for_storage', 'match_key',
+         'match_key_alt_1', 'match_key_alt_2', 'station', 'meal_time', 'content_hash'),
+        (
+            (
+                seq, row['name'], row['calories'], row['macros'], row['display_court'],
+                row['court_for_storage'],
+                row['match_keys'][0],
+                row['match_keys'][1] if len(row['match_keys']) > 1 else None,
+                row['match_keys'][2] if len(row['match_keys']) > 2 else None,
+                row['station'], row['meal_time'], row['content_hash'],
+            )
+            for seq, row in enumerate(staged.values())
+        )
+    )
+
+    _intern_staged_nutrition(cursor, 'foods_stage')
+
+    cursor.execute("""
+        CREATE TEMP TABLE food_appearances_stage (
+            seq INT NOT NULL,
+            date DATE NOT NULL,
+            meal_time VARCHAR(50) NOT NULL
+        ) ON COMMIT DROP
+    """)
+    _copy_rows(
+        cursor,
+        'food_appearances_stage',
+        ('seq', 'date', 'meal_time'),
+        (
+            (seq, date_str, meal_time)
+            for seq, row in enumerate(staged.values())
+            for date_str, meal_time in row['appearances']
+        )
+    )
+
+    # Pair each staged row with the existing food it would have matched row by row
+    cursor.execute("""
+        CREATE TEMP TABLE foods_stage_match ON COMMIT DROP AS
+        SELECT DISTINCT ON (s.seq) s.seq, f.id
+        FROM foods_stage s
+        JOIN foods f ON f.match_key IN (s.match_key, s.match_key_alt_1, s.match_key_alt_2)
+        ORDER BY s.seq, f.match_key = s.match_key DESC, f.id
+    """)
+
+    # When several staged rows match one food, the last one wins (as it would row by row),
+    # for the columns as well as the schedule
+    cursor.execute("""
+        CREATE TEMP TABLE foods_stage_latest ON COMMIT DROP AS
+        SELECT DISTINCT ON (m.id) m.id, m.seq
+        FROM foods_stage_match m
+        ORDER BY m.id, m.seq DESC
+    """)
+    cursor.execute("""
+        SELECT COUNT(*), COUNT(*) FILTER (WHERE f.content_hash IS NOT DISTINCT FROM s.content_hash)
+        FROM foods_stage_latest l
+        JOIN foods_stage s ON s.seq = l.seq
+        JOIN foods f ON f.id = l.id
+    """)
+    matched_count, unchanged_count = cursor.fetchone()
+
+    # Moving a food to its display court changes its match_key; leave it alone
+    # if another food already holds the new key
+    cursor.execute("""
+        UPDATE foods f
+        SET calories = s.calories, macros = NULL, nutrition_id = s.nutrition_id,
+            station = s.station, meal_time = s.meal_time,
+            dining_court = COALESCE(s.display_court, f.dining_court),
+            content_hash = s.content_hash, updated_at = CURRENT_TIMESTAMP
+        FROM foods_stage_latest l
+        JOIN foods_stage s ON s.seq = l.seq
+        WHERE f.id = l.id
+          AND f.content_hash IS DISTINCT FROM s.content_hash
+          AND NOT EXISTS (
+              SELECT 1 FROM foods o
+              WHERE o.match_key = food_match_key(COALESCE(s.display_court, f.dining_court), f.name,
+                                                 s.meal_time, s.station)
+                AND o.id <> f.id
+          )
+        RETURNING f.id
+    """)
+    updated_count = cursor.rowcount
+    touched = {food_id for food_id, in cursor.fetchall()}
+    conflict_count = matched_count - unchanged_count - updated_count
+    if conflict_count:
+        print(f"  Skipped {conflict_count} updates whose match key belongs to another food")
+
+    # Reserve ids for new rows up front so their appearances can be linked without a second lookup
+    cursor.execute("""
+        INSERT INTO foods_stage_match (seq, id)
+        SELECT s.seq, nextval(pg_get_serial_sequence('foods', 'id'))
+        FROM (
+            SELECT seq FROM foods_stage s
+            WHERE NOT EXISTS (SELECT 1 FROM foods_stage_match m WHERE m.seq = s.seq)
+            ORDER BY seq
+        ) s
+    """)
+    cursor.execute("""
+        INSERT INTO foods (id, name, calories, nutrition_id, dining_court, station, meal_time, content_hash)
+        SELECT m.id, s.name, s.calories, s.nutrition_id, s.court_for_storage, s.station, s.meal_time, s.content_hash
+        FROM foods_stage s
+        JOIN foods_stage_match m ON m.seq = s.seq
+        WHERE NOT EXISTS (SELECT 1 FROM foods f WHERE f.id = m.id)
+        ORDER BY s.seq
+        RETURNING id
+    """)
+    added_count = cursor.rowcount
+    touched.update(food_id for food_id, in cursor.fetchall())
+    cursor.execute("""
+        INSERT INTO foods_stage_latest (id, seq)
+        SELECT m.id, m.seq FROM foods_stage_match m
+        WHERE NOT EXISTS (SELECT 1 FROM foods_stage_latest l WHERE l.id = m.id)
+    """)
+
+    cursor.execute("""
+        DELETE FROM food_appearances a
+        USING foods_stage_latest l
+        WHERE a.food_id = l.id
+          AND NOT EXISTS (
+              SELECT 1 FROM food_appearances_stage p
+              WHERE p.seq = l.seq AND p.date = a.date AND p.meal_time = a.meal_time
+          )
+        RETURNING a.food_id
+    """)
+    touched.update(food_id for food_id, in cursor.fetchall())
+    cursor.execute("""
+        INSERT INTO food_appearances (food_id, date, meal_time)
+        SELECT l.id, p.date, p.meal_time
+        FROM foods_stage_latest l
+        JOIN food_appearances_stage p ON p.seq = l.seq
+        ON CONFLICT DO NOTHING
+        RETURNING food_id
+    """)
+    touched.update(food_id for food_id, in cursor.fetchall())
+    _refresh_next_available(cursor, touched)
+
+    cursor.execute("DROP TABLE foods_stage_latest")
+    cursor.execute("DROP TABLE foods_stage_match")
+    cursor.execute("DROP TABLE food_appearances_stage")
+    cursor.execute("DROP TABLE foods_stage")
+
+    return added_count, updated_count, unchanged_count, skipped_count + conflict_count
+
+def save_to_database(menu_items, database_url=None, bulk=True):
+    """
+    Save menu items to the database.
+    - Adds new items
+    - Updates existing items whose nutrition or schedule changed
+
+    Args:
+        menu_items: Unique items with schedule information
+        database_url: Database connection string
+        bulk: Stage all items with COPY and merge them in one pass (default);
+              False falls back to one round trip per item
+
+    Returns:
+        (added, changed, unchanged, skipped) counts, or None if the save failed
+    """
+    database_url = resolve_database_url(database_url)
+    if not database_url:
+        print("ERROR: No DATABASE_URL provided")
+        return None
+    
+    try:
+        ensure_schema(database_url)
+
+        # Joins the caller's transaction if one is open (see scraper.db)
+        with transaction(database_url) as conn:
+            cursor = conn.cursor()
+            
+            _save_components(cursor, menu_items)
+            if bulk:
+                counts = _save_foods_bulk(cursor, menu_items)
+            else:
+                counts = _save_foods_rowwise(cursor, menu_items)
+            
+            cursor.close()
         
-        print(f"  Saved to DB: {added_count} added, {updated_count} updated")
+        print(f"  Saved to DB: {counts[0]} added, {counts[1]} changed, {counts[2]} unchanged, {counts[3]} skipped")
+        return counts
         
     except Exception as e:
         print(f"  Error saving to database: {e}")
-        if 'conn' in locals() and conn:
-            conn.rollback()
+        return None
+
+# menu_date under which retail menus are stored; it has its own menu_snapshots partition
+RETAIL_SENTINEL_DATE = '2099-01-01'
+
+def _snapshot_row(item):
+    """Snapshot column values for an item, or None when it has no menu date."""
+    menu_date = item.get('available_date') or item.get('menu_date')
+    if not menu_date:
+        return None
+
+    return (
+        menu_date,
+        item['name'],
+        item['calories'],
+        json.dumps(_build_macros_dict(item)),
+        item.get('dining_court') or item.get('dining_court_code') or 'Unknown',
+        item.get('dining_court_code'),
+        item.get('station'),
+        item.get('meal_period', 'Unknown') or 'Unknown',
+    )
+
+def _ensure_snapshot_partitions(cursor, menu_dates):
+    """Create any missing monthly menu_snapshots partitions for the given dates (one round trip)."""
+    months = sorted({
+        str(menu_date) if str(menu_date) == RETAIL_SENTINEL_DATE else f"{str(menu_date)[:7]}-01"
+        for menu_date in menu_dates
+    })
+    if months:
+        cursor.execute(
+            "SELECT ensure_menu_snapshots_partition(d) FROM unnest(%s::date[]) AS d",
+            (months,)
+        )
 
-def save_menu_snapshots(menu_items, database_url=None, source='api'):
+def _write_menu_snapshots_rowwise(cursor, menu_items, source='api'):
+    """Upsert snapshot rows one statement at a time. Returns rows written."""
+    saved = 0
+    _ensure_snapshot_partitions(cursor, (row[0] for row in map(_snapshot_row, menu_items) if row))
+
+    for item in menu_items:
+        row = _snapshot_row(item)
+        if row is None:
+            continue
+
+        cursor.execute(
+            """
+            INSERT INTO menu_snapshots
+                (menu_date, name, calories, macros, dining_court, dining_court_code, station, meal_time, source, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (menu_date, dining_court, meal_time, station, name)
+            DO UPDATE SET
+                calories = EXCLUDED.calories,
+                macros = EXCLUDED.macros,
+                nutrition_id = EXCLUDED.nutrition_id,
+                dining_court_code = EXCLUDED.dining_court_code,
+                source = EXCLUDED.source,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            row + (source,)
+        )
+        saved += 1
+
+    return saved
+
+def _write_menu_snapshots(cursor, menu_items, source='api', bulk=True):
     """
-    Save per-date menu snapshots to the database for historical verification.
+    Upsert snapshot rows for the given items using an open cursor.
+
+    The bulk path COPYs every row into a temp staging table and merges it into
+    menu_snapshots with a single INSERT ... ON CONFLICT. Rows repeating a unique
+    key within the batch collapse to the last one, since one statement cannot
+    update the same row twice.
+
+    Returns:
+        Number of rows written (items without a menu date are skipped)
     """
-    if not database_url:
-        database_url = os.getenv('DATABASE_URL')
+    _save_components(cursor, menu_items)
+    if not bulk:
+        return _write_menu_snapshots_rowwise(cursor, menu_items, source)
+
+    rows = [row for row in (_snapshot_row(item) for item in menu_items) if row is not None]
+    if not rows:
+        return 0
+    _ensure_snapshot_partitions(cursor, (row[0] for row in rows))
+
+    cursor.execute("""
+        CREATE TEMP TABLE menu_snapshots_stage (
+            seq INT NOT NULL,
+            menu_date DATE NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            calories INT NOT NULL,
+            macros JSONB NOT NULL,
+            dining_court VARCHAR(100) NOT NULL,
+            dining_court_code VARCHAR(10),
+            station VARCHAR(255),
+            meal_time VARCHAR(50),
+            nutrition_id INT
+        ) ON COMMIT DROP
+    """)
+    _copy_rows(
+        cursor,
+        'menu_snapshots_stage',
+        ('seq', 'menu_date', 'name', 'calories', 'macros', 'dining_court', 'dining_court_code', 'station', 'meal_time'),
+        ((seq,) + row for seq, row in enumerate(rows))
+    )
+    _intern_staged_nutrition(cursor, 'menu_snapshots_stage')
+
+    cursor.execute(
+        """
+        INSERT INTO menu_snapshots
+            (menu_date, name, calories, nutrition_id, dining_court, dining_court_code, station, meal_time, source, updated_at)
+        SELECT DISTINCT ON (menu_date, dining_court, meal_time, station, name)
+            menu_date, name, calories, nutrition_id, dining_court, dining_court_code, station, meal_time, %s, CURRENT_TIMESTAMP
+        FROM menu_snapshots_stage
+        ORDER BY menu_date, dining_court, meal_time, station, name, seq DESC
+        ON CONFLICT (menu_date, dining_court, meal_time, station, name)
+        DO UPDATE SET
+            calories = EXCLUDED.calories,
+            macros = NULL,
+            nutrition_id = EXCLUDED.nutrition_id,
+            dining_court_code = EXCLUDED.dining_court_code,
+            source = EXCLUDED.source,
+            updated_at = CURRENT_TIMESTAMP
+        """,
+        (source,)
+    )
+    saved = cursor.rowcount
+    cursor.execute("DROP TABLE menu_snapshots_stage")
+
+    return saved
+
+def save_menu_snapshots(menu_items, database_url=None, source='api', bulk=True):
+    """
+    Save per-date menu snapshots to the database for historical verification.
 
+    Args:
+        bulk: Stage rows with COPY and merge them in one statement (default);
+              False writes one INSERT ... ON CONFLICT per row
+    """
+    database_url = resolve_database_url(database_url)
     if not database_url:
         print("ERROR: No DATABASE_URL provided")
         return
 
-    if database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql://', 1)
-
     try:
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS menu_snapshots (
-                id SERIAL PRIMARY KEY,
-                menu_date DATE NOT NULL,
-                name VARCHAR(255) NOT NULL,
-                calories INT NOT NULL,
-                macros JSONB NOT NULL,
-                dining_court VARCHAR(100) NOT NULL,
-                dining_court_code VARCHAR(10),
-                station VARCHAR(255),
-                meal_time VARCHAR(50),
-                source VARCHAR(20) DEFAULT 'api',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            DO $$
-            BEGIN
-                IF NOT EXISTS (
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_name='menu_snapshots' AND column_name='dining_court_code'
-                ) THEN
-                    ALTER TABLE menu_snapshots ADD COLUMN dining_court_code VARCHAR(10);
-                END IF;
-                IF NOT EXISTS (
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_name='menu_snapshots' AND column_name='source'
-                ) THEN
-                    ALTER TABLE menu_snapshots ADD COLUMN source VARCHAR(20) DEFAULT 'api';
-                END IF;
-                IF NOT EXISTS (
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_name='menu_snapshots' AND column_name='updated_at'
-                ) THEN
-                    ALTER TABLE menu_snapshots ADD COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
-                END IF;
-            END $$;
-        """)
-
-        cursor.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_menu_snapshots_unique
-            ON menu_snapshots(menu_date, dining_court, meal_time, station, name)
-        """)
-
-        saved = 0
-
-        for item in menu_items:
-            menu_date = item.get('available_date') or item.get('menu_date')
-            if not menu_date:
-                continue
-
-            meal_time = item.get('meal_period', 'Unknown') or 'Unknown'
-            dining_court = item.get('dining_court') or item.get('dining_court_code') or 'Unknown'
-            dining_court_code = item.get('dining_court_code')
-
-            macros_json = json.dumps(_build_macros_dict(item))
+        ensure_schema(database_url)
 
-            cursor.execute(
-                """
-                INSERT INTO menu_snapshots
-                    (menu_date, name, calories, macros, dining_court, dining_court_code, station, meal_time, source, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                ON CONFLICT (menu_date, dining_court, meal_time, station, name)
-                DO UPDATE SET
-                    calories = EXCLUDED.calories,
-                    macros = EXCLUDED.macros,
-                    dining_court_code = EXCLUDED.dining_court_code,
-                    source = EXCLUDED.source,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                (
-                    menu_date,
-                    item['name'],
-                    item['calories'],
-                    macros_json,
-                    dining_court,
-                    dining_court_code,
-                    item.get('station'),
-                    meal_time,
-                    source
-                )
-            )
-            saved += 1
+        # Joins the caller's transaction if one is open (see scraper.db)
+        with transaction(database_url) as conn:
+            cursor = conn.cursor()
+
+            saved = _write_menu_snapshots(cursor, menu_items, source, bulk=bulk)
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            cursor.close()
 
         print(f"  Snapshot rows saved: {saved}")
 
     except Exception as e:
         print(f"  Error saving menu snapshots: {e}")
-        if 'conn' in locals() and conn:
-            conn.rollback()
 
-def scrape_and_save(database_url=None, days_ahead=7, use_cache=True, date=None):
+def scrape_and_save(database_url=None, days_ahead=7, use_cache=True, date=None, cache_file=None,
+                    refresh_policy=None):
     """
     Scrape menu items and save them to the database.
     
@@ -1285,11 +1825,14 @@ def scrape_and_save(database_url=None, days_ahead=7, use_cache=True, date=None):
         days_ahead: Number of days to scrape
         use_cache: Whether to use nutrition cache
         date: Start date
+        cache_file: Local nutrition cache file (defaults to NUTRITION_CACHE_FILE)
+        refresh_policy: RefreshPolicy for re-fetching cached entries (defaults to env settings)
 
     Returns the list of items scraped.
     """
     print("Programmatic scrape_and_save starting...")
-    items = scrape_all_dining_courts(date=date, use_cache=use_cache, days_ahead=days_ahead)
+    items = scrape_all_dining_courts(date=date, use_cache=use_cache, days_ahead=days_ahead, cache_file=cache_file,
+                                     refresh_policy=refresh_policy)
     print(f"Programmatic scrape found {len(items)} unique items")
     if items:
         try:
@@ -1299,6 +1842,168 @@ def scrape_and_save(database_url=None, days_ahead=7, use_cache=True, date=None):
             raise
     return items
 
+def _snapshot_writer(batch_queue, database_url, source, stats, guard=None):
+    """
+    Writer stage for the pipelined scrape: commit snapshot batches as they arrive.
+
+    Runs until it receives None. If the database fails or the capacity guard
+    trips, the writer keeps draining the queue (so fetchers never block forever)
+    but stops writing.
+    """
+    with ExitStack() as stack:
+        conn = None
+        cursor = None
+        try:
+            ensure_schema(database_url)
+            conn = stack.enter_context(connection(database_url))
+            cursor = conn.cursor()
+        except Exception as e:
+            stats['error'] = e
+            print(f"  Error opening snapshot writer connection: {e}")
+
+        _drain_snapshot_batches(batch_queue, conn, cursor, source, stats, guard)
+
+        if cursor is not None:
+            cursor.close()
+
+def _drain_snapshot_batches(batch_queue, conn, cursor, source, stats, guard=None):
+    """Check capacity for and commit each queued batch until None arrives; after an error, only drain."""
+    while True:
+        batch = batch_queue.get()
+        if batch is None:
+            break
+        if stats['error'] is not None:
+            continue
+
+        started = time.monotonic()
+        try:
+            if guard is not None:
+                guard.check('before snapshot batch write', pending_rows=len(batch))
+            stats['rows'] += _write_menu_snapshots(cursor, batch, source)
+            conn.commit()
+            stats['batches'] += 1
+        except (Exception, SystemExit) as e:
+            # The guard may raise SystemExit; keep it for the caller to re-raise
+            stats['error'] = e
+            print(f"  Error saving menu snapshots: {e}")
+            conn.rollback()
+        stats['write_seconds'] += time.monotonic() - started
+
+def scrape_and_save_pipelined(database_url=None, days_ahead=7, use_cache=True, date=None,
+                              schedule_start_date=None, workers=4, queue_size=8, source='api',
+                              cache_file=None, refresh_policy=None, guard=None, artifact_path=None):
+    """
+    Scrape all dining courts and save snapshots while scraping is still running.
+
+    Fetch workers push each finished location-day batch onto a bounded queue and
+    a single writer thread commits it to menu_snapshots as it arrives. When the
+    database is slower than the fetchers the queue fills up and the workers block
+    until the writer catches up. The foods table needs complete schedules, so it
+    is written once after the last snapshot batch has been committed.
+
+    A failed snapshot batch or foods write raises; the snapshot batches already
+    committed stay in place and the next run rewrites them.
+
+    Args:
+        database_url: Database connection string
+        days_ahead: Number of days to scrape
+        use_cache: Whether to use nutrition cache
+        date: Start date
+        schedule_start_date: Earliest date to include in next_appearances
+        workers: Number of concurrent location-day fetchers
+        queue_size: Maximum number of batches waiting for the writer
+        cache_file: Local nutrition cache file (defaults to NUTRITION_CACHE_FILE)
+        refresh_policy: RefreshPolicy for re-fetching cached entries (defaults to env settings)
+        guard: CapacityGuard checked before every snapshot batch and the foods write
+        artifact_path: Also write the scrape to this artifact before saving foods,
+                       so a failed write can be retried with scripts/ingest_artifacts.py
+
+    Returns the list of unique items scraped (with schedule information).
+    """
+    import queue
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import timedelta
+
+    database_url = resolve_database_url(database_url)
+    if not database_url:
+        print("ERROR: No DATABASE_URL provided")
+        return []
+
+    nutrition_cache = _load_nutrition_cache(use_cache, database_url, cache_file)
+    refresh_policy = _resolve_refresh_policy(use_cache, refresh_policy)
+
+    start_date, schedule_start_date = _resolve_scrape_window(date, schedule_start_date)
+    dates = [start_date + timedelta(days=offset) for offset in range(days_ahead)]
+
+    print(f"\nStarting pipelined scrape for {days_ahead} days ahead "
+          f"({workers} fetchers, queue of {queue_size} batches)...")
+
+    batch_queue = queue.Queue(maxsize=max(1, queue_size))
+    stats = {'rows': 0, 'batches': 0, 'write_seconds': 0.0, 'error': None}
+    writer = threading.Thread(
+        target=_snapshot_writer,
+        args=(batch_queue, database_url, source, stats, guard),
+        daemon=True
+    )
+    writer.start()
+
+    def fetch(current_date, court):
+        items = _scrape_location_day(court, current_date.strftime('%Y-%m-%d'), nutrition_cache, refresh_policy)
+        if items:
+            # Blocks while the writer is behind, throttling the fetchers
+            batch_queue.put(items)
+        return items
+
+    pipeline_started = time.monotonic()
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {
+                (day_idx, court_idx): pool.submit(fetch, current_date, court)
+                for day_idx, current_date in enumerate(dates)
+                for court_idx, court in enumerate(DINING_LOCATIONS)
+            }
+            for key, future in futures.items():
+                results[key] = future.result()
+    finally:
+        batch_queue.put(None)
+    fetch_seconds = time.monotonic() - pipeline_started
+    _persist_nutrition_cache(nutrition_cache, cache_file)
+
+    # Rebuild schedules in the same day/court order as the sequential scrape
+    all_items = []
+    food_schedules = {}
+    for day_idx, current_date in enumerate(dates):
+        for court_idx in range(len(DINING_LOCATIONS)):
+            items = results[(day_idx, court_idx)]
+            _record_appearances(food_schedules, items, current_date, schedule_start_date)
+            all_items.extend(items)
+
+    items_with_schedule = _attach_schedules(all_items, food_schedules)
+    if items_with_schedule and artifact_path:
+        write_artifact(artifact_path, items_with_schedule, all_items,
+                       start_date=start_date.strftime('%Y-%m-%d'), days=days_ahead)
+
+    writer.join()
+    print(f"  Snapshot rows saved: {stats['rows']} in {stats['batches']} batches")
+    if isinstance(stats['error'], SystemExit):
+        raise stats['error']
+    if stats['error'] is not None:
+        raise RuntimeError(f"Snapshot writer failed: {stats['error']}")
+
+    if items_with_schedule:
+        if guard is not None:
+            guard.check('before database write', pending_rows=len(items_with_schedule))
+        if save_to_database(items_with_schedule, database_url=database_url) is None:
+            raise RuntimeError("Saving foods failed")
+
+    total_seconds = time.monotonic() - pipeline_started
+    print(f"  Pipeline timing: fetch {fetch_seconds:.1f}s, snapshot writes {stats['write_seconds']:.1f}s, "
+          f"total {total_seconds:.1f}s")
+
+    return items_with_schedule
+
 if __name__ == "__main__":
     import argparse
     
@@ -1307,6 +2012,14 @@ if __name__ == "__main__":
     parser.add_argument('--days', type=int, default=7, help='Number of days ahead to scrape (1-14, default: 7)')
     parser.add_argument('--date', type=str, help='Start date in YYYY-MM-DD or YYYY/MM/DD format (default: today)')
     parser.add_argument('--no-cache', action='store_true', help='Disable nutrition cache (slower but always fresh)')
+    parser.add_argument('--cache-file', type=str, help='Local nutrition cache file to restore and update (default: $NUTRITION_CACHE_FILE)')
+    parser.add_argument('--cache-ttl-days', type=float, help='Re-fetch cached nutrition older than this many days, 0 to disable (default: $NUTRITION_CACHE_TTL_DAYS or 30)')
+    parser.add_argument('--refresh-sample', type=float, help='Fraction of cached items re-fetched each run, 0 to disable (default: $NUTRITION_REFRESH_SAMPLE or 0.02)')
+    parser.add_argument('--artifact', type=str, help='Write items and snapshots to this .ndjson.gz file instead of the database')
+    parser.add_argument('--record', type=str, metavar='DIR', help='Scrape live without saving and record every API response to DIR')
+    parser.add_argument('--replay', type=str, metavar='DIR', help='Re-run a recorded scrape offline from DIR and compare with its output')
+    parser.add_argument('--pipeline', action='store_true', help='Write snapshots to the database while scraping continues')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent location-day fetchers in pipeline mode (default: 4)')
     args = parser.parse_args()
     
     print("BoilerFuel Menu Scraper")
@@ -1315,11 +2028,33 @@ if __name__ == "__main__":
     # Validate days parameter
     days_ahead = max(1, min(args.days, 14))  # Limit to 1-14 days
     use_cache = not args.no_cache
+    refresh_policy = RefreshPolicy.from_env(args.cache_ttl_days, args.refresh_sample)
     
-    if args.test:
+    if args.replay:
+        # Replay mode: no network, browser or database; see scraper/replay.py
+        from scraper.replay import replay_run
+        items, snapshots, matches = replay_run(args.replay)
+        if args.artifact:
+            write_artifact(args.artifact, items, snapshots)
+        if matches is False:
+            sys.exit(1)
+    elif args.record:
+        from scraper.replay import record_run
+        record_run(args.record, date=args.date, days_ahead=days_ahead, use_cache=use_cache,
+                   cache_file=args.cache_file, refresh_policy=refresh_policy)
+    elif args.artifact:
+        # Artifact mode: scrape to a file; load it later with scripts/ingest_artifacts.py
+        start_date, _ = _resolve_scrape_window(args.date)
+        items, snapshots = scrape_all_dining_courts_with_snapshots(date=args.date, use_cache=use_cache,
+                                                                   days_ahead=days_ahead, cache_file=args.cache_file,
+                                                                   refresh_policy=refresh_policy)
+        write_artifact(args.artifact, items, snapshots,
+                       start_date=start_date.strftime('%Y-%m-%d'), days=days_ahead)
+    elif args.test:
         # Test mode: just scrape and print, don't save
         print("TEST MODE: Scraping without saving to database\n")
-        items = scrape_all_dining_courts(date=args.date, use_cache=use_cache, days_ahead=days_ahead)
+        items = scrape_all_dining_courts(date=args.date, use_cache=use_cache, days_ahead=days_ahead,
+                                         cache_file=args.cache_file, refresh_policy=refresh_policy)
         
         print(f"\nTotal unique items found: {len(items)}")
         if items:
@@ -1334,7 +2069,13 @@ if __name__ == "__main__":
     else:
         # Normal mode: scrape and save using the programmatic helper
         print(f"Scraping {days_ahead} day{'s' if days_ahead > 1 else ''} ahead for forecast data...\n")
-        items = scrape_and_save(database_url=os.getenv('DATABASE_URL'), days_ahead=days_ahead, use_cache=use_cache, date=args.date)
+        if args.pipeline:
+            items = scrape_and_save_pipelined(database_url=os.getenv('DATABASE_URL'), days_ahead=days_ahead,
+                                              use_cache=use_cache, date=args.date, workers=args.workers,
+                                              cache_file=args.cache_file, refresh_policy=refresh_policy)
+        else:
+            items = scrape_and_save(database_url=os.getenv('DATABASE_URL'), days_ahead=days_ahead, use_cache=use_cache,
+                                    date=args.date, cache_file=args.cache_file, refresh_policy=refresh_policy)
 
         print(f"\nTotal unique items scraped: {len(items)}")
         if items:
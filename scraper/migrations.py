@@ -0,0 +1,140 @@
+"""
+Versioned schema migrations for the scraper tables.
+
+Migrations are plain SQL files in db/migrations named NNNN_description.sql and
+applied in order. The schema_version table records which versions have run.
+Each migration runs in its own transaction. A Postgres advisory lock stops two
+runners (say, init_db.py and a scheduled scrape) from applying the same file at
+once.
+
+Write functions call ensure_schema() instead of issuing DDL themselves. After
+the first check in a process it returns immediately, so steady-state runs pay
+for a single version lookup rather than for CREATE/ALTER statements on every
+write.
+"""
+
+import os
+import re
+import threading
+
+from scraper.db import connection, resolve_database_url
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'db', 'migrations')
+
+# Arbitrary application-wide key for pg_advisory_lock
+MIGRATION_LOCK_KEY = 4275001
+
+_FILE_PATTERN = re.compile(r'^(\d{4})_([\w-]+)\.sql$')
+
+_current = set()
+_current_lock = threading.Lock()
+
+
+def discover_migrations(directory=MIGRATIONS_DIR):
+    """
+    List migration files in version order.
+
+    Returns:
+        List of (version, name, path)
+    """
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = _FILE_PATTERN.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def latest_version(directory=MIGRATIONS_DIR):
+    migrations = discover_migrations(directory)
+    return migrations[-1][0] if migrations else 0
+
+
+def current_version(cursor):
+    """Highest applied version, or 0 when schema_version does not exist yet."""
+    cursor.execute("SELECT to_regclass('schema_version') IS NOT NULL")
+    if not cursor.fetchone()[0]:
+        return 0
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+    return cursor.fetchone()[0]
+
+
+def apply_migrations(conn, directory=MIGRATIONS_DIR):
+    """
+    Apply pending migrations on a psycopg2 connection that is not in a transaction.
+
+    Returns:
+        List of versions applied by this call
+    """
+    migrations = discover_migrations(directory)
+    applied = []
+    cursor = conn.cursor()
+
+    conn.commit()
+    cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+
+        # Read under the lock: another runner may have just finished
+        version = current_version(cursor)
+        for migration_version, name, path in migrations:
+            if migration_version <= version:
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                sql = f.read()
+            print(f"Applying migration {migration_version:04d}_{name}...")
+            try:
+                cursor.execute(sql)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, name) VALUES (%s, %s)",
+                    (migration_version, name)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(migration_version)
+    finally:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+        conn.commit()
+        cursor.close()
+
+    return applied
+
+
+def ensure_schema(database_url=None):
+    """
+    Make sure the database is at the latest migration, applying any pending ones.
+
+    Runs on its own pooled connection, so it is safe to call from inside a
+    transaction(). Once the schema is current, later calls in the same process
+    return without touching the database.
+    """
+    database_url = resolve_database_url(database_url)
+    if database_url in _current:
+        return
+
+    with _current_lock:
+        if database_url in _current:
+            return
+        target = latest_version()
+        with connection(database_url, shared=False) as conn:
+            cursor = conn.cursor()
+            version = current_version(cursor)
+            cursor.close()
+            if version < target:
+                apply_migrations(conn)
+            else:
+                conn.rollback()
+        _current.add(database_url)
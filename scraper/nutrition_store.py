@@ -0,0 +1,272 @@
+"""
+Local nutrition cache file for the menu scraper.
+
+The scraper keeps nutrition data in a plain dict keyed by (name, dining_court).
+This module persists that dict to a small SQLite file so CI caching or a
+long-lived host can restore it at startup instead of rebuilding it from a full
+read of the foods table. Entries are also indexed by HFS item ID, so an item
+already fetched for one dining court is reused at the others.
+
+Every entry records when it was fetched (fetched_at, epoch seconds). A
+RefreshPolicy decides which cached entries are re-fetched during a run: those
+older than the TTL, plus a deterministic sample of the rest.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+
+# Bump when the file layout or entry shape changes; older files are ignored.
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_AGE_HOURS = 24 * 7
+
+DEFAULT_TTL_DAYS = 30
+DEFAULT_REFRESH_SAMPLE = 0.02
+
+
+def name_key(name, dining_court):
+    """Cache key for an item at a dining court."""
+    return (name.lower().strip(), dining_court.lower().strip() if dining_court else '')
+
+
+def id_key(item_id):
+    """Cache key for an HFS item ID (kept distinct from name keys by its marker)."""
+    return ('#item', str(item_id).lower())
+
+
+def fetched_at(entry):
+    """When an entry was fetched (epoch seconds), or 0 when unknown."""
+    return entry.get('fetched_at') or 0
+
+
+def lookup_nutrition(cache, name, dining_court, item_id=None):
+    """
+    Find cached nutrition for an item by name and dining court, or by item ID.
+
+    When both keys hit, the more recently fetched entry wins, so an item
+    refreshed at one dining court is picked up at the others in the same run.
+
+    Returns:
+        The cached entry dict, or None
+    """
+    entry = cache.get(name_key(name, dining_court))
+    if item_id:
+        by_id = cache.get(id_key(item_id))
+        if by_id is not None and (entry is None or fetched_at(by_id) > fetched_at(entry)):
+            entry = by_id
+    return entry
+
+
+def remember_nutrition(cache, name, dining_court, entry, item_id=None, when=None):
+    """
+    Store an entry under its name key and, when known, its item ID key.
+
+    Args:
+        when: Fetch time in epoch seconds; defaults to the entry's existing
+              fetched_at, or now
+    """
+    if item_id:
+        entry['item_id'] = str(item_id)
+    entry['fetched_at'] = when or entry.get('fetched_at') or time.time()
+    cache[name_key(name, dining_court)] = entry
+    if item_id:
+        current = cache.get(id_key(item_id))
+        if current is None or fetched_at(entry) >= fetched_at(current):
+            cache[id_key(item_id)] = entry
+
+
+class RefreshPolicy:
+    """
+    Decides which cached nutrition entries to re-fetch during a scrape run.
+
+    An entry is due when it is older than ttl_seconds, or when its item falls in
+    the run's sample: crc32(salt + item ID) lands in the lowest sample_rate
+    fraction of the hash space. The salt changes every run, so the sample
+    rotates through the cache over time. Each item is refreshed at most once per
+    run, even when it appears at several dining courts or dates.
+    """
+
+    def __init__(self, ttl_seconds=None, sample_rate=0.0, salt=None, now=None):
+        self.ttl_seconds = ttl_seconds
+        self.sample_rate = max(0.0, min(1.0, sample_rate or 0.0))
+        self.salt = salt if salt is not None else uuid.uuid4().hex
+        # Fixed clock for TTL checks; replayed runs pin it to the recording's time
+        self.now = now
+        self._claimed = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, ttl_days=None, sample_rate=None):
+        """
+        Build a policy from arguments, falling back to NUTRITION_CACHE_TTL_DAYS,
+        NUTRITION_REFRESH_SAMPLE and NUTRITION_REFRESH_SALT.
+
+        A TTL of 0 disables age-based refresh; a sample of 0 disables sampling.
+        """
+        if ttl_days is None:
+            ttl_days = _float_env('NUTRITION_CACHE_TTL_DAYS', DEFAULT_TTL_DAYS)
+        if sample_rate is None:
+            sample_rate = _float_env('NUTRITION_REFRESH_SAMPLE', DEFAULT_REFRESH_SAMPLE)
+        ttl_seconds = ttl_days * 86400 if ttl_days and ttl_days > 0 else None
+        return cls(ttl_seconds, sample_rate, os.getenv('NUTRITION_REFRESH_SALT') or None)
+
+    def is_sampled(self, item_id):
+        if self.sample_rate <= 0:
+            return False
+        digest = zlib.crc32(f"{self.salt}:{item_id}".lower().encode('utf-8'))
+        return digest < self.sample_rate * 0x100000000
+
+    def is_expired(self, entry, now=None):
+        if self.ttl_seconds is None:
+            return False
+        return (now or self.now or time.time()) - fetched_at(entry) > self.ttl_seconds
+
+    def claim(self, entry, item_id):
+        """
+        Return True if the cached entry for item_id should be re-fetched now.
+
+        A True result is only returned once per item per run; callers fall back
+        to the cached entry if the re-fetch fails.
+        """
+        if not item_id:
+            return False
+        if not (self.is_expired(entry) or self.is_sampled(item_id)):
+            return False
+        key = str(item_id).lower()
+        with self._lock:
+            if key in self._claimed:
+                return False
+            self._claimed.add(key)
+        return True
+
+
+def adopt_item_id(cache, name, dining_court, entry, item_id):
+    """
+    Also store an entry found by name under its item ID key, if it has none yet.
+
+    Entries loaded from the foods table carry no HFS item ID; once an item hits
+    one by name, the item's other dining courts find it by ID as well.
+    """
+    if item_id and not entry.get('item_id'):
+        remember_nutrition(cache, name, dining_court, entry, item_id)
+
+
+def default_store_path():
+    """Cache file path from NUTRITION_CACHE_FILE, or None when persistence is off."""
+    return os.getenv('NUTRITION_CACHE_FILE') or None
+
+
+def _float_env(name, default):
+    raw = os.getenv(name)
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def _max_age_seconds():
+    return _float_env('NUTRITION_CACHE_MAX_AGE_HOURS', DEFAULT_MAX_AGE_HOURS) * 3600
+
+
+def load_nutrition_store(path):
+    """
+    Restore a nutrition cache from a local file.
+
+    Returns an empty dict when the file is missing, unreadable, written by a
+    different format version, or older than NUTRITION_CACHE_MAX_AGE_HOURS
+    (pinned files, such as replay fixtures, never expire).
+    """
+    if not path or not os.path.exists(path):
+        return {}
+
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            if meta.get('format_version') != str(CACHE_FORMAT_VERSION):
+                print(f"Ignoring nutrition cache file {path}: format version {meta.get('format_version')}")
+                return {}
+
+            saved_at = float(meta.get('saved_at', 0))
+            age = time.time() - saved_at
+            if meta.get('pinned') != '1' and age > _max_age_seconds():
+                print(f"Ignoring nutrition cache file {path}: {age / 3600:.1f} hours old")
+                return {}
+
+            cache = {}
+            for name, dining_court, item_id, data in conn.execute(
+                "SELECT name, dining_court, item_id, data FROM entries"
+            ):
+                entry = json.loads(data)
+                # Entries written before fetched_at existed count as fetched at save time
+                remember_nutrition(cache, name, dining_court, entry, item_id,
+                                   when=entry.get('fetched_at') or saved_at)
+        finally:
+            conn.close()
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Warning: Could not read nutrition cache file {path}: {e}")
+        return {}
+
+    print(f"Loaded {len(cache)} keys from nutrition cache file {path}")
+    return cache
+
+
+def save_nutrition_store(path, cache, pinned=False):
+    """
+    Write a nutrition cache to a local file, replacing any previous file atomically.
+
+    Args:
+        pinned: Exempt the file from the max-age check when it is loaded
+
+    Returns:
+        Number of entries written
+    """
+    if not path:
+        return 0
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    rows = [
+        (key[0], key[1], entry.get('item_id'), json.dumps(entry))
+        for key, entry in cache.items()
+        if key[0] != '#item'
+    ]
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("""
+            CREATE TABLE entries (
+                name TEXT NOT NULL,
+                dining_court TEXT NOT NULL,
+                item_id TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (name, dining_court)
+            )
+        """)
+        conn.execute("CREATE INDEX idx_entries_item_id ON entries(item_id)")
+        conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+            ('format_version', str(CACHE_FORMAT_VERSION)),
+            ('saved_at', str(time.time())),
+            ('pinned', '1' if pinned else '0'),
+        ])
+        conn.executemany(
+            "INSERT INTO entries (name, dining_court, item_id, data) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, path)
+    print(f"Saved {len(rows)} entries to nutrition cache file {path}")
+    return len(rows)
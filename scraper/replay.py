@@ -0,0 +1,251 @@
+"""
+Record and replay HFS API traffic for deterministic, offline scraper runs.
+
+A recording directory holds everything a scrape run depends on:
+
+    manifest.json         run arguments: start date, days, schedule start, refresh policy
+    nutrition.sqlite      the nutrition cache as it was when the run started
+    responses/<sha1>.json one file per distinct request (method, URL and body)
+    output.ndjson.gz      the items and snapshots the recorded run produced
+
+Replaying runs the same scrape against the recorded responses with no network,
+browser or database access. The result is checked against output.ndjson.gz.
+
+Usage:
+    python -m scraper.menu_scraper --record recordings/2026-10-19 --days 3
+    python -m scraper.menu_scraper --replay recordings/2026-10-19
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+import requests
+
+from scraper import menu_scraper
+from scraper.artifacts import read_artifact, write_artifact
+from scraper.nutrition_store import RefreshPolicy, save_nutrition_store
+
+MANIFEST_FILE = 'manifest.json'
+NUTRITION_FILE = 'nutrition.sqlite'
+OUTPUT_FILE = 'output.ndjson.gz'
+RESPONSES_DIR = 'responses'
+
+
+def request_key(method, url, body=None):
+    """Stable file name for a request: sha1 of the method, URL and body."""
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+    digest = hashlib.sha1(f"{method.upper()} {url}\n{body or ''}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ReplayResponse:
+    """The parts of requests.Response the scraper uses, rebuilt from a recording."""
+
+    def __init__(self, url, status_code, text):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class RecordingSession:
+    """Performs real requests and stores every response (or error) under the recording directory."""
+
+    browser_fallback = False  # a Selenium result could not be replayed
+
+    def __init__(self, directory):
+        self.directory = os.path.join(directory, RESPONSES_DIR)
+        os.makedirs(self.directory, exist_ok=True)
+        self.session = requests.Session()
+
+    def get(self, url, **kwargs):
+        return self._request('GET', url, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self._request('POST', url, data=data, **kwargs)
+
+    def _request(self, method, url, data=None, **kwargs):
+        record = {'method': method, 'url': url, 'body': data}
+        try:
+            response = self.session.request(method, url, data=data, **kwargs)
+        except requests.RequestException as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+            self._save(record)
+            raise
+
+        record['status_code'] = response.status_code
+        record['text'] = response.text
+        self._save(record)
+        return response
+
+    def _save(self, record):
+        path = os.path.join(self.directory, request_key(record['method'], record['url'], record['body']) + '.json')
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+
+class ReplaySession:
+    """Answers requests from a recording directory; unrecorded requests fail like a dropped connection."""
+
+    browser_fallback = False
+
+    def __init__(self, directory):
+        self.directory = os.path.join(directory, RESPONSES_DIR)
+        self.misses = []
+
+    def get(self, url, **kwargs):
+        return self._request('GET', url)
+
+    def post(self, url, data=None, **kwargs):
+        return self._request('POST', url, data=data)
+
+    def _request(self, method, url, data=None):
+        path = os.path.join(self.directory, request_key(method, url, data) + '.json')
+        if not os.path.exists(path):
+            self.misses.append(f"{method} {url}")
+            raise requests.ConnectionError(f"No recorded response for {method} {url}")
+
+        with open(path, encoding='utf-8') as f:
+            record = json.load(f)
+        if 'error' in record:
+            raise requests.ConnectionError(record['error'])
+        return ReplayResponse(url, record['status_code'], record['text'])
+
+
+def _run(manifest, session, cache_file):
+    """Scrape with the given HTTP session and run arguments. Returns (items, snapshots)."""
+    policy = manifest.get('refresh_policy')
+    refresh_policy = None
+    if policy:
+        refresh_policy = RefreshPolicy(policy['ttl_seconds'], policy['sample_rate'], policy['salt'], policy['now'])
+
+    previous = menu_scraper.set_http_client(session)
+    try:
+        return menu_scraper.scrape_all_dining_courts_with_snapshots(
+            date=manifest['start_date'],
+            use_cache=manifest['use_cache'],
+            days_ahead=manifest['days'],
+            schedule_start_date=manifest['schedule_start_date'],
+            cache_file=cache_file,
+            refresh_policy=refresh_policy
+        )
+    finally:
+        menu_scraper.set_http_client(previous)
+
+
+def record_run(directory, date=None, days_ahead=7, use_cache=True, cache_file=None, refresh_policy=None):
+    """
+    Run a live scrape (no database writes) and record everything needed to replay it.
+
+    Returns:
+        (items, snapshots)
+    """
+    os.makedirs(directory, exist_ok=True)
+    start_date, schedule_start_date = menu_scraper._resolve_scrape_window(date)
+
+    manifest = {
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'schedule_start_date': schedule_start_date.strftime('%Y-%m-%d'),
+        'days': days_ahead,
+        'use_cache': use_cache,
+        'refresh_policy': None,
+    }
+    if use_cache:
+        if refresh_policy is None:
+            refresh_policy = RefreshPolicy.from_env()
+        manifest['refresh_policy'] = {
+            'ttl_seconds': refresh_policy.ttl_seconds,
+            'sample_rate': refresh_policy.sample_rate,
+            'salt': refresh_policy.salt,
+            'now': refresh_policy.now or time.time(),
+        }
+
+    # Snapshot the starting cache so the replay sees exactly what this run saw
+    nutrition_cache = menu_scraper._load_nutrition_cache(use_cache, cache_file=cache_file)
+    fixture_path = os.path.join(directory, NUTRITION_FILE)
+    save_nutrition_store(fixture_path, nutrition_cache, pinned=True)
+
+    with open(os.path.join(directory, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    work_dir = tempfile.mkdtemp(prefix='scrape-record-')
+    try:
+        work_cache = os.path.join(work_dir, NUTRITION_FILE)
+        shutil.copyfile(fixture_path, work_cache)
+        items, snapshots = _run(manifest, RecordingSession(directory), work_cache)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    write_artifact(os.path.join(directory, OUTPUT_FILE), items, snapshots,
+                   start_date=manifest['start_date'], days=days_ahead)
+    print(f"Recorded run in {directory}")
+    return items, snapshots
+
+
+def _normalized(items, snapshots):
+    """Items and snapshots as they round-trip through an artifact, for comparison."""
+    items = json.loads(json.dumps(items))
+    snapshots = [
+        {k: v for k, v in snapshot.items() if k != 'next_appearances'}
+        for snapshot in json.loads(json.dumps(snapshots))
+    ]
+    return items, snapshots
+
+
+def replay_run(directory):
+    """
+    Replay a recorded scrape offline and compare it with the recorded output.
+
+    Returns:
+        (items, snapshots, matches) where matches is None if no output was recorded
+    """
+    with open(os.path.join(directory, MANIFEST_FILE), encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    # Replays never touch the database, even for the nutrition cache fallback
+    os.environ.pop('DATABASE_URL', None)
+
+    session = ReplaySession(directory)
+    work_dir = tempfile.mkdtemp(prefix='scrape-replay-')
+    started = time.monotonic()
+    try:
+        work_cache = os.path.join(work_dir, NUTRITION_FILE)
+        shutil.copyfile(os.path.join(directory, NUTRITION_FILE), work_cache)
+        items, snapshots = _run(manifest, session, work_cache)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\nReplayed {manifest['days']} day(s) from {manifest['start_date']} "
+          f"in {time.monotonic() - started:.2f}s: {len(items)} items, {len(snapshots)} snapshots")
+    if session.misses:
+        print(f"WARNING: {len(session.misses)} request(s) had no recording, e.g. {session.misses[0]}")
+
+    output_path = os.path.join(directory, OUTPUT_FILE)
+    if not os.path.exists(output_path):
+        return items, snapshots, None
+
+    _, recorded_items, recorded_snapshots = read_artifact(output_path)
+    replayed_items, replayed_snapshots = _normalized(items, snapshots)
+    matches = replayed_items == recorded_items and replayed_snapshots == recorded_snapshots
+    if matches:
+        print("Replay output matches the recorded run")
+    else:
+        print(f"Replay output differs from the recorded run: "
+              f"{len(replayed_items)}/{len(recorded_items)} items, "
+              f"{len(replayed_snapshots)}/{len(recorded_snapshots)} snapshots (replayed/recorded)")
+    return items, snapshots, matches
@@ -0,0 +1,228 @@
+"""
+Structured opening hours for retail locations.
+
+CampusDish only gives HoursOfOperations as free text ("Mon - Fri: 7:00 AM -
+2:00 PM<br/>Sat - Sun: Closed"), and its IsOpenNow flag is stale minutes after
+a scrape. parse_hours() turns the text into weekly intervals when locations
+are ingested: [start, end) pairs of minutes since Monday 00:00 campus time,
+sorted and merged, with overnight hours split at the end of the week. They are
+stored in retail_locations.hours_intervals (NULL when the text has no hours
+the parser recognizes).
+
+OpenHoursIndex answers "which locations are open at time T" from those
+intervals with one bisect, without looking at the text again.
+"""
+
+import bisect
+import re
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+CAMPUS_TZ = ZoneInfo('America/Indiana/Indianapolis')
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+_DAY_NAMES = {
+    'mon': 0, 'monday': 0,
+    'tue': 1, 'tues': 1, 'tuesday': 1,
+    'wed': 2, 'weds': 2, 'wednesday': 2,
+    'thu': 3, 'thur': 3, 'thurs': 3, 'thursday': 3,
+    'fri': 4, 'friday': 4,
+    'sat': 5, 'saturday': 5,
+    'sun': 6, 'sunday': 6,
+}
+_DAY_GROUPS = {
+    'daily': range(7), 'everyday': range(7), 'every day': range(7),
+    'weekdays': range(5), 'weekends': (5, 6), 'weekend': (5, 6),
+}
+
+_DAY = r'(?:' + '|'.join(sorted(_DAY_NAMES, key=len, reverse=True)) + r')s?\.?'
+_DAY_RANGE = _DAY + r'(?:\s*(?:-|to|through|thru)\s*' + _DAY + r')?'
+_DAY_GROUP = r'(?:' + '|'.join(sorted(_DAY_GROUPS, key=len, reverse=True)) + r')'
+_DAYS = r'(?:' + _DAY_GROUP + r'|' + _DAY_RANGE + r'(?:\s*(?:,|&|and|/)\s*' + _DAY_RANGE + r')*)'
+_TIME = r'(?:noon|midnight|\d{1,2}(?::\d{2})?(?:\s*(?:am|pm|a|p)(?![a-z]))?)'
+
+_TOKEN = re.compile(
+    r'\b(?P<days>' + _DAYS + r')(?![a-z])'
+    r'|(?P<closed>\bclosed\b)'
+    r'|(?P<allday>\b(?:open\s+)?24\s*(?:hours|hrs)\b)'
+    r'|(?P<start>' + _TIME + r')\s*(?:-|to|until|till)\s*(?P<end>' + _TIME + r')'
+)
+_CLOCK = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a|p)?$')
+
+
+def _day_number(name):
+    """0-6 for a day name or abbreviation, allowing a plural ("Saturdays")."""
+    name = name.rstrip('.')
+    if name not in _DAY_NAMES and name.endswith('s'):
+        name = name[:-1]
+    return _DAY_NAMES[name]
+
+
+def _day_set(spec):
+    """Days of the week (0 = Monday) named by one day specification."""
+    spec = spec.strip().rstrip('.')
+    if spec in _DAY_GROUPS:
+        return set(_DAY_GROUPS[spec])
+
+    days = set()
+    for part in re.split(r'\s*(?:,|&|\band\b|/)\s*', spec):
+        bounds = [_day_number(name) for name in re.split(r'\s*(?:-|\bto\b|\bthrough\b|\bthru\b)\s*', part) if name]
+        if not bounds:
+            continue
+        first, last = bounds[0], bounds[-1]
+        day = first
+        days.add(day)
+        while day != last:
+            day = (day + 1) % 7
+            days.add(day)
+    return days
+
+
+def _clock_minutes(text, meridiem=None):
+    """
+    Minutes after midnight for a time like '7', '7:30pm' or 'noon'.
+
+    Returns:
+        (minutes, meridiem) where meridiem is 'am', 'pm' or None if the text
+        had none and none was passed in
+    """
+    if text == 'noon':
+        return 12 * 60, 'pm'
+    if text == 'midnight':
+        return 0, 'am'
+
+    hour, minute, suffix = _CLOCK.match(text).groups()
+    hour, minute = int(hour), int(minute or 0)
+    suffix = {'a': 'am', 'p': 'pm'}.get(suffix, suffix) or meridiem
+    if suffix == 'am' and hour == 12:
+        hour = 0
+    elif suffix == 'pm' and hour < 12:
+        hour += 12
+    return hour * 60 + minute, suffix
+
+
+def _time_range(start_text, end_text):
+    """(start, end) minutes after midnight; end may pass 1440 for overnight hours."""
+    end, end_meridiem = _clock_minutes(end_text)
+    start, start_meridiem = _clock_minutes(start_text)
+    if start_meridiem is None and end_meridiem is not None:
+        # "11-2pm": the start takes the end's meridiem unless that puts it after the end
+        start, _ = _clock_minutes(start_text, end_meridiem)
+        if start > end and end_meridiem == 'pm':
+            start, _ = _clock_minutes(start_text, 'am')
+    if end <= start:
+        end += MINUTES_PER_DAY
+    return start, end
+
+
+def merge_intervals(intervals):
+    """Sort [start, end) week-minute intervals, split those past the end of the week and merge overlaps."""
+    pieces = []
+    for start, end in intervals:
+        if end > MINUTES_PER_WEEK:
+            pieces.append((start, MINUTES_PER_WEEK))
+            pieces.append((0, end - MINUTES_PER_WEEK))
+        else:
+            pieces.append((start, end))
+
+    merged = []
+    for start, end in sorted(pieces):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def parse_hours(text):
+    """
+    Parse free-text opening hours into weekly intervals.
+
+    Day specifications ("Mon - Fri", "Sat & Sun", "Daily", "Weekends") apply to
+    the time ranges, "Closed" or "24 hours" that follow them; ranges before any
+    day apply to every day. Times may use am/pm, "noon" and "midnight"; a
+    range ending at or before its start runs past midnight.
+
+    Args:
+        text: HoursOfOperations from CampusDish
+
+    Returns:
+        Sorted, merged [start, end) minute-of-week intervals (an empty list
+        means closed all week), or None when no hours were recognized
+    """
+    if not text:
+        return None
+
+    normalized = re.sub(r'<[^>]+>', '\n', text).lower()
+    normalized = normalized.replace('–', '-').replace('—', '-')
+    normalized = re.sub(r'\b([ap])\.m\.?', r'\1m', normalized)
+
+    intervals = []
+    recognized = False
+    days = set(range(7))
+    for token in _TOKEN.finditer(normalized):
+        if token.group('days'):
+            days = _day_set(token.group('days'))
+            continue
+
+        recognized = True
+        if token.group('closed'):
+            continue
+        if token.group('allday'):
+            start, end = 0, MINUTES_PER_DAY
+        else:
+            start, end = _time_range(token.group('start').strip(), token.group('end').strip())
+        for day in days:
+            intervals.append((day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + end))
+
+    if not recognized:
+        return None
+    return merge_intervals(intervals)
+
+
+def minute_of_week(when=None):
+    """Minutes since Monday 00:00 campus time for when (default now; naive datetimes are campus time)."""
+    if when is None:
+        when = datetime.now(CAMPUS_TZ)
+    elif when.tzinfo is None:
+        when = when.replace(tzinfo=CAMPUS_TZ)
+    else:
+        when = when.astimezone(CAMPUS_TZ)
+    return when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+
+
+class OpenHoursIndex:
+    """
+    Which locations are open at any minute of the week.
+
+    The week is cut at every interval boundary; each segment keeps the ids of
+    the locations open throughout it, so a lookup is one bisect.
+    """
+
+    def __init__(self, locations):
+        """
+        Args:
+            locations: Iterable of (location_id, intervals) with intervals from
+                parse_hours(); None intervals are skipped
+        """
+        changes = {0: {}, MINUTES_PER_WEEK: {}}
+        for location_id, intervals in locations:
+            for start, end in intervals or ():
+                changes.setdefault(start, {})
+                changes.setdefault(end, {})
+                changes[start][location_id] = changes[start].get(location_id, 0) + 1
+                changes[end][location_id] = changes[end].get(location_id, 0) - 1
+
+        self.bounds = sorted(changes)
+        self.open_sets = []
+        counts = {}
+        for bound in self.bounds:
+            for location_id, delta in changes[bound].items():
+                counts[location_id] = counts.get(location_id, 0) + delta
+            self.open_sets.append(frozenset(location_id for location_id, n in counts.items() if n > 0))
+
+    def open_at(self, when=None):
+        """Ids of the locations open at when (a datetime, default now)."""
+        minute = minute_of_week(when)
+        return self.open_sets[bisect.bisect_right(self.bounds, minute) - 1]
@@ -2,12 +2,13 @@
 Retail Menu Scraper - Automated updates for Food Co locations
 
 This script updates menu data for Purdue Food Co retail locations:
-1. Chain restaurants: Re-scrapes from chain_scrapers modules
+1. Chain restaurants: Re-syncs the chain_scrapers catalogs that changed
 2. PDF-based menus: Extracts and parses PDF menus from CampusDish
-3. Updates database with latest menu information
+3. Updates database with latest menu information, rewriting only rows that
+   changed, in one transaction per run
 
 Usage:
-    python retail_menu_scraper.py [--chains-only] [--pdfs-only] [--location LOCATION_ID]
+    python retail_menu_scraper.py [--chains-only] [--pdfs-only] [--location LOCATION_ID] [--force]
 """
 
 import sys
@@ -20,72 +21,15 @@ from datetime import datetime
 import psycopg2
 from psycopg2.extras import execute_values
 
-# Import chain scrapers
-from chain_scrapers import (
-    get_panera_items,
-    get_qdoba_items,
-    get_jersey_mikes_items,
-    get_starbucks_items,
-    get_dining_court_beverage_items,
-    get_quick_bites_beverage_items,
-    DINING_COURTS,
-    QUICK_BITES_LOCATIONS,
-)
+from scraper.capacity_guard import CapacityGuard
+from scraper.chain_catalog import CATALOGS, RETAIL_MENU_DATE, content_hash, menu_item_macros
+from scraper.migrations import ensure_schema
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-
-def parse_bytes_env(name):
-    value = os.getenv(name)
-    if not value:
-        return None
-    try:
-        n = int(value)
-        return n if n > 0 else None
-    except ValueError:
-        return None
-
-
-def strict_capacity_mode():
-    raw = (os.getenv('DB_CAPACITY_STRICT', 'true') or '').strip().lower()
-    return raw not in ('0', 'false', 'no', 'off')
-
-
-def check_db_capacity_guard(conn, stage):
-    max_bytes = (
-        parse_bytes_env('DB_CAPACITY_BYTES')
-        or parse_bytes_env('DATABASE_CAPACITY_BYTES')
-        or parse_bytes_env('POSTGRES_MAX_BYTES')
-    )
-    threshold_raw = os.getenv('DB_PAUSE_THRESHOLD_PERCENT', '95')
-    try:
-        threshold_percent = float(threshold_raw)
-    except ValueError:
-        threshold_percent = 95.0
-    if threshold_percent <= 0 or threshold_percent > 100:
-        threshold_percent = 95.0
-
-    if max_bytes is None:
-        if strict_capacity_mode():
-            raise RuntimeError(
-                'DB capacity guard is strict and no capacity limit is configured. '
-                'Set DB_CAPACITY_BYTES (or DATABASE_CAPACITY_BYTES/POSTGRES_MAX_BYTES).'
-            )
-        logger.warning('[db-guard] Capacity limit not configured; guard is running in non-strict mode.')
-        return
-
-    cursor = conn.cursor()
-    cursor.execute('SELECT pg_database_size(current_database())')
-    used_bytes = int(cursor.fetchone()[0])
-    cursor.close()
-
-    used_percent = (used_bytes / max_bytes) * 100.0
-    logger.info('[db-guard] %s: using %.2f%% (%s/%s bytes), threshold=%.2f%%', stage, used_percent, used_bytes, max_bytes, threshold_percent)
-    if used_percent >= threshold_percent:
-        raise RuntimeError(
-            f"DB capacity guard triggered at {used_percent:.2f}% (threshold {threshold_percent:.2f}%). Scraping paused."
-        )
+# Locations per template; menu_snapshot_rows derives row ids from the slot
+TEMPLATE_SLOTS = 64
 
 
 def get_db_connection():
@@ -96,152 +40,319 @@ def get_db_connection():
     return psycopg2.connect(db_url)
 
 
-def clear_location_menu(cursor, dining_court):
-    """Clear existing menu data for a specific location."""
-    cursor.execute(
-        "DELETE FROM menu_snapshots WHERE dining_court = %s AND source = 'retail'",
-        (dining_court,)
-    )
-    deleted = cursor.rowcount
-    logger.info(f"Cleared {deleted} existing items for {dining_court}")
-
-
-def insert_menu_items(cursor, items, dining_court):
-    """Insert menu items into database."""
-    menu_data = []
+def _wanted_rows(items, build_macros):
+    """Map each item's (name, station, meal_time) to (calories, macros, content_hash); the last item wins."""
+    wanted = {}
     for item in items:
-        menu_data.append((
-            '2099-01-01',  # Sentinel date for retail menus
-            item['name'],
-            item['calories'],
-            psycopg2.extras.Json({
-                'protein': item['protein'],
-                'carbs': item['carbs'],
-                'fats': item['fats']
-            }),
-            dining_court,
-            item['station'],
-            item['meal_time'],
-            'retail'
-        ))
-    
-    execute_values(
-        cursor,
+        macros = build_macros(item)
+        wanted[(item['name'], item['station'], item['meal_time'])] = (
+            item['calories'], macros, content_hash(item['calories'], macros)
+        )
+    return wanted
+
+
+def _plan_rows(wanted, existing):
+    """
+    Diff wanted rows against stored ones.
+
+    Args:
+        wanted: From _wanted_rows
+        existing: Dict mapping (name, station, meal_time) -> (id, content_hash)
+
+    Returns:
+        (ids of stored rows to delete, (name, station, meal_time, calories,
+        macros, content_hash) for each row to insert or rewrite, how many of
+        those already exist)
+    """
+    stale_ids = [row_id for key, (row_id, _) in existing.items() if key not in wanted]
+    changed = [key + row for key, row in wanted.items() if existing.get(key, (None, None))[1] != row[2]]
+    updated = sum(1 for row in changed if row[:3] in existing)
+    return stale_ids, changed, updated
+
+
+def sync_location_menu(cursor, items, dining_court, build_macros=menu_item_macros, guard=None):
+    """
+    Make the retail rows for one location match items, touching only rows that differ.
+
+    Rows are keyed by (name, station, meal_time). Stored rows missing from items
+    are deleted, new items are inserted, and existing rows are rewritten only
+    when their content_hash differs. Items repeating a key collapse to the last.
+
+    Args:
+        cursor: Cursor in the caller's transaction
+        items: Items from a chain_scrapers getter
+        dining_court: Location name stored in dining_court
+        build_macros: Builds the stored macros for an item
+        guard: CapacityGuard checked with the number of rows about to be written
+
+    Returns:
+        (inserted, updated, deleted, unchanged)
+    """
+    wanted = _wanted_rows(items, build_macros)
+    cursor.execute(
         """
-        INSERT INTO menu_snapshots 
-        (menu_date, name, calories, macros, dining_court, station, meal_time, source)
-        VALUES %s
+        SELECT id, name, station, meal_time, content_hash FROM menu_snapshots
+        WHERE menu_date = %s AND dining_court = %s AND source = 'retail'
         """,
-        menu_data,
-        template="(%s, %s, %s, %s, %s, %s, %s, %s)"
+        (RETAIL_MENU_DATE, dining_court)
     )
-    logger.info(f"Inserted {len(menu_data)} items for {dining_court}")
+    existing = {(name, station, meal_time): (row_id, row_hash)
+                for row_id, name, station, meal_time, row_hash in cursor.fetchall()}
+    stale_ids, changed, updated = _plan_rows(wanted, existing)
+
+    if guard is not None:
+        guard.check(f'before {dining_court}', pending_rows=len(changed))
+    if stale_ids:
+        cursor.execute("DELETE FROM menu_snapshots WHERE menu_date = %s AND id = ANY(%s)",
+                       (RETAIL_MENU_DATE, stale_ids))
+    if changed:
+        execute_values(
+            cursor,
+            """
+            INSERT INTO menu_snapshots
+            (menu_date, name, calories, macros, dining_court, station, meal_time, source, content_hash)
+            VALUES %s
+            ON CONFLICT (menu_date, dining_court, meal_time, station, name)
+            DO UPDATE SET
+                calories = EXCLUDED.calories,
+                macros = EXCLUDED.macros,
+                nutrition_id = EXCLUDED.nutrition_id,
+                source = EXCLUDED.source,
+                content_hash = EXCLUDED.content_hash,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE menu_snapshots.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            """,
+            [
+                (RETAIL_MENU_DATE, name, calories, psycopg2.extras.Json(macros), dining_court, station, meal_time,
+                 'retail', row_hash)
+                for name, station, meal_time, calories, macros, row_hash in changed
+            ],
+            template="(%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+        )
 
+    return len(changed) - updated, updated, len(stale_ids), len(wanted) - len(changed)
 
-def insert_beverage_items(cursor, items, dining_court):
-    """Insert beverage items with full macros into database."""
-    menu_data = []
-    for item in items:
-        macros = {
-            'protein': item['protein'],
-            'carbs': item['carbs'],
-            'fats': item['fats'],
-            'saturated_fat': item.get('saturated_fat', 0),
-            'cholesterol': item.get('cholesterol', 0),
-            'sodium': item.get('sodium', 0),
-            'fiber': item.get('fiber', 0),
-            'sugar': item.get('sugar', 0),
-            'added_sugar': item.get('added_sugar', 0),
-            'is_vegetarian': item.get('is_vegetarian', False),
-            'is_vegan': item.get('is_vegan', False),
-            'allergens': item.get('allergens', []),
-            'ingredients': item.get('ingredients', ''),
-            'serving_size': item.get('serving_size', ''),
-        }
-        menu_data.append((
-            '2099-01-01',
-            item['name'],
-            item['calories'],
-            psycopg2.extras.Json(macros),
-            dining_court,
-            item['station'],
-            item['meal_time'],
-            'retail'
-        ))
-
-    execute_values(
-        cursor,
+
+def sync_menu_template(cursor, items, template_name, locations, build_macros=menu_item_macros, guard=None):
+    """
+    Store a menu shared by several locations once, as a template linked to each of them.
+
+    Template items are diffed like sync_location_menu diffs a location, then the
+    links are made to match locations. Per-location retail rows that repeat a
+    template item at a linked location (written before templates existed) are
+    deleted, since menu_snapshot_rows already returns them from the template.
+
+    Args:
+        cursor: Cursor in the caller's transaction
+        items: Items from a chain_scrapers getter
+        template_name: menu_templates.name
+        locations: Location names that serve the template
+        build_macros: Builds the stored macros for an item
+        guard: CapacityGuard checked with the number of rows about to be written
+
+    Returns:
+        (inserted, updated, deleted, unchanged) for the template's items
+
+    Raises:
+        ValueError: If locations has more than TEMPLATE_SLOTS entries
+    """
+    locations = list(dict.fromkeys(locations))
+    if len(locations) > TEMPLATE_SLOTS:
+        raise ValueError(
+            f"Template {template_name} lists {len(locations)} locations; at most {TEMPLATE_SLOTS} are supported"
+        )
+
+    cursor.execute("INSERT INTO menu_templates (name) VALUES (%s) ON CONFLICT (name) DO NOTHING", (template_name,))
+    cursor.execute("SELECT id FROM menu_templates WHERE name = %s", (template_name,))
+    template_id = cursor.fetchone()[0]
+
+    wanted = _wanted_rows(items, build_macros)
+    cursor.execute(
+        "SELECT id, name, station, meal_time, content_hash FROM menu_template_items WHERE template_id = %s",
+        (template_id,)
+    )
+    existing = {(name, station, meal_time): (row_id, row_hash)
+                for row_id, name, station, meal_time, row_hash in cursor.fetchall()}
+    stale_ids, changed, updated = _plan_rows(wanted, existing)
+
+    cursor.execute("SELECT dining_court, slot FROM menu_template_locations WHERE template_id = %s", (template_id,))
+    linked = dict(cursor.fetchall())
+    unlinked = [court for court in linked if court not in locations]
+    free_slots = iter(sorted(
+        set(range(TEMPLATE_SLOTS)) - {slot for court, slot in linked.items() if court in locations}
+    ))
+    new_links = [(template_id, court, next(free_slots)) for court in locations if court not in linked]
+
+    if guard is not None:
+        guard.check(f'before template {template_name}', pending_rows=len(changed) + len(new_links))
+    if stale_ids:
+        cursor.execute("DELETE FROM menu_template_items WHERE id = ANY(%s)", (stale_ids,))
+    if changed:
+        execute_values(
+            cursor,
+            """
+            INSERT INTO menu_template_items
+            (template_id, name, calories, macros, station, meal_time, content_hash)
+            VALUES %s
+            ON CONFLICT (template_id, meal_time, station, name)
+            DO UPDATE SET
+                calories = EXCLUDED.calories,
+                macros = EXCLUDED.macros,
+                nutrition_id = EXCLUDED.nutrition_id,
+                content_hash = EXCLUDED.content_hash,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE menu_template_items.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            """,
+            [
+                (template_id, name, calories, psycopg2.extras.Json(macros), station, meal_time, row_hash)
+                for name, station, meal_time, calories, macros, row_hash in changed
+            ],
+            template="(%s, %s, %s, %s, %s, %s, %s)"
+        )
+    if unlinked:
+        cursor.execute(
+            "DELETE FROM menu_template_locations WHERE template_id = %s AND dining_court = ANY(%s)",
+            (template_id, unlinked)
+        )
+    if new_links:
+        execute_values(
+            cursor,
+            "INSERT INTO menu_template_locations (template_id, dining_court, slot) VALUES %s",
+            new_links
+        )
+    if unlinked or new_links:
+        logger.info(f"{template_name}: linked {len(new_links)} locations, unlinked {len(unlinked)}")
+
+    cursor.execute(
         """
-        INSERT INTO menu_snapshots
-        (menu_date, name, calories, macros, dining_court, station, meal_time, source)
-        VALUES %s
+        DELETE FROM menu_snapshots s
+        USING menu_template_items i
+        JOIN menu_template_locations l ON l.template_id = i.template_id
+        WHERE i.template_id = %s
+          AND s.menu_date = %s AND s.source = 'retail'
+          AND s.dining_court = l.dining_court AND s.name = i.name
+          AND s.station IS NOT DISTINCT FROM i.station
+          AND s.meal_time IS NOT DISTINCT FROM i.meal_time
         """,
-        menu_data,
-        template="(%s, %s, %s, %s, %s, %s, %s, %s)"
+        (template_id, RETAIL_MENU_DATE)
     )
-    logger.info(f"Inserted {len(menu_data)} beverage items for {dining_court}")
+    if cursor.rowcount:
+        logger.info(f"{template_name}: removed {cursor.rowcount} per-location copies of template items")
 
+    return len(changed) - updated, updated, len(stale_ids), len(wanted) - len(changed)
 
-def update_chain_restaurants(conn):
-    """Update menu data for chain restaurants."""
-    logger.info("Updating chain restaurant menus...")
-    check_db_capacity_guard(conn, 'before chain restaurant update')
 
-    chains = [
-        ("Panera", get_panera_items),
-        ("Qdoba", get_qdoba_items),
-        ("Jersey Mike's", get_jersey_mikes_items),
-        ("Starbucks @ MSEE", get_starbucks_items),
-        ("Starbucks @ Winifred Parker Hall", get_starbucks_items),
-    ]
+def update_in_savepoint(cursor, label, sync, *args):
+    """
+    Run sync(cursor, *args) inside a savepoint, so a failure only discards
+    that location's (or template's) changes and the run's transaction carries on.
+
+    Returns:
+        True if the update succeeded
+    """
+    cursor.execute("SAVEPOINT retail_update")
+    try:
+        inserted, updated, deleted, unchanged = sync(cursor, *args)
+        cursor.execute("RELEASE SAVEPOINT retail_update")
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT retail_update")
+        logger.error(f"✗ Failed to update {label}: {e}")
+        return False
+
+    logger.info(f"✓ {label}: {inserted} inserted, {updated} updated, {deleted} deleted, {unchanged} unchanged")
+    return True
+
+
+def applied_catalog_hashes(cursor):
+    """{catalog name: content_hash} recorded by earlier runs."""
+    cursor.execute("SELECT name, content_hash FROM chain_catalog_versions")
+    return dict(cursor.fetchall())
 
-    cursor = conn.cursor()
 
-    for dining_court, scraper_func in chains:
-        try:
-            check_db_capacity_guard(conn, f'before {dining_court}')
-            logger.info(f"Processing {dining_court}...")
-            items = scraper_func()
-
-            clear_location_menu(cursor, dining_court)
-            insert_menu_items(cursor, items, dining_court)
-
-            conn.commit()
-            logger.info(f"✓ Successfully updated {dining_court}")
-
-        except Exception as e:
-            logger.error(f"✗ Failed to update {dining_court}: {e}")
-            conn.rollback()
-
-    # Add beverages to all dining courts
-    beverage_items = get_dining_court_beverage_items()
-    for court in DINING_COURTS:
-        try:
-            check_db_capacity_guard(conn, f'before beverages {court}')
-            logger.info(f"Adding beverages to {court}...")
-            clear_location_menu(cursor, court)
-            insert_beverage_items(cursor, beverage_items, court)
-            conn.commit()
-            logger.info(f"✓ Successfully added beverages to {court}")
-        except Exception as e:
-            logger.error(f"✗ Failed to add beverages to {court}: {e}")
-            conn.rollback()
-
-    # Add beverages to Quick Bites locations (fountain drinks + water, no milk)
-    quick_bites_beverage_items = get_quick_bites_beverage_items()
-    for location in QUICK_BITES_LOCATIONS:
-        try:
-            check_db_capacity_guard(conn, f'before quick bites beverages {location}')
-            logger.info(f"Adding beverages to {location}...")
-            clear_location_menu(cursor, location)
-            insert_beverage_items(cursor, quick_bites_beverage_items, location)
-            conn.commit()
-            logger.info(f"✓ Successfully added beverages to {location}")
-        except Exception as e:
-            logger.error(f"✗ Failed to add beverages to {location}: {e}")
-            conn.rollback()
-
-    cursor.close()
+def catalog_stored(cursor, catalog):
+    """Whether the catalog's template, or retail rows for one of its locations, is stored."""
+    if catalog.template:
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM menu_templates t
+                JOIN menu_template_items i ON i.template_id = t.id
+                WHERE t.name = %s
+            )
+        """, (catalog.name,))
+    else:
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM menu_snapshots
+                WHERE menu_date = %s AND source = 'retail' AND dining_court = ANY(%s)
+            )
+        """, (RETAIL_MENU_DATE, catalog.locations()))
+    return cursor.fetchone()[0]
+
+
+def sync_catalog(cursor, catalog, guard=None):
+    """
+    Sync one catalog: its template, or each of its locations.
+
+    Returns:
+        (inserted, updated, deleted, unchanged) summed over the catalog
+    """
+    items = catalog.items()
+    if catalog.template:
+        return sync_menu_template(
+            cursor, items, catalog.name, catalog.locations(), catalog.build_macros, guard
+        )
+
+    totals = (0, 0, 0, 0)
+    for dining_court in catalog.locations():
+        counts = sync_location_menu(cursor, items, dining_court, catalog.build_macros, guard)
+        totals = tuple(total + count for total, count in zip(totals, counts))
+    return totals
+
+
+def update_chain_restaurants(conn, guard=None, force=False):
+    """
+    Update menu data for chain restaurants and retail beverages.
+
+    Catalogs whose content hash matches the one recorded in
+    chain_catalog_versions, and whose rows are still stored, are skipped
+    without touching their rows; force syncs them all. Every other catalog is diffed against its stored rows, and
+    the whole run is committed once at the end.
+    """
+    logger.info("Updating chain restaurant menus...")
+    guard = guard or CapacityGuard.from_env(conn=conn, log=logger.info)
+    guard.check('before chain restaurant update')
+
+    cursor = conn.cursor()
+    try:
+        applied = applied_catalog_hashes(cursor)
+        for catalog in CATALOGS:
+            try:
+                digest = catalog.content_hash()
+            except Exception as e:
+                logger.error(f"✗ Failed to update {catalog.name}: {e}")
+                continue
+            if not force and applied.get(catalog.name) == digest and catalog_stored(cursor, catalog):
+                logger.info(f"{catalog.name}: unchanged since last sync, skipping")
+                continue
+
+            logger.info(f"Processing {catalog.name}...")
+            if update_in_savepoint(cursor, catalog.name, sync_catalog, catalog, guard):
+                cursor.execute(
+                    """
+                    INSERT INTO chain_catalog_versions (name, content_hash) VALUES (%s, %s)
+                    ON CONFLICT (name) DO UPDATE
+                    SET content_hash = EXCLUDED.content_hash, applied_at = CURRENT_TIMESTAMP
+                    """,
+                    (catalog.name, digest)
+                )
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    guard.report()
 
 
 def update_pdf_menus(conn):
@@ -256,18 +367,21 @@ def main():
     parser.add_argument('--chains-only', action='store_true', help='Only update chain restaurants')
     parser.add_argument('--pdfs-only', action='store_true', help='Only update PDF-based menus')
     parser.add_argument('--location', help='Update specific location only')
+    parser.add_argument('--force', action='store_true', help='Sync chain catalogs even if they are unchanged')
     
     args = parser.parse_args()
     
     try:
         conn = get_db_connection()
         logger.info("Connected to database")
-        check_db_capacity_guard(conn, 'startup')
+        ensure_schema(os.getenv('DATABASE_URL'))
+        guard = CapacityGuard.from_env(conn=conn, log=logger.info)
+        guard.check('startup')
         
         if args.pdfs_only:
             update_pdf_menus(conn)
         elif args.chains_only or not args.pdfs_only:
-            update_chain_restaurants(conn)
+            update_chain_restaurants(conn, guard, force=args.force)
         
         conn.close()
         logger.info("Retail menu update completed successfully")
@@ -4,15 +4,22 @@ Scraper for Purdue Food Co (CampusDish) retail dining locations.
 Fetches location metadata (name, address, hours, open status) from the
 CampusDish API at purdue.campusdish.com.  These retail locations don't
 expose per-item nutrition data through public APIs, so only location
-info is persisted.
+info is persisted.  Hours are also parsed into weekly intervals (see
+scraper/retail_hours.py) so "open now" can be answered at any time.
 """
 
 import requests
 import re
 import json
 import os
+import sys
 import psycopg2
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.migrations import ensure_schema
+from scraper.retail_hours import parse_hours
+
 CAMPUSDISH_BASE = "https://purdue.campusdish.com"
 LOCATIONS_ENDPOINT = "/api/locations/GetLocations"
 
@@ -31,7 +38,8 @@ def fetch_retail_locations():
 
     Returns:
         list of dicts with keys: id, name, url, address, city_state_zip,
-        hours, is_open, is_food_court, child_locations, description
+        hours, hours_intervals, is_open, is_food_court, child_locations,
+        description
     """
     session = requests.Session()
     session.verify = False
@@ -86,6 +94,7 @@ def fetch_retail_locations():
             "address": address,
             "city_state_zip": global_addr,
             "hours": hours,
+            "hours_intervals": parse_hours(hours),
             "is_open": is_open,
             "is_food_court": is_food_court,
             "child_locations": child_names,
@@ -97,7 +106,7 @@ def fetch_retail_locations():
 def save_retail_locations(locations, database_url=None):
     """
     Save retail location metadata into the retail_locations table.
-    Creates the table if it doesn't exist.
+    Applies pending schema migrations first (see scraper/migrations.py).
     """
     if not database_url:
         database_url = os.getenv("DATABASE_URL")
@@ -107,43 +116,32 @@ def save_retail_locations(locations, database_url=None):
     if database_url.startswith("postgres://"):
         database_url = database_url.replace("postgres://", "postgresql://", 1)
 
+    ensure_schema(database_url)
+
     conn = psycopg2.connect(database_url)
     cursor = conn.cursor()
 
-    # Ensure table exists
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS retail_locations (
-            id VARCHAR(20) PRIMARY KEY,
-            name VARCHAR(255) NOT NULL,
-            url VARCHAR(512),
-            address VARCHAR(255),
-            city_state_zip VARCHAR(255),
-            hours VARCHAR(255),
-            is_open BOOLEAN DEFAULT FALSE,
-            is_food_court BOOLEAN DEFAULT FALSE,
-            child_locations JSONB,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
     upserted = 0
     for loc in locations:
         cursor.execute("""
-            INSERT INTO retail_locations (id, name, url, address, city_state_zip, hours, is_open, is_food_court, child_locations, updated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+            INSERT INTO retail_locations (id, name, url, address, city_state_zip, hours, hours_intervals, is_open, is_food_court, child_locations, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
             ON CONFLICT (id) DO UPDATE SET
                 name = EXCLUDED.name,
                 url = EXCLUDED.url,
                 address = EXCLUDED.address,
                 city_state_zip = EXCLUDED.city_state_zip,
                 hours = EXCLUDED.hours,
+                hours_intervals = EXCLUDED.hours_intervals,
                 is_open = EXCLUDED.is_open,
                 is_food_court = EXCLUDED.is_food_court,
                 child_locations = EXCLUDED.child_locations,
                 updated_at = CURRENT_TIMESTAMP
         """, (
             loc["id"], loc["name"], loc["url"], loc["address"],
-            loc["city_state_zip"], loc["hours"], loc["is_open"],
+            loc["city_state_zip"], loc["hours"],
+            json.dumps(loc["hours_intervals"]) if loc["hours_intervals"] is not None else None,
+            loc["is_open"],
             loc["is_food_court"], json.dumps(loc["child_locations"]),
         ))
         upserted += 1
@@ -171,6 +169,8 @@ def main():
         print(f"  [{status:6s}] {loc['name']}")
         if loc["hours"]:
             print(f"           Hours: {loc['hours']}")
+            if loc["hours_intervals"] is None:
+                print("           (hours not recognized; open-now lookups will skip this location)")
 
     print("\nSaving to database...")
     count = save_retail_locations(locations)
@@ -0,0 +1,105 @@
+"""
+Checksum-tracked seed files.
+
+init_db.py used to split every seed file on ';' and run each statement on its
+own, re-applying all of them on every bootstrap. apply_seed_files() records the
+SHA-256 of each file it applies in the seed_files table and skips files whose
+content has not changed, so a redeploy with the same seeds costs one lookup.
+
+A changed file runs whole, as a single execute in one transaction together
+with its new checksum: the seeds are written as multi-row INSERTs, so a file
+goes to the server in one round trip and either applies completely or not at
+all. Seed files must therefore be safe to re-run after they change (delete
+what they replace, or insert with ON CONFLICT / WHERE NOT EXISTS).
+"""
+
+import hashlib
+import os
+
+# Arbitrary application-wide key for pg_advisory_lock, next to the migrations'
+SEED_LOCK_KEY = 4275002
+
+
+def file_checksum(path):
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _has_statements(sql):
+    """False for a file of only comments and blank lines, which psycopg2 refuses to execute."""
+    return any(line.strip() and not line.strip().startswith('--') for line in sql.splitlines())
+
+
+def applied_checksums(cursor):
+    """{filename: checksum} of applied seeds, or {} when seed_files does not exist yet."""
+    cursor.execute("SELECT to_regclass('seed_files') IS NOT NULL")
+    if not cursor.fetchone()[0]:
+        return {}
+    cursor.execute("SELECT filename, checksum FROM seed_files")
+    return dict(cursor.fetchall())
+
+
+def apply_seed_files(conn, paths, force=False):
+    """
+    Apply seed files that are new or changed since they were last applied.
+
+    Args:
+        conn: psycopg2 connection that is not in a transaction
+        paths: Seed file paths in the order they should run; missing files are skipped
+        force: Apply every file even when its checksum matches
+
+    Returns:
+        List of paths applied by this call
+    """
+    applied = []
+    cursor = conn.cursor()
+
+    conn.commit()
+    cursor.execute("SELECT pg_advisory_lock(%s)", (SEED_LOCK_KEY,))
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS seed_files (
+                filename VARCHAR(255) PRIMARY KEY,
+                checksum CHAR(64) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+
+        # Read under the lock: another runner may have just finished
+        checksums = applied_checksums(cursor)
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            filename = os.path.basename(path)
+            checksum = file_checksum(path)
+            if not force and checksums.get(filename) == checksum:
+                print(f"Seed {filename} unchanged, skipping.")
+                continue
+
+            with open(path, 'r', encoding='utf-8') as f:
+                sql = f.read()
+            print(f"Applying seed {filename}...")
+            try:
+                if _has_statements(sql):
+                    cursor.execute(sql)
+                cursor.execute("""
+                    INSERT INTO seed_files (filename, checksum) VALUES (%s, %s)
+                    ON CONFLICT (filename) DO UPDATE
+                    SET checksum = EXCLUDED.checksum, applied_at = CURRENT_TIMESTAMP
+                """, (filename, checksum))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(path)
+    finally:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", (SEED_LOCK_KEY,))
+        conn.commit()
+        cursor.close()
+
+    return applied
@@ -0,0 +1,113 @@
+"""
+Benchmark the row-wise and bulk paths of save_to_database and save_menu_snapshots.
+
+Runs in a throwaway schema so the real tables are never touched:
+
+    python scripts/bench_food_upsert.py --items 10000
+    python scripts/bench_food_upsert.py --target snapshots --items 20000
+
+Each mode runs twice against an empty table: a first pass that inserts every
+row, then a second pass that updates every row.
+"""
+
+import argparse
+import os
+import sys
+import time
+from urllib.parse import quote
+
+import psycopg2
+
+# Ensure scraper module is importable
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_root)
+
+from scraper.dining_locations import DINING_LOCATIONS
+from scraper.menu_scraper import save_menu_snapshots, save_to_database
+
+BENCH_SCHEMA = 'boilerfuel_bench'
+
+
+def synthetic_items(count):
+    """Build count distinct items spread over the real dining locations."""
+    meals = ('breakfast', 'lunch', 'late lunch', 'dinner')
+    items = []
+    for i in range(count):
+        court = DINING_LOCATIONS[i % len(DINING_LOCATIONS)]
+        items.append({
+            'name': f'Bench Item {i // len(DINING_LOCATIONS)}',
+            'calories': 100 + i % 500,
+            'protein': 10.0, 'carbs': 20.0, 'fats': 5.0,
+            'serving_size': '1 serving', 'saturated_fat': 1.0, 'cholesterol': 0.0, 'sodium': 200.0,
+            'fiber': 2.0, 'sugar': 3.0, 'added_sugar': 0.0,
+            'is_vegetarian': i % 2 == 0, 'is_vegan': False,
+            'allergens': ['Milk'], 'ingredients': 'Flour, water\tsalt',
+            'dining_court': court['display_name'],
+            'dining_court_code': court['code'],
+            'station': f'Station {i % 7}',
+            'meal_period': meals[i % len(meals)],
+            'next_appearances': [{'date': '2026-01-05', 'day_name': 'Monday', 'meal_time': meals[i % len(meals)]}],
+            'available_date': f'2026-01-{5 + i % 9:02d}',
+        })
+    return items
+
+
+def bench_url(database_url):
+    """The same database, with the bench schema first on the search_path."""
+    separator = '&' if '?' in database_url else '?'
+    return f"{database_url}{separator}options={quote(f'-csearch_path={BENCH_SCHEMA}')}"
+
+
+def reset_schema(database_url, drop_only=False):
+    conn = psycopg2.connect(database_url)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    cursor.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    if not drop_only:
+        cursor.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    cursor.close()
+    conn.close()
+
+
+def run_mode(database_url, items, bulk, target='foods'):
+    reset_schema(database_url)
+    url = bench_url(database_url)
+    timings = []
+    for _ in range(2):
+        started = time.monotonic()
+        if target == 'snapshots':
+            save_menu_snapshots(items, url, bulk=bulk)
+        else:
+            save_to_database(items, url, bulk=bulk)
+        timings.append(time.monotonic() - started)
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark save_to_database and save_menu_snapshots')
+    parser.add_argument('--target', choices=('foods', 'snapshots'), default='foods', help='Table to write (default: foods)')
+    parser.add_argument('--items', type=int, default=10000, help='Number of synthetic items (default: 10000)')
+    parser.add_argument('--skip-rowwise', action='store_true', help='Only time the bulk path')
+    args = parser.parse_args()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise SystemExit('Set DATABASE_URL to a database the benchmark may create a schema in')
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+
+    items = synthetic_items(args.items)
+    print(f"Benchmarking {args.target} writes with {len(items)} items in schema {BENCH_SCHEMA}")
+
+    try:
+        modes = [('bulk', True)] if args.skip_rowwise else [('row-wise', False), ('bulk', True)]
+        results = {}
+        for label, bulk in modes:
+            print(f"\n{label}:")
+            results[label] = run_mode(database_url, items, bulk, args.target)
+
+        print("\nmode        insert pass   update pass")
+        for label, (insert_s, update_s) in results.items():
+            print(f"{label:<10} {insert_s:>10.2f}s {update_s:>12.2f}s")
+    finally:
+        reset_schema(database_url, drop_only=True)
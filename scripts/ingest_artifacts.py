@@ -0,0 +1,188 @@
+"""
+Load one or more scrape artifacts into the database.
+
+Usage:
+    python scripts/ingest_artifacts.py ARTIFACT [ARTIFACT ...] [--workers N]
+                                       [--skip-foods] [--skip-snapshots]
+
+Items from all artifacts are merged, with their schedules combined and the
+newest artifact's nutrition kept. They are then written to foods by a single
+writer, because the foods upsert matches existing rows by name. While that runs,
+snapshots are loaded in parallel, one worker per menu date. Dates never share a
+menu_snapshots key, but every writer also upserts the shared food_components
+and nutrition_facts rows; those are written in key order, so concurrent writers
+wait on each other rather than deadlock.
+
+Exits non-zero if the foods write or any snapshot date fails.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Ensure scraper module is importable
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_root)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.artifacts import read_artifact
+from scraper.capacity_guard import CapacityGuard
+from scraper.db import close_all, transaction
+from scraper.migrations import ensure_schema
+from scraper.menu_scraper import (
+    _ensure_snapshot_partitions,
+    _schedule_key,
+    _write_menu_snapshots,
+    save_to_database,
+)
+from scrape_to_db import get_database_url_or_exit
+
+
+def load_artifacts(paths):
+    """
+    Read artifacts oldest first.
+
+    Returns:
+        List of (path, meta, items, snapshots)
+    """
+    loaded = []
+    for path in paths:
+        meta, items, snapshots = read_artifact(path)
+        print(f"Read {path}: {len(items)} items, {len(snapshots)} snapshots (created {meta.get('created_at')})")
+        loaded.append((path, meta, items, snapshots))
+    loaded.sort(key=lambda entry: entry[1].get('created_at') or '')
+    return loaded
+
+
+def merge_items(loaded):
+    """
+    Merge unique items across artifacts.
+
+    Later artifacts replace an item's nutrition; next_appearances from every
+    artifact are combined, deduplicated and sorted by date.
+    """
+    merged = {}
+    for _, _, items, _ in loaded:
+        for item in items:
+            key = _schedule_key(item)
+            previous = merged.get(key)
+            appearances = {}
+            for source in (previous, item):
+                for appearance in (source or {}).get('next_appearances') or []:
+                    appearances[(appearance.get('date'), appearance.get('meal_time'))] = appearance
+
+            item = dict(item)
+            if appearances:
+                item['next_appearances'] = sorted(appearances.values(), key=lambda a: a.get('date') or '')
+            merged[key] = item
+
+    return list(merged.values())
+
+
+def group_snapshots_by_date(loaded):
+    """
+    Group snapshot rows by menu date, keeping the newest row for each unique key.
+
+    Returns:
+        Dict of menu_date -> list of snapshot items
+    """
+    by_date = {}
+    for _, _, _, snapshots in loaded:
+        for snapshot in snapshots:
+            menu_date = snapshot.get('available_date') or snapshot.get('menu_date')
+            if not menu_date:
+                continue
+            key = (
+                snapshot.get('dining_court') or snapshot.get('dining_court_code') or 'Unknown',
+                snapshot.get('meal_period', 'Unknown') or 'Unknown',
+                snapshot.get('station'),
+                snapshot['name'],
+            )
+            by_date.setdefault(menu_date, {})[key] = snapshot
+
+    return {menu_date: list(rows.values()) for menu_date, rows in by_date.items()}
+
+
+def write_snapshot_date(database_url, menu_date, snapshots, source):
+    """Write one date's snapshot rows in its own transaction. Returns rows written."""
+    with transaction(database_url) as conn:
+        cursor = conn.cursor()
+        saved = _write_menu_snapshots(cursor, snapshots, source)
+        cursor.close()
+    return saved
+
+
+def ingest(paths, database_url, workers=4, skip_foods=False, skip_snapshots=False, source='api'):
+    """
+    Load artifacts into foods and menu_snapshots.
+
+    Returns:
+        Number of writes that failed: snapshot dates, plus one if the foods
+        write failed
+    """
+    loaded = load_artifacts(paths)
+    items = merge_items(loaded)
+    snapshots_by_date = group_snapshots_by_date(loaded)
+    total_snapshots = sum(len(rows) for rows in snapshots_by_date.values())
+    print(f"Merged {len(items)} unique items and {total_snapshots} snapshots across {len(snapshots_by_date)} dates")
+
+    guard = CapacityGuard.from_env(database_url=database_url, error_class=SystemExit)
+    guard.check('before artifact ingest', pending_rows=(0 if skip_foods else len(items)) + (0 if skip_snapshots else total_snapshots))
+
+    started = time.monotonic()
+    failures = 0
+    futures = {}
+
+    # Migrate and create partitions once up front rather than racing from every worker
+    ensure_schema(database_url)
+    if not skip_snapshots and snapshots_by_date:
+        with transaction(database_url) as conn:
+            cursor = conn.cursor()
+            _ensure_snapshot_partitions(cursor, snapshots_by_date)
+            cursor.close()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        if not skip_snapshots and snapshots_by_date:
+            for menu_date in sorted(snapshots_by_date):
+                future = executor.submit(write_snapshot_date, database_url, menu_date,
+                                         snapshots_by_date[menu_date], source)
+                futures[future] = menu_date
+
+        if not skip_foods and items:
+            # save_to_database reports its own error and returns None on failure
+            if save_to_database(items, database_url) is None:
+                failures += 1
+                print("  Error loading foods")
+
+        saved = 0
+        for future, menu_date in futures.items():
+            try:
+                saved += future.result()
+            except Exception as e:
+                failures += 1
+                print(f"  Error loading snapshots for {menu_date}: {e}")
+
+    if futures:
+        failed_dates = sum(1 for future in futures if future.exception() is not None)
+        print(f"  Snapshot rows saved: {saved} ({len(futures) - failed_dates}/{len(futures)} dates)")
+    print(f"Ingest finished in {time.monotonic() - started:.1f}s")
+    guard.report()
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load scrape artifacts into the database')
+    parser.add_argument('artifacts', nargs='+', help='Artifact files written by the scraper (*.ndjson.gz)')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent snapshot writers (default: 4)')
+    parser.add_argument('--skip-foods', action='store_true', help='Do not write the foods table')
+    parser.add_argument('--skip-snapshots', action='store_true', help='Do not write menu_snapshots')
+    args = parser.parse_args()
+
+    database_url = get_database_url_or_exit()
+    failed = ingest(args.artifacts, database_url, workers=args.workers,
+                    skip_foods=args.skip_foods, skip_snapshots=args.skip_snapshots)
+    close_all()
+    if failed:
+        raise SystemExit(f'{failed} write(s) failed to load; see the errors above')
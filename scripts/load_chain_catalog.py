@@ -0,0 +1,74 @@
+"""
+Load chain catalog artifacts into menu_snapshots.
+
+Usage:
+    python scripts/load_chain_catalog.py [PATH ...]
+
+Each PATH is an artifact written by scraper/generate_chain_sql.py or a
+directory of them (default: .artifacts/chain_catalog). All files are streamed
+in one COPY and merged in one transaction, so a failed load changes nothing.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+# Ensure scraper module is importable
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_root)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.chain_catalog import load_artifacts
+from scraper.db import close_all, transaction
+from scraper.migrations import ensure_schema
+from scrape_to_db import get_database_url_or_exit
+
+DEFAULT_ARTIFACT_DIR = os.path.join(repo_root, '.artifacts', 'chain_catalog')
+
+
+def artifact_paths(paths):
+    """Expand directories to the *.csv files in them, sorted."""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(glob.glob(os.path.join(path, '*.csv'))))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def load(paths, database_url):
+    """
+    Load artifacts in one transaction.
+
+    Returns:
+        (rows staged, rows written, stale rows deleted, rows served by a template)
+    """
+    started = time.monotonic()
+    ensure_schema(database_url)
+    with transaction(database_url) as conn:
+        cursor = conn.cursor()
+        stats = load_artifacts(cursor, paths)
+        cursor.close()
+
+    staged, written, deleted, templated = stats
+    print(f"Loaded {len(paths)} artifacts in {time.monotonic() - started:.1f}s: {staged} rows staged, "
+          f"{written} written, {deleted} stale deleted, {templated} left to templates")
+    return stats
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load chain catalog artifacts into menu_snapshots')
+    parser.add_argument('paths', nargs='*', default=[DEFAULT_ARTIFACT_DIR],
+                        help='Artifact files or directories (default: .artifacts/chain_catalog)')
+    args = parser.parse_args()
+
+    paths = artifact_paths(args.paths)
+    if not paths:
+        raise SystemExit('No chain catalog artifacts found')
+
+    database_url = get_database_url_or_exit()
+    load(paths, database_url)
+    close_all()
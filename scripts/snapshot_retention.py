@@ -0,0 +1,90 @@
+"""
+Retire old menu_snapshots partitions and create upcoming ones.
+
+Usage:
+    python scripts/snapshot_retention.py [--keep-days N] [--drop] [--dry-run]
+                                         [--premake-months N]
+
+menu_snapshots is partitioned by month (db/migrations/0005). Partitions whose
+whole month ended more than --keep-days ago are detached and compacted into
+menu_snapshot_history (one row per item per month), or dropped outright with
+--drop. Removing whole partitions frees the space immediately, where a DELETE
+would leave dead tuples behind. The retail partition (2099-01-01) is never
+touched.
+
+Partitions for the current and next --premake-months months are created ahead
+of time, so scraper writes do not have to create them.
+"""
+
+import argparse
+import os
+import sys
+from datetime import date
+
+# Ensure scraper module is importable
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_root)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scraper.db import close_all, transaction
+from scraper.migrations import ensure_schema
+from scraper.menu_scraper import _ensure_snapshot_partitions
+from scrape_to_db import get_database_url_or_exit
+
+DEFAULT_KEEP_DAYS = 7
+
+
+def upcoming_months(count, today=None):
+    """First day of the current month and the next count months, as YYYY-MM-DD strings."""
+    today = today or date.today()
+    months = []
+    year, month = today.year, today.month
+    for _ in range(count + 1):
+        months.append(f"{year:04d}-{month:02d}-01")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def retire_partitions(database_url, keep_days=DEFAULT_KEEP_DAYS, compact=True, dry_run=False, premake_months=2):
+    """
+    Apply the retention policy to menu_snapshots.
+
+    Returns:
+        List of (partition_name, range_end, row_count, action) for retired partitions
+    """
+    ensure_schema(database_url)
+
+    with transaction(database_url) as conn:
+        cursor = conn.cursor()
+        if not dry_run:
+            _ensure_snapshot_partitions(cursor, upcoming_months(premake_months))
+        cursor.execute(
+            "SELECT partition_name, range_end, row_count, action FROM retire_menu_snapshot_partitions(%s, %s, %s)",
+            (keep_days, compact, dry_run)
+        )
+        retired = cursor.fetchall()
+        cursor.close()
+
+    return retired
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Retire old menu_snapshots partitions')
+    parser.add_argument('--keep-days', type=int,
+                        default=int(os.getenv('SNAPSHOT_RETENTION_DAYS', DEFAULT_KEEP_DAYS)),
+                        help=f'Keep months that ended within this many days (default: {DEFAULT_KEEP_DAYS})')
+    parser.add_argument('--drop', action='store_true', help='Drop retired partitions instead of compacting them')
+    parser.add_argument('--dry-run', action='store_true', help='List the partitions that would be retired')
+    parser.add_argument('--premake-months', type=int, default=2,
+                        help='Months ahead to create partitions for (default: 2)')
+    args = parser.parse_args()
+
+    database_url = get_database_url_or_exit()
+    retired = retire_partitions(database_url, keep_days=args.keep_days, compact=not args.drop,
+                                dry_run=args.dry_run, premake_months=args.premake_months)
+    close_all()
+
+    if not retired:
+        print(f"No menu_snapshots partitions older than {args.keep_days} days")
+    for partition_name, range_end, row_count, action in retired:
+        print(f"  {partition_name} (ends {range_end}): {row_count} rows {action}")
@@ -0,0 +1,52 @@
+import os
+import sys
+import uuid
+from urllib.parse import quote
+
+import pytest
+
+# Tests import the scraper package from the repository root, like the scripts do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def database_url():
+    """DATABASE_URL of a reachable Postgres; tests using it are skipped otherwise."""
+    url = os.getenv('DATABASE_URL')
+    if not url:
+        pytest.skip('DATABASE_URL not set')
+    psycopg2 = pytest.importorskip('psycopg2')
+    try:
+        psycopg2.connect(url, connect_timeout=5).close()
+    except psycopg2.OperationalError as e:
+        pytest.skip(f'database not available: {e}')
+    return url
+
+
+@pytest.fixture
+def migrated_url(database_url):
+    """
+    URL of a throwaway schema with every migration applied, dropped afterwards.
+
+    The schema is first on the search_path, so the code under test never sees
+    the tables of the database it runs in.
+    """
+    import psycopg2
+
+    from scraper import db, migrations
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    admin = psycopg2.connect(database_url)
+    admin.autocommit = True
+    admin.cursor().execute(f"CREATE SCHEMA {schema}")
+
+    separator = '&' if '?' in database_url else '?'
+    url = f"{database_url}{separator}options={quote(f'-csearch_path={schema}')}"
+    try:
+        migrations.ensure_schema(url)
+        yield url
+    finally:
+        db.close_all()
+        migrations._current.discard(url)
+        admin.cursor().execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
@@ -0,0 +1,93 @@
+import psycopg2
+
+from tools.maintenance.auto_sync_menus import apply_plan, build_key, build_plan, diff_window
+
+
+def api_item(name, meal_time='lunch', station='Grill'):
+    return {'name': name, 'meal_time': meal_time, 'station': station, 'item_id': None, 'nutrition_ready': True}
+
+
+def db_item(name, food_id, meal_time='Lunch', station='Grill'):
+    return {'name': name, 'meal_time': meal_time, 'station': station, 'food_id': food_id}
+
+
+def keyed(*items):
+    return {build_key(item['name'], item['meal_time'], item['station']): item for item in items}
+
+
+def test_diff_window_added_removed_unchanged():
+    burger, fries, salad = api_item('Burger'), api_item('Fries'), api_item('Salad')
+    api_window = {('Ford', '2026-10-19'): {'status': 'ok', 'items': keyed(burger, salad)}}
+    db_window = {('Ford', '2026-10-19'): keyed(db_item('Burger', 1), db_item('Fries', 2))}
+
+    assert diff_window(api_window, db_window) == {
+        ('Ford', '2026-10-19'): {'added': [salad], 'removed': [db_item('Fries', 2)], 'unchanged': 1},
+    }
+
+
+def test_diff_window_keys_ignore_case_and_spacing():
+    api_window = {('Ford', '2026-10-19'): {'status': 'ok', 'items': keyed(api_item('Grilled  Cheese', station='deli'))}}
+    db_window = {('Ford', '2026-10-19'): keyed(db_item('grilled cheese', 1, station='Deli'))}
+
+    assert diff_window(api_window, db_window)[('Ford', '2026-10-19')] == {'added': [], 'removed': [], 'unchanged': 1}
+
+
+def test_diff_window_skips_closed_days_and_api_errors():
+    db_window = {
+        ('Ford', '2026-10-19'): keyed(db_item('Burger', 1)),
+        ('Wiley', '2026-10-19'): keyed(db_item('Pasta', 2)),
+    }
+    api_window = {('Ford', '2026-10-19'): None, ('Wiley', '2026-10-19'): {'status': 'closed'}}
+
+    assert diff_window(api_window, db_window) == {}
+
+
+def test_diff_window_open_day_with_no_schedule():
+    burger = api_item('Burger')
+    api_window = {('Ford', '2026-10-20'): {'status': 'ok', 'items': keyed(burger)}}
+
+    assert diff_window(api_window, {}) == {
+        ('Ford', '2026-10-20'): {'added': [burger], 'removed': [], 'unchanged': 0},
+    }
+
+
+def test_build_plan_orders_by_date_then_court():
+    diffs = {
+        ('Wiley', '2026-10-19'): {'added': [api_item('Pasta')], 'removed': [], 'unchanged': 0},
+        ('Ford', '2026-10-20'): {'added': [api_item('Soup')], 'removed': [db_item('Burger', 1)], 'unchanged': 0},
+        ('Ford', '2026-10-19'): {'added': [api_item('Salad')], 'removed': [db_item('Fries', 2)], 'unchanged': 3},
+    }
+
+    assert build_plan(diffs) == {
+        'add': [
+            ('Ford', '2026-10-19', api_item('Salad')),
+            ('Wiley', '2026-10-19', api_item('Pasta')),
+            ('Ford', '2026-10-20', api_item('Soup')),
+        ],
+        'remove': [
+            ('Ford', '2026-10-19', db_item('Fries', 2)),
+            ('Ford', '2026-10-20', db_item('Burger', 1)),
+        ],
+    }
+
+
+def test_build_plan_empty():
+    assert build_plan({}) == {'add': [], 'remove': []}
+    assert build_plan({('Ford', '2026-10-19'): {'added': [], 'removed': [], 'unchanged': 2}}) == {'add': [], 'remove': []}
+
+
+def test_apply_plan(migrated_url):
+    with psycopg2.connect(migrated_url) as conn:
+        cursor = conn.cursor()
+        plan = {'add': [('Ford', '2026-10-19', api_item('Burger')), ('Ford', '2026-10-20', api_item('Burger'))],
+                'remove': []}
+        assert apply_plan(cursor, plan) == (2, 0, 1)
+
+        cursor.execute("SELECT id FROM foods")
+        (food_id,), = cursor.fetchall()
+        plan = {'add': [('Ford', '2026-10-21', api_item('Burger'))],
+                'remove': [('Ford', '2026-10-19', db_item('Burger', food_id, meal_time='lunch'))]}
+        assert apply_plan(cursor, plan) == (1, 1, 0)
+
+        cursor.execute("SELECT date::text FROM food_appearances ORDER BY date")
+        assert [row[0] for row in cursor.fetchall()] == ['2026-10-20', '2026-10-21']
@@ -0,0 +1,104 @@
+import pytest
+
+from scraper.capacity_guard import CapacityGuard
+
+MB = 1024 * 1024
+
+
+class FakeSizeGuard(CapacityGuard):
+    """CapacityGuard reading database sizes from a list instead of pg_database_size()."""
+
+    def __init__(self, sizes, max_bytes=100 * MB, **kwargs):
+        kwargs.setdefault('row_bytes', 1024)
+        kwargs.setdefault('remeasure_bytes', 8 * MB)
+        kwargs.setdefault('log', lambda line: None)
+        super().__init__(max_bytes, threshold_percent=90.0, **kwargs)
+        self.sizes = list(sizes)
+
+    def _query_size(self):
+        return self.sizes.pop(0) if len(self.sizes) > 1 else self.sizes[0]
+
+
+def test_first_check_measures_then_estimates():
+    guard = FakeSizeGuard([10 * MB])
+    assert guard.check('start') == 10 * MB
+    assert guard.check('write', pending_rows=100) == 10 * MB + 100 * 1024
+    assert guard.check('write', pending_rows=100) == 10 * MB + 200 * 1024
+    assert guard.measurements == 1
+    assert guard.estimated_growth == 200 * 1024
+
+
+def test_remeasures_after_estimated_growth():
+    guard = FakeSizeGuard([10 * MB, 11 * MB], remeasure_bytes=MB)
+    guard.check('start', pending_bytes=MB)
+    # The estimate reached remeasure_bytes, so this check queries the real size
+    assert guard.check('next') == 11 * MB
+    assert guard.measurements == 2
+    assert guard.estimated_growth == 0
+
+
+def test_estimate_over_threshold_is_confirmed_by_a_measurement():
+    guard = FakeSizeGuard([80 * MB, 20 * MB])
+    guard.check('start')
+    # 80 MiB + 15 MiB pending is over 90 MiB by the estimate, but the database
+    # really holds 20 MiB, so the write goes ahead
+    assert guard.check('big write', pending_bytes=15 * MB) == 35 * MB
+    assert guard.measurements == 2
+
+
+def test_raises_when_measured_size_reaches_threshold():
+    guard = FakeSizeGuard([85 * MB], error_class=SystemExit)
+    guard.check('start')
+    with pytest.raises(SystemExit):
+        guard.check('write', pending_bytes=5 * MB)
+    # A refused write is not added to the estimate
+    assert guard.estimated_growth == 0
+
+
+def test_projection_from_growth():
+    guard = FakeSizeGuard([10 * MB])
+    guard.check('start')
+    guard.check('write', pending_bytes=20 * MB)
+    projection = guard.projection()
+    assert projection['growth_bytes'] == 20 * MB
+    assert projection['headroom_bytes'] == 60 * MB
+    assert projection['runs_left'] == 3
+
+
+def test_projection_without_growth_or_measurement():
+    guard = FakeSizeGuard([10 * MB])
+    assert guard.projection() is None
+    guard.check('start')
+    assert guard.projection() == {'headroom_bytes': 80 * MB, 'growth_bytes': 0, 'runs_left': None}
+
+
+def test_report_projects_from_a_final_measurement():
+    lines = []
+    guard = FakeSizeGuard([10 * MB, 40 * MB], log=lines.append)
+    guard.check('start')
+    guard.report()
+    assert guard.measurements == 2
+    assert 'about 1 more runs' in lines[-1]
+
+
+def test_unconfigured_limit():
+    guard = CapacityGuard(None, strict=False, log=lambda line: None)
+    assert guard.check('start', pending_rows=10) is None
+    assert guard.projection() is None
+
+    with pytest.raises(RuntimeError):
+        CapacityGuard(None, strict=True).check('start')
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv('DB_CAPACITY_BYTES', raising=False)
+    monkeypatch.setenv('DATABASE_CAPACITY_BYTES', str(500 * MB))
+    monkeypatch.setenv('DB_PAUSE_THRESHOLD_PERCENT', '150')
+    monkeypatch.setenv('DB_CAPACITY_STRICT', 'off')
+    monkeypatch.setenv('DB_GUARD_REMEASURE_BYTES', '0')
+    guard = CapacityGuard.from_env()
+    assert guard.max_bytes == 500 * MB
+    # Thresholds outside (0, 100] fall back to the default
+    assert guard.threshold_percent == 95.0
+    assert not guard.strict
+    assert guard.remeasure_bytes == 0
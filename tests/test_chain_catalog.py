@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+from scraper import chain_catalog
+from scraper.chain_catalog import CATALOGS, ChainCatalog, beverage_item_macros
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def catalog(name='Starbucks'):
+    return next(c for c in CATALOGS if c.name == name)
+
+
+def test_content_hash_is_stable():
+    assert catalog().content_hash() == catalog().content_hash()
+    fresh = ChainCatalog('Starbucks', 'get_starbucks_items', chain_catalog.STARBUCKS_LOCATIONS, template=True)
+    assert fresh.content_hash() == catalog().content_hash()
+
+
+def test_content_hash_is_stable_across_processes_and_imports_nothing():
+    script = (
+        "import sys\n"
+        "from scraper.chain_catalog import CATALOGS\n"
+        "for c in CATALOGS: print(c.content_hash())\n"
+        "print(sorted(m for m in sys.modules if m.startswith('scraper.chain_scrapers.')))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', script], cwd=REPO_ROOT, capture_output=True, text=True,
+                         check=True).stdout.splitlines()
+    assert out[:-1] == [c.content_hash() for c in CATALOGS]
+    assert out[-1] == '[]'
+
+
+def test_content_hash_covers_the_declaration():
+    base = ChainCatalog('Starbucks', 'get_starbucks_items', ['A', 'B'], template=True)
+    variants = [
+        ChainCatalog('Starbucks', 'get_starbucks_items', ['A', 'B'], template=False),
+        ChainCatalog('Starbucks', 'get_starbucks_items', ['A'], template=True),
+        ChainCatalog('Starbucks', 'get_starbucks_items', ['A', 'B'], beverage_item_macros, template=True),
+        ChainCatalog('Starbucks', 'get_panera_items', ['A', 'B'], template=True),
+    ]
+    assert len({base.content_hash()} | {v.content_hash() for v in variants}) == len(variants) + 1
+
+
+def test_content_hash_follows_the_module_source(tmp_path, monkeypatch):
+    source = tmp_path / 'starbucks.py'
+    monkeypatch.setattr(chain_catalog.importlib.util, 'find_spec',
+                        lambda name: types.SimpleNamespace(origin=str(source)))
+
+    source.write_text("def get_starbucks_items():\n    return []\n")
+    before = catalog().content_hash()
+    assert catalog().content_hash() == before
+
+    source.write_text("def get_starbucks_items():\n    return [{'name': 'Latte'}]\n")
+    assert catalog().content_hash() != before
+
+
+def test_catalog_modules_come_from_chain_scrapers_exports():
+    assert catalog('Panera').module == 'panera'
+    assert catalog('Dining court beverages').module == 'dining_court_beverages'
+    with pytest.raises(AttributeError):
+        ChainCatalog('Missing', 'get_missing_items', ['Nowhere'])
+
+
+def test_rows_collapse_repeated_keys_to_the_last():
+    items = [
+        {'name': 'Latte', 'station': 'Hot', 'meal_time': 'Lunch', 'calories': 100, 'protein': 1, 'carbs': 2, 'fats': 3},
+        {'name': 'Latte', 'station': 'Hot', 'meal_time': 'Lunch', 'calories': 120, 'protein': 1, 'carbs': 2, 'fats': 3},
+    ]
+    rows = chain_catalog.catalog_rows(items, 'Starbucks @ MSEE')
+    assert [(row[1], row[2], row[4]) for row in rows] == [('Latte', 120, 'Starbucks @ MSEE')]
+    assert rows[0][8] == chain_catalog.content_hash(120, {'protein': 1, 'carbs': 2, 'fats': 3})
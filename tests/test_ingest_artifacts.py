@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+
+import pytest
+
+from scripts import ingest_artifacts
+
+
+def item(name, court='Ford', appearances=(), calories=100):
+    return {
+        'name': name, 'dining_court': court, 'meal_period': 'Lunch', 'station': 'Grill', 'calories': calories,
+        'next_appearances': [{'date': d, 'day_name': 'Monday', 'meal_time': 'Lunch'} for d in appearances],
+    }
+
+
+def snapshot(name, menu_date, calories=100, court='Ford'):
+    return {'name': name, 'dining_court': court, 'meal_period': 'Lunch', 'station': 'Grill',
+            'available_date': menu_date, 'calories': calories}
+
+
+def artifact(items=(), snapshots=(), created_at='2026-10-19T00:00:00'):
+    return ('a.ndjson.gz', {'created_at': created_at}, list(items), list(snapshots))
+
+
+def test_merge_items_combines_schedules_and_keeps_newest_nutrition():
+    loaded = [
+        artifact([item('Burger', appearances=['2026-10-21', '2026-10-19'], calories=500)]),
+        artifact([item('burger ', appearances=['2026-10-20', '2026-10-21'], calories=520),
+                  item('Fries', court='Earhart')]),
+    ]
+    merged = ingest_artifacts.merge_items(loaded)
+
+    assert [m['name'] for m in merged] == ['burger ', 'Fries']
+    burger = merged[0]
+    assert burger['calories'] == 520
+    assert [a['date'] for a in burger['next_appearances']] == ['2026-10-19', '2026-10-20', '2026-10-21']
+
+
+def test_merge_items_does_not_modify_the_artifacts():
+    original = item('Burger', appearances=['2026-10-19'])
+    ingest_artifacts.merge_items([artifact([original]), artifact([item('Burger', appearances=['2026-10-20'])])])
+    assert [a['date'] for a in original['next_appearances']] == ['2026-10-19']
+
+
+def test_merge_items_without_schedules():
+    merged = ingest_artifacts.merge_items([artifact([{'name': 'Salad', 'dining_court': 'Ford'}])])
+    assert merged == [{'name': 'Salad', 'dining_court': 'Ford'}]
+
+
+def test_group_snapshots_by_date_keeps_the_newest_row_per_key():
+    loaded = [
+        artifact(snapshots=[snapshot('Burger', '2026-10-19', 500), snapshot('Fries', '2026-10-19')]),
+        artifact(snapshots=[snapshot('Burger', '2026-10-19', 520), snapshot('Burger', '2026-10-20'),
+                            {'name': 'Dateless', 'dining_court': 'Ford'}]),
+    ]
+    by_date = ingest_artifacts.group_snapshots_by_date(loaded)
+
+    assert sorted(by_date) == ['2026-10-19', '2026-10-20']
+    assert {(s['name'], s['calories']) for s in by_date['2026-10-19']} == {('Burger', 520), ('Fries', 100)}
+    assert len(by_date['2026-10-20']) == 1
+
+
+def test_group_snapshots_by_date_falls_back_to_court_code_and_menu_date():
+    loaded = [artifact(snapshots=[
+        {'name': 'Soup', 'dining_court_code': 'ERHT', 'menu_date': '2026-10-19'},
+        {'name': 'Soup', 'dining_court': 'Earhart', 'menu_date': '2026-10-19'},
+    ])]
+    assert len(ingest_artifacts.group_snapshots_by_date(loaded)['2026-10-19']) == 2
+
+
+class FakeConnection:
+    def cursor(self):
+        return self
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def fake_transaction(database_url):
+    yield FakeConnection()
+
+
+@pytest.fixture
+def fake_ingest(monkeypatch):
+    """ingest() with the database replaced; returns the loaded artifacts to ingest."""
+    loaded = [artifact([item('Burger', appearances=['2026-10-19'])],
+                       [snapshot('Burger', '2026-10-19'), snapshot('Burger', '2026-10-20')])]
+    for name in ('DB_CAPACITY_BYTES', 'DATABASE_CAPACITY_BYTES', 'POSTGRES_MAX_BYTES'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('DB_CAPACITY_STRICT', 'false')
+    monkeypatch.setattr(ingest_artifacts, 'load_artifacts', lambda paths: loaded)
+    monkeypatch.setattr(ingest_artifacts, 'ensure_schema', lambda database_url: None)
+    monkeypatch.setattr(ingest_artifacts, 'transaction', fake_transaction)
+    monkeypatch.setattr(ingest_artifacts, '_ensure_snapshot_partitions', lambda cursor, dates: None)
+    monkeypatch.setattr(ingest_artifacts, 'write_snapshot_date',
+                        lambda database_url, menu_date, snapshots, source: len(snapshots))
+    monkeypatch.setattr(ingest_artifacts, 'save_to_database', lambda items, database_url: (1, 0, 0, 0))
+    return lambda: ingest_artifacts.ingest(['a.ndjson.gz'], 'postgresql://test')
+
+
+def test_ingest_succeeds(fake_ingest):
+    assert fake_ingest() == 0
+
+
+def test_failed_foods_write_counts_as_a_failure(fake_ingest, monkeypatch):
+    monkeypatch.setattr(ingest_artifacts, 'save_to_database', lambda items, database_url: None)
+    assert fake_ingest() == 1
+
+
+def test_failed_dates_and_foods_are_all_counted(fake_ingest, monkeypatch):
+    def write_snapshot_date(database_url, menu_date, snapshots, source):
+        if menu_date == '2026-10-20':
+            raise RuntimeError('deadlock detected')
+        return len(snapshots)
+
+    monkeypatch.setattr(ingest_artifacts, 'write_snapshot_date', write_snapshot_date)
+    monkeypatch.setattr(ingest_artifacts, 'save_to_database', lambda items, database_url: None)
+    assert fake_ingest() == 2
@@ -0,0 +1,58 @@
+import pytest
+
+from scraper.match_keys import food_match_key, match_text
+
+SAMPLES = [
+    ('Mac-N-Cheese', 'mac n cheese'),
+    ('  Comfort  ', 'comfort'),
+    ("Chef's Table", 'chef s table'),
+    ('Crème Brûlée', 'cr me br l e'),
+    ('Pizza\t&\nPasta', 'pizza pasta'),
+    ('***', ''),
+    ('', ''),
+    (None, ''),
+]
+
+ROWS = [
+    ('Ford', 'Mac-N-Cheese', 'Lunch', ' Comfort '),
+    ('Earhart', 'Soup', None, None),
+    ('Earhart', 'Soup', '', ''),
+    ("Pete's Za", 'Pizza (Slice)', 'Late Lunch', 'Oven #2'),
+]
+
+
+@pytest.mark.parametrize('value, expected', SAMPLES)
+def test_match_text(value, expected):
+    assert match_text(value) == expected
+
+
+def test_food_match_key():
+    assert food_match_key('Ford', 'Mac-N-Cheese', 'Lunch', ' Comfort ') == 'ford|mac n cheese|lunch|comfort'
+    assert food_match_key('Ford', 'Mac N Cheese', 'lunch', 'Comfort') == 'ford|mac n cheese|lunch|comfort'
+    # A missing meal_time or station counts as 'Unknown', an empty one does not
+    assert food_match_key('Earhart', 'Soup', None, None) == 'earhart|soup|unknown|unknown'
+    assert food_match_key('Earhart', 'Soup', '', '') == 'earhart|soup||'
+
+
+@pytest.fixture
+def cursor(migrated_url):
+    """Cursor on a migrated schema, where 0008 defined the SQL match key functions."""
+    import psycopg2
+
+    conn = psycopg2.connect(migrated_url)
+    try:
+        yield conn.cursor()
+    finally:
+        conn.close()
+
+
+def test_match_text_matches_sql(cursor):
+    for value, _ in SAMPLES:
+        cursor.execute('SELECT food_match_text(%s)', (value,))
+        assert cursor.fetchone()[0] == match_text(value), value
+
+
+def test_food_match_key_matches_sql(cursor):
+    for row in ROWS:
+        cursor.execute('SELECT food_match_key(%s, %s, %s, %s)', row)
+        assert cursor.fetchone()[0] == food_match_key(*row), row
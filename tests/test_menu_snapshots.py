@@ -0,0 +1,52 @@
+import psycopg2
+import pytest
+
+from scraper.menu_scraper import _write_menu_snapshots
+
+
+def snapshot(name, calories=100, menu_date='2026-10-19', court='Ford', station='Grill', meal='Lunch'):
+    return {'name': name, 'calories': calories, 'protein': 10, 'carbs': 20, 'fats': 5, 'dining_court': court,
+            'dining_court_code': 'FORD', 'station': station, 'meal_period': meal, 'available_date': menu_date}
+
+
+def write(url, items, bulk=True):
+    """Write snapshots in one transaction. Returns the rows written."""
+    with psycopg2.connect(url) as conn:
+        return _write_menu_snapshots(conn.cursor(), items, bulk=bulk)
+
+
+def stored(url):
+    with psycopg2.connect(url) as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT menu_date::text, name, calories, COALESCE(s.macros, n.macros)->>'protein'
+            FROM menu_snapshots s
+            LEFT JOIN nutrition_facts_macros n ON n.id = s.nutrition_id
+            ORDER BY 1, 2
+        """)
+        return cursor.fetchall()
+
+
+@pytest.mark.parametrize('bulk', [True, False], ids=['bulk', 'rowwise'])
+def test_counts_and_rewrites(migrated_url, bulk):
+    batch = [snapshot('Burger'), snapshot('Fries'), snapshot('Burger', menu_date='2026-11-02')]
+    assert write(migrated_url, batch, bulk) == 3
+    # Writing the same keys again updates them in place
+    assert write(migrated_url, [snapshot('Burger', calories=120)], bulk) == 1
+    assert stored(migrated_url) == [
+        ('2026-10-19', 'Burger', 120, '10'),
+        ('2026-10-19', 'Fries', 100, '10'),
+        ('2026-11-02', 'Burger', 100, '10'),
+    ]
+
+
+def test_repeated_keys_in_a_batch_keep_the_last(migrated_url):
+    batch = [snapshot('Burger', calories=100), snapshot('Burger', calories=200), snapshot('Burger', calories=150)]
+    assert write(migrated_url, batch) == 1
+    assert stored(migrated_url) == [('2026-10-19', 'Burger', 150, '10')]
+
+
+def test_items_without_a_date_are_skipped(migrated_url):
+    undated = dict(snapshot('Burger'), available_date=None)
+    assert write(migrated_url, [undated, snapshot('Fries')]) == 1
+    assert [row[1] for row in stored(migrated_url)] == ['Fries']
@@ -0,0 +1,164 @@
+import time
+from contextlib import contextmanager
+
+from scraper import menu_scraper
+from scraper.nutrition_store import (
+    DEFAULT_REFRESH_SAMPLE,
+    DEFAULT_TTL_DAYS,
+    RefreshPolicy,
+    adopt_item_id,
+    id_key,
+    lookup_nutrition,
+    remember_nutrition,
+)
+
+DAY = 86400
+
+
+def test_sampling_disabled_and_full():
+    assert not any(RefreshPolicy(sample_rate=0.0, salt='s').is_sampled(f'item-{i}') for i in range(1000))
+    assert all(RefreshPolicy(sample_rate=1.0, salt='s').is_sampled(f'item-{i}') for i in range(1000))
+
+
+def test_sample_rate_is_clamped():
+    assert RefreshPolicy(sample_rate=5).sample_rate == 1.0
+    assert RefreshPolicy(sample_rate=-1).sample_rate == 0.0
+    assert RefreshPolicy(sample_rate=None).sample_rate == 0.0
+
+
+def test_sample_is_deterministic_per_salt_and_covers_the_rate():
+    ids = [f'item-{i}' for i in range(20000)]
+    first = {i for i in ids if RefreshPolicy(sample_rate=0.1, salt='run-1').is_sampled(i)}
+    again = {i for i in ids if RefreshPolicy(sample_rate=0.1, salt='run-1').is_sampled(i)}
+    other = {i for i in ids if RefreshPolicy(sample_rate=0.1, salt='run-2').is_sampled(i)}
+
+    assert first == again
+    assert 0.08 < len(first) / len(ids) < 0.12
+    # A new salt rotates the sample through the cache
+    assert first != other
+
+
+def test_sample_ignores_item_id_case():
+    policy = RefreshPolicy(sample_rate=0.5, salt='s')
+    assert all(policy.is_sampled(f'ABC-{i}') == policy.is_sampled(f'abc-{i}') for i in range(200))
+
+
+def test_ttl_expiry():
+    now = 100 * DAY
+    policy = RefreshPolicy(ttl_seconds=30 * DAY, now=now)
+    assert not policy.is_expired({'fetched_at': now - 29 * DAY})
+    assert policy.is_expired({'fetched_at': now - 31 * DAY})
+    # Entries without a fetch time count as fetched at the epoch
+    assert policy.is_expired({})
+    # An explicit now overrides the policy's clock
+    assert not policy.is_expired({'fetched_at': now - 31 * DAY}, now=now - 2 * DAY)
+
+
+def test_no_ttl_never_expires():
+    assert not RefreshPolicy(ttl_seconds=None, now=10 ** 10).is_expired({'fetched_at': 0})
+
+
+def test_claim_once_per_item_per_run():
+    now = 100 * DAY
+    policy = RefreshPolicy(ttl_seconds=DAY, now=now, salt='s')
+    stale = {'fetched_at': now - 2 * DAY}
+
+    assert policy.claim(stale, 'Item-1')
+    assert not policy.claim(stale, 'item-1')
+    assert policy.claim(stale, 'item-2')
+
+
+def test_claim_skips_fresh_and_missing_ids():
+    now = 100 * DAY
+    policy = RefreshPolicy(ttl_seconds=DAY, now=now, salt='s')
+    assert not policy.claim({'fetched_at': now}, 'item-1')
+    assert not policy.claim({'fetched_at': 0}, None)
+    assert not policy.claim({'fetched_at': 0}, '')
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv('NUTRITION_CACHE_TTL_DAYS', '2')
+    monkeypatch.setenv('NUTRITION_REFRESH_SAMPLE', '0.25')
+    monkeypatch.setenv('NUTRITION_REFRESH_SALT', 'fixed')
+    policy = RefreshPolicy.from_env()
+    assert policy.ttl_seconds == 2 * DAY
+    assert policy.sample_rate == 0.25
+    assert policy.salt == 'fixed'
+
+    # A TTL of 0 disables age-based refresh; arguments win over the environment
+    policy = RefreshPolicy.from_env(ttl_days=0, sample_rate=0)
+    assert policy.ttl_seconds is None
+    assert policy.sample_rate == 0.0
+
+
+def test_from_env_ignores_bad_values(monkeypatch):
+    monkeypatch.setenv('NUTRITION_CACHE_TTL_DAYS', 'soon')
+    monkeypatch.delenv('NUTRITION_REFRESH_SAMPLE', raising=False)
+    monkeypatch.delenv('NUTRITION_REFRESH_SALT', raising=False)
+    policy = RefreshPolicy.from_env()
+    assert policy.ttl_seconds == DEFAULT_TTL_DAYS * DAY
+    assert policy.sample_rate == DEFAULT_REFRESH_SAMPLE
+    assert policy.salt
+
+
+def test_lookup_prefers_the_newer_entry():
+    cache = {}
+    remember_nutrition(cache, 'Burger', 'Ford', {'calories': 500}, item_id='ABC', when=100)
+    remember_nutrition(cache, 'Burger', 'Earhart', {'calories': 520}, when=50)
+
+    # Earhart's own entry is older than the one fetched for the same item at Ford
+    assert lookup_nutrition(cache, 'burger', 'earhart', 'abc')['calories'] == 500
+    assert lookup_nutrition(cache, 'Burger', 'Earhart')['calories'] == 520
+    assert lookup_nutrition(cache, 'Fries', 'Earhart', 'XYZ') is None
+
+
+def test_adopt_item_id_indexes_entries_loaded_without_one():
+    cache = {}
+    entry = {'calories': 500, 'fetched_at': 100}
+    cache[('burger', 'ford')] = entry
+
+    adopt_item_id(cache, 'Burger', 'Ford', entry, 'ABC')
+    assert cache[id_key('ABC')] is entry
+    assert entry['item_id'] == 'ABC'
+    assert entry['fetched_at'] == 100
+
+    # An entry that already has an ID keeps it
+    adopt_item_id(cache, 'Burger', 'Ford', entry, 'DEF')
+    assert entry['item_id'] == 'ABC'
+    assert id_key('DEF') not in cache
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+def test_database_entries_count_as_fetched_at_load(monkeypatch):
+    rows = [('Burger', 'Ford', 500, {'protein': 30, 'carbs': 40, 'fats': 20})]
+
+    class FakeConnection:
+        def cursor(self):
+            return FakeCursor(rows)
+
+    @contextmanager
+    def fake_connection(database_url):
+        yield FakeConnection()
+
+    monkeypatch.setattr(menu_scraper, 'connection', fake_connection)
+    before = time.time()
+    cache = menu_scraper.get_nutrition_cache('postgresql://test')
+
+    entry = cache[('burger', 'ford')]
+    assert entry['protein'] == 30
+    assert entry['fetched_at'] >= before
+    # A cold start does not re-fetch items loaded from the database by age
+    assert not RefreshPolicy(ttl_seconds=30 * DAY, salt='s').claim(entry, 'ABC')
@@ -0,0 +1,170 @@
+import queue
+from contextlib import contextmanager
+
+import pytest
+
+from scraper import menu_scraper
+
+COURTS = [
+    {'code': 'ERHT', 'api_name': 'Earhart', 'display_name': 'Earhart'},
+    {'code': 'FORD', 'api_name': 'Ford', 'display_name': 'Ford'},
+]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeCursor:
+    def close(self):
+        pass
+
+
+class RaisingGuard:
+    """CapacityGuard stand-in that trips on the nth check of a stage."""
+
+    def __init__(self, stage, error, after=0):
+        self.stage = stage
+        self.error = error
+        self.after = after
+        self.checks = []
+
+    def check(self, stage, pending_rows=0, pending_bytes=0):
+        self.checks.append((stage, pending_rows))
+        if stage == self.stage and sum(1 for s, _ in self.checks if s == stage) > self.after:
+            raise self.error
+
+
+def item(name, court, date_str):
+    return {'name': name, 'dining_court': court, 'meal_period': 'Lunch', 'station': 'Grill',
+            'available_date': date_str}
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Run scrape_and_save_pipelined against fakes; returns what it wrote."""
+    written = {'batches': [], 'foods': [], 'conn': FakeConnection()}
+
+    @contextmanager
+    def fake_connection(database_url):
+        yield written['conn']
+
+    def fake_write(cursor, batch, source='api', bulk=True):
+        written['batches'].append(batch)
+        return len(batch)
+
+    def fake_save(items, database_url=None, bulk=True):
+        written['foods'].append(items)
+        return {'inserted': len(items)}
+
+    monkeypatch.setattr(menu_scraper, 'DINING_LOCATIONS', COURTS)
+    monkeypatch.setattr(menu_scraper, 'ensure_schema', lambda database_url: None)
+    monkeypatch.setattr(menu_scraper, 'connection', fake_connection)
+    monkeypatch.setattr(menu_scraper, '_write_menu_snapshots', fake_write)
+    monkeypatch.setattr(menu_scraper, 'save_to_database', fake_save)
+    monkeypatch.setattr(menu_scraper, '_scrape_location_day',
+                        lambda court, date_str, cache, policy=None: [item('Burger', court['display_name'], date_str)])
+
+    def run(**kwargs):
+        kwargs.setdefault('database_url', 'postgresql://test')
+        kwargs.setdefault('days_ahead', 3)
+        kwargs.setdefault('use_cache', False)
+        kwargs.setdefault('date', '2026-10-19')
+        kwargs.setdefault('schedule_start_date', '2026-10-19')
+        kwargs.setdefault('queue_size', 1)
+        return menu_scraper.scrape_and_save_pipelined(**kwargs)
+
+    written['run'] = run
+    return written
+
+
+def test_writes_every_batch_then_foods_once(pipeline):
+    items = pipeline['run']()
+
+    assert len(pipeline['batches']) == 6
+    assert pipeline['conn'].commits == 6
+    assert pipeline['foods'] == [items]
+    # One food per court, each with its three days
+    assert len(items) == 2
+    assert [len(i['next_appearances']) for i in items] == [3, 3]
+
+
+def test_writer_error_fails_the_run_without_saving_foods(pipeline, monkeypatch):
+    def failing_write(cursor, batch, source='api', bulk=True):
+        raise RuntimeError('disk full')
+
+    monkeypatch.setattr(menu_scraper, '_write_menu_snapshots', failing_write)
+    # queue_size=1 with six batches: the fetchers only finish if the writer keeps draining
+    with pytest.raises(RuntimeError, match='Snapshot writer failed: disk full'):
+        pipeline['run']()
+    assert pipeline['foods'] == []
+    assert pipeline['conn'].rollbacks == 1
+
+
+def test_writer_connection_error_fails_the_run(pipeline, monkeypatch):
+    def no_schema(database_url):
+        raise RuntimeError('unreachable')
+
+    monkeypatch.setattr(menu_scraper, 'ensure_schema', no_schema)
+    with pytest.raises(RuntimeError, match='unreachable'):
+        pipeline['run']()
+    assert pipeline['batches'] == []
+    assert pipeline['foods'] == []
+
+
+def test_guard_exit_in_the_writer_is_reraised(pipeline):
+    guard = RaisingGuard('before snapshot batch write', SystemExit('capacity'), after=2)
+    with pytest.raises(SystemExit):
+        pipeline['run'](guard=guard)
+    assert len(pipeline['batches']) == 2
+    assert pipeline['foods'] == []
+
+
+def test_guard_checks_the_foods_write(pipeline):
+    guard = RaisingGuard('before database write', SystemExit('capacity'))
+    with pytest.raises(SystemExit):
+        pipeline['run'](guard=guard)
+    assert len(pipeline['batches']) == 6
+    assert pipeline['foods'] == []
+    assert ('before database write', 2) in guard.checks
+
+
+def test_failed_foods_write_raises(pipeline, monkeypatch):
+    monkeypatch.setattr(menu_scraper, 'save_to_database', lambda items, database_url=None, bulk=True: None)
+    with pytest.raises(RuntimeError, match='Saving foods failed'):
+        pipeline['run']()
+
+
+def test_drain_stops_writing_after_an_error_but_empties_the_queue(monkeypatch):
+    calls = []
+
+    def write(cursor, batch, source='api', bulk=True):
+        calls.append(batch)
+        if len(calls) == 2:
+            raise RuntimeError('boom')
+        return len(batch)
+
+    monkeypatch.setattr(menu_scraper, '_write_menu_snapshots', write)
+    batch_queue = queue.Queue()
+    for batch in (['a'], ['b', 'c'], ['d'], None):
+        batch_queue.put(batch)
+    conn = FakeConnection()
+    stats = {'rows': 0, 'batches': 0, 'write_seconds': 0.0, 'error': None}
+
+    menu_scraper._drain_snapshot_batches(batch_queue, conn, FakeCursor(), 'api', stats)
+
+    assert calls == [['a'], ['b', 'c']]
+    assert batch_queue.empty()
+    assert (stats['rows'], stats['batches'], conn.commits, conn.rollbacks) == (1, 1, 1, 1)
+    assert str(stats['error']) == 'boom'
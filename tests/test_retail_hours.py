@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+from scraper.retail_hours import MINUTES_PER_DAY, MINUTES_PER_WEEK, OpenHoursIndex, minute_of_week, parse_hours
+
+MON, TUE, FRI, SAT, SUN = 0, 1, 4, 5, 6
+
+
+def at(day, hour, minute=0):
+    return day * MINUTES_PER_DAY + hour * 60 + minute
+
+
+def test_campusdish_text():
+    text = 'Mon - Fri: 7:00 AM - 2:00 PM<br/>Sat - Sun: Closed'
+    assert parse_hours(text) == [[at(day, 7), at(day, 14)] for day in range(5)]
+
+
+def test_start_takes_the_end_meridiem():
+    assert parse_hours('Daily 11-2pm')[0] == [at(MON, 11), at(MON, 14)]
+    assert parse_hours('Mon 5-9pm') == [[at(MON, 17), at(MON, 21)]]
+
+
+def test_day_lists_and_short_meridiems():
+    assert parse_hours('Mon & Wed 9a-5p') == [[at(MON, 9), at(MON, 17)], [at(2, 9), at(2, 17)]]
+
+
+def test_noon_and_midnight():
+    assert parse_hours('Weekends noon - midnight') == [[at(SAT, 12), at(SUN, 0)], [at(SUN, 12), MINUTES_PER_WEEK]]
+
+
+def test_overnight_hours_run_into_the_next_day():
+    assert parse_hours('Fri: 8pm - 2am') == [[at(FRI, 20), at(SAT, 2)]]
+
+
+def test_overnight_hours_wrap_at_the_end_of_the_week():
+    assert parse_hours('Sun 10pm-2am') == [[0, at(MON, 2)], [at(SUN, 22), MINUTES_PER_WEEK]]
+
+
+def test_all_day_merges_into_one_interval():
+    assert parse_hours('Open 24 hours') == [[0, MINUTES_PER_WEEK]]
+
+
+def test_closed_and_unrecognized():
+    assert parse_hours('Closed') == []
+    assert parse_hours('Call for hours') is None
+    assert parse_hours('') is None
+    assert parse_hours(None) is None
+
+
+def test_minute_of_week():
+    assert minute_of_week(datetime(2026, 10, 19, 9, 30)) == at(MON, 9, 30)
+    # Aware datetimes are converted to campus time (EDT in October)
+    assert minute_of_week(datetime(2026, 10, 20, 3, 0, tzinfo=timezone.utc)) == at(MON, 23)
+
+
+def test_open_at():
+    index = OpenHoursIndex([
+        ('cafe', parse_hours('Mon - Fri: 7:00 AM - 2:00 PM')),
+        ('late', parse_hours('Daily 8pm - 2am')),
+        ('unknown', None),
+    ])
+    assert index.open_at(datetime(2026, 10, 19, 9, 0)) == {'cafe'}
+    assert index.open_at(datetime(2026, 10, 19, 14, 0)) == set()
+    assert index.open_at(datetime(2026, 10, 20, 1, 0)) == {'late'}
+    # Sunday night's hours carry over into Monday morning
+    assert index.open_at(datetime(2026, 10, 19, 1, 59)) == {'late'}
+    assert index.open_at(datetime(2026, 10, 19, 2, 0)) == set()
+
+
+def test_open_at_with_overlapping_intervals():
+    index = OpenHoursIndex([('a', [[at(MON, 8), at(MON, 12)], [at(MON, 10), at(MON, 14)]])])
+    assert index.open_at(datetime(2026, 10, 19, 13, 0)) == {'a'}
+    assert index.open_at(datetime(2026, 10, 19, 14, 0)) == set()
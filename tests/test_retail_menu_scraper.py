@@ -0,0 +1,78 @@
+import pytest
+
+from scraper.retail_menu_scraper import (
+    TEMPLATE_SLOTS, _plan_rows, _wanted_rows, sync_location_menu, sync_menu_template,
+)
+
+
+def item(name, calories=300, station='Entrees', meal_time='All Day'):
+    return {'name': name, 'calories': calories, 'protein': 10, 'carbs': 20, 'fats': 5,
+            'station': station, 'meal_time': meal_time}
+
+
+def macros(item):
+    return {'protein': item['protein'], 'carbs': item['carbs'], 'fats': item['fats']}
+
+
+def test_wanted_rows_last_item_wins():
+    wanted = _wanted_rows([item('Wrap', calories=300), item('Wrap', calories=350)], macros)
+    assert list(wanted) == [('Wrap', 'Entrees', 'All Day')]
+    assert wanted[('Wrap', 'Entrees', 'All Day')][0] == 350
+
+
+def test_plan_rows():
+    wanted = _wanted_rows([item('Wrap'), item('Salad', calories=200), item('Soup')], macros)
+    existing = {
+        ('Wrap', 'Entrees', 'All Day'): (1, wanted[('Wrap', 'Entrees', 'All Day')][2]),
+        ('Salad', 'Entrees', 'All Day'): (2, 'old hash'),
+        ('Taco', 'Entrees', 'All Day'): (3, 'any hash'),
+    }
+
+    stale_ids, changed, updated = _plan_rows(wanted, existing)
+    assert stale_ids == [3]
+    assert [row[:4] for row in changed] == [
+        ('Salad', 'Entrees', 'All Day', 200),
+        ('Soup', 'Entrees', 'All Day', 300),
+    ]
+    assert updated == 1
+
+
+def test_plan_rows_nothing_stored():
+    wanted = _wanted_rows([item('Wrap')], macros)
+    stale_ids, changed, updated = _plan_rows(wanted, {})
+    assert (stale_ids, len(changed), updated) == ([], 1, 0)
+    assert _plan_rows({}, {('Wrap', 'Entrees', 'All Day'): (7, 'hash')}) == ([7], [], 0)
+
+
+def test_sync_location_menu(migrated_url):
+    import psycopg2
+
+    with psycopg2.connect(migrated_url) as conn:
+        cursor = conn.cursor()
+
+        assert sync_location_menu(cursor, [item('Wrap'), item('Salad')], 'Cafe', macros) == (2, 0, 0, 0)
+        assert sync_location_menu(cursor, [item('Wrap'), item('Salad')], 'Cafe', macros) == (0, 0, 0, 2)
+        assert sync_location_menu(cursor, [item('Wrap', calories=320), item('Soup')], 'Cafe', macros) == (1, 1, 1, 0)
+
+        cursor.execute("SELECT name, calories FROM menu_snapshots WHERE dining_court = 'Cafe' ORDER BY name")
+        assert cursor.fetchall() == [('Soup', 300), ('Wrap', 320)]
+
+
+def test_sync_menu_template_rejects_too_many_locations():
+    locations = [f'Cafe {n}' for n in range(TEMPLATE_SLOTS + 1)]
+    # Checked before the cursor is used
+    with pytest.raises(ValueError, match='at most 64'):
+        sync_menu_template(None, [item('Latte')], 'Coffee', locations, macros)
+
+
+def test_sync_menu_template(migrated_url):
+    import psycopg2
+
+    with psycopg2.connect(migrated_url) as conn:
+        cursor = conn.cursor()
+        locations = ['Cafe A', 'Cafe B', 'Cafe A']
+        assert sync_menu_template(cursor, [item('Latte'), item('Mocha')], 'Coffee', locations, macros) == (2, 0, 0, 0)
+        assert sync_menu_template(cursor, [item('Latte')], 'Coffee', ['Cafe B'], macros) == (0, 0, 1, 1)
+
+        cursor.execute("SELECT dining_court, slot FROM menu_template_locations ORDER BY dining_court")
+        assert cursor.fetchall() == [('Cafe B', 1)]
@@ -0,0 +1,73 @@
+import psycopg2
+import pytest
+
+from scraper.menu_scraper import save_to_database
+
+
+def item(name, calories=100, court='Ford', station='Grill', dates=('2026-10-19',)):
+    return {
+        'name': name, 'calories': calories, 'protein': 10, 'carbs': 20, 'fats': 5,
+        'dining_court': court, 'dining_court_code': 'FORD', 'station': station, 'meal_period': 'Lunch',
+        'next_appearances': [{'date': d, 'day_name': 'Monday', 'meal_time': 'Lunch'} for d in dates],
+    }
+
+
+def foods(url):
+    with psycopg2.connect(url) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name, dining_court, calories FROM foods ORDER BY name, dining_court")
+        return cursor.fetchall()
+
+
+@pytest.mark.parametrize('bulk', [True, False], ids=['bulk', 'rowwise'])
+def test_counts_added_changed_unchanged(migrated_url, bulk):
+    batch = [item('Burger'), item('Fries')]
+    assert save_to_database(batch, migrated_url, bulk=bulk) == (2, 0, 0, 0)
+    assert save_to_database(batch, migrated_url, bulk=bulk) == (0, 0, 2, 0)
+
+    changed = [item('Burger', calories=120), item('Fries'), item('Salad')]
+    assert save_to_database(changed, migrated_url, bulk=bulk) == (1, 1, 1, 0)
+    assert foods(migrated_url) == [('Burger', 'Ford', 120), ('Fries', 'Ford', 100), ('Salad', 'Ford', 100)]
+
+
+@pytest.mark.parametrize('bulk', [True, False], ids=['bulk', 'rowwise'])
+def test_new_appearances_of_an_unchanged_food(migrated_url, bulk):
+    save_to_database([item('Burger')], migrated_url, bulk=bulk)
+    # Schedules live in food_appearances; the food row itself is unchanged
+    assert save_to_database([item('Burger', dates=('2026-10-19', '2026-10-20'))], migrated_url,
+                            bulk=bulk) == (0, 0, 1, 0)
+    with psycopg2.connect(migrated_url) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT date::text FROM food_appearances ORDER BY date")
+        assert [row[0] for row in cursor.fetchall()] == ['2026-10-19', '2026-10-20']
+
+
+def test_items_matching_one_food_are_counted_once(migrated_url):
+    # Stored under the court code, then scraped under two display names that
+    # both match it through the code
+    save_to_database([item('Burger', court=None)], migrated_url)
+    batch = [item('Burger', calories=200, court='Ford'), item('Burger', calories=300, court='Ford Dining')]
+
+    assert save_to_database(batch, migrated_url) == (0, 1, 0, 0)
+    assert save_to_database(batch, migrated_url) == (1, 0, 1, 0)
+    assert foods(migrated_url) == [('Burger', 'Ford', 200), ('Burger', 'Ford Dining', 300)]
+
+
+def test_empty_batch(migrated_url):
+    assert save_to_database([], migrated_url) == (0, 0, 0, 0)
+
+
+@pytest.mark.parametrize('bulk', [True, False], ids=['bulk', 'rowwise'])
+def test_next_available_refreshed_for_saved_foods_only(migrated_url, bulk):
+    save_to_database([item('Burger'), item('Fries')], migrated_url, bulk=bulk)
+    with psycopg2.connect(migrated_url) as conn:
+        conn.cursor().execute("UPDATE foods SET next_available = '[]' WHERE name = 'Fries'")
+
+    save_to_database([item('Burger', dates=('2026-10-20',))], migrated_url, bulk=bulk)
+    with psycopg2.connect(migrated_url) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name, next_available FROM foods ORDER BY name")
+        assert cursor.fetchall() == [
+            ('Burger', [{'date': '2026-10-20', 'day_name': 'Tuesday', 'meal_time': 'Lunch'}]),
+            ('Fries', []),
+        ]
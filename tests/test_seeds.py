@@ -0,0 +1,48 @@
+import hashlib
+
+import pytest
+
+from scraper.seeds import _has_statements, apply_seed_files, file_checksum
+
+
+def test_file_checksum(tmp_path):
+    path = tmp_path / 'seed.sql'
+    path.write_bytes(b'INSERT INTO t VALUES (1);\n')
+    assert file_checksum(path) == hashlib.sha256(b'INSERT INTO t VALUES (1);\n').hexdigest()
+
+
+@pytest.mark.parametrize('sql, expected', [
+    ('', False),
+    ('-- only a comment\n\n   -- another\n', False),
+    ('-- header\nSELECT 1;\n', True),
+    ('  SELECT 1', True),
+])
+def test_has_statements(sql, expected):
+    assert _has_statements(sql) is expected
+
+
+def test_apply_seed_files_skips_unchanged(migrated_url, tmp_path):
+    import psycopg2
+
+    first = tmp_path / 'first.sql'
+    first.write_text("CREATE TABLE IF NOT EXISTS seed_probe (n INT);\nINSERT INTO seed_probe VALUES (1);\n")
+    empty = tmp_path / 'empty.sql'
+    empty.write_text("-- nothing yet\n")
+    paths = [str(first), str(empty), str(tmp_path / 'missing.sql')]
+
+    conn = psycopg2.connect(migrated_url)
+    try:
+        assert apply_seed_files(conn, paths) == [str(first), str(empty)]
+        assert apply_seed_files(conn, paths) == []
+
+        first.write_text(first.read_text() + "INSERT INTO seed_probe VALUES (2);\n")
+        assert apply_seed_files(conn, paths) == [str(first)]
+        assert apply_seed_files(conn, paths, force=True) == [str(first), str(empty)]
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT n, COUNT(*) FROM seed_probe GROUP BY n ORDER BY n")
+        assert cursor.fetchall() == [(1, 3), (2, 2)]
+        cursor.execute("SELECT filename, checksum FROM seed_files ORDER BY filename")
+        assert cursor.fetchall() == [('empty.sql', file_checksum(empty)), ('first.sql', file_checksum(first))]
+    finally:
+        conn.close()
@@ -5,106 +5,76 @@ This script ensures the database stays in sync with the Purdue Dining API.
 Run this daily to prevent menu mismatches.
 
 Usage:
-    python auto_sync_menus.py [--days N]
+    python auto_sync_menus.py [--days N] [--dry-run] [--concurrency N]
 
 Options:
-    --days N    Number of days ahead to sync (default: 7)
+    --days N          Number of days ahead to sync (default: 7)
+    --dry-run         Print the planned changes without writing them
+    --concurrency N   Menus fetched at once (default: SYNC_CONCURRENCY or 8)
+
+All location-day menus are fetched in parallel over one pooled HTTP session.
+The sync then builds a complete plan (appearances to add and remove across
+every court and day) and applies it in one transaction with a handful of
+batched statements.
 """
 
 import os
 import sys
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import psycopg2
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+from scraper.capacity_guard import CapacityGuard
 from scraper.dining_locations import DINING_LOCATIONS
+from scraper.match_keys import food_match_key, match_text
 
 
-def parse_bytes_env(name):
-    value = os.getenv(name)
-    if not value:
-        return None
-    try:
-        n = int(value)
-        return n if n > 0 else None
-    except ValueError:
-        return None
-
-
-def strict_capacity_mode():
-    raw = (os.getenv('DB_CAPACITY_STRICT', 'true') or '').strip().lower()
-    return raw not in ('0', 'false', 'no', 'off')
-
-
-def check_db_capacity_guard(conn, stage):
-    max_bytes = (
-        parse_bytes_env('DB_CAPACITY_BYTES')
-        or parse_bytes_env('DATABASE_CAPACITY_BYTES')
-        or parse_bytes_env('POSTGRES_MAX_BYTES')
-    )
-    threshold_raw = os.getenv('DB_PAUSE_THRESHOLD_PERCENT', '95')
-    try:
-        threshold_percent = float(threshold_raw)
-    except ValueError:
-        threshold_percent = 95.0
-    if threshold_percent <= 0 or threshold_percent > 100:
-        threshold_percent = 95.0
-
-    if max_bytes is None:
-        if strict_capacity_mode():
-            raise RuntimeError(
-                'DB capacity guard is strict and no capacity limit is configured. '
-                'Set DB_CAPACITY_BYTES (or DATABASE_CAPACITY_BYTES/POSTGRES_MAX_BYTES).'
-            )
-        print('[db-guard] Capacity limit not configured; guard is running in non-strict mode.')
-        return
-
-    cursor = conn.cursor()
-    cursor.execute('SELECT pg_database_size(current_database())')
-    used_bytes = int(cursor.fetchone()[0])
-    cursor.close()
-
-    used_percent = (used_bytes / max_bytes) * 100.0
-    print(f"[db-guard] {stage}: using {used_percent:.2f}% ({used_bytes}/{max_bytes} bytes), threshold={threshold_percent:.2f}%")
-    if used_percent >= threshold_percent:
-        raise RuntimeError(
-            f"DB capacity guard triggered at {used_percent:.2f}% (threshold {threshold_percent:.2f}%). Scraping paused."
-        )
-
-def normalize_text(value):
-    """Normalize text for comparison (matches frontend logic)."""
-    if not value:
-        return ''
-    import re
-    text = str(value).lower()
-    text = re.sub(r'[^a-z0-9]+', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
-
 def build_key(name, meal_time, station):
-    """Build composite key for item matching."""
-    return f"{normalize_text(name)}|{normalize_text(meal_time)}|{normalize_text(station)}"
+    """
+    Build composite key for item matching within one court: the name, meal and
+    station parts of foods.match_key (see scraper/match_keys.py).
+    """
+    return '|'.join((
+        match_text(name),
+        match_text(meal_time or 'Unknown'),
+        match_text(station or 'Unknown'),
+    ))
 
 def normalize_meal(name):
     """Normalize meal names."""
-    key = normalize_text(name)
+    key = match_text(name)
     if key in ['late lunch', 'latelunch']:
         return 'late lunch'
     if key in ['breakfast', 'lunch', 'dinner']:
         return key
     return name or 'Unknown'
 
-def fetch_menu(location_code, date_str):
+DEFAULT_CONCURRENCY = 8
+
+API_HEADERS = {'User-Agent': 'BoilerFuelSync/1.0', 'Accept': 'application/json'}
+
+
+def create_session(pool_size=DEFAULT_CONCURRENCY):
+    """HTTP session whose connection pool can keep one connection per concurrent fetch alive."""
+    session = requests.Session()
+    session.headers.update(API_HEADERS)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount('https://', adapter)
+    return session
+
+def fetch_menu(location_code, date_str, session=None):
     """Fetch menu from API."""
     url = f"https://api.hfs.purdue.edu/menus/v2/locations/{location_code}/{date_str}"
-    headers = {'User-Agent': 'BoilerFuelSync/1.0', 'Accept': 'application/json'}
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = (session or requests).get(url, headers=API_HEADERS, timeout=15)
         resp.raise_for_status()
         return resp.json()
     except Exception as e:
@@ -138,154 +108,213 @@ def extract_api_items(menu_json):
     
     return items
 
-def get_db_items_for_date(cursor, dining_court, date_str):
-    """Get items scheduled in DB for a specific date."""
+def get_db_items_for_window(cursor, dining_courts, start_date, end_date):
+    """
+    Load every scheduled item for the given courts and date range in one query.
+
+    The name and station parts of each key come from the stored foods.match_key,
+    so rows are not normalized again on every run; only the appearance's meal
+    (which may differ from the food's) is normalized here, in SQL.
+
+    Returns:
+        Dict mapping (dining_court, date_str) -> {key: item}, where key is
+        build_key(name, meal_time, station) and item has name, meal_time,
+        station and food_id
+    """
     cursor.execute("""
-        SELECT name, meal_time, station, next_available, id
-        FROM foods
-        WHERE dining_court = %s AND next_available IS NOT NULL
-    """, (dining_court,))
-    
-    items = {}
-    item_ids = {}
-    
-    for name, meal_time, station, next_available, food_id in cursor.fetchall():
-        schedule = next_available if isinstance(next_available, list) else []
-        
-        for slot in schedule:
-            if slot.get('date') == date_str:
-                meal_for_date = slot.get('meal_time', meal_time)
-                key = build_key(name, meal_for_date, station)
-                items[key] = {
-                    'name': name,
-                    'meal_time': meal_for_date,
-                    'station': station or 'Unknown',
-                    'food_id': food_id
-                }
-                item_ids[key] = food_id
-    
-    return items, item_ids
+        SELECT f.dining_court, a.date::text,
+               split_part(f.match_key, '|', 2) || '|' || food_match_text(a.meal_time)
+                   || '|' || split_part(f.match_key, '|', 4),
+               f.name, a.meal_time, f.station, f.id
+        FROM food_appearances a
+        JOIN foods f ON f.id = a.food_id
+        WHERE a.date BETWEEN %s AND %s AND f.dining_court = ANY(%s)
+    """, (start_date, end_date, list(dining_courts)))
 
-def sync_location_date(cursor, conn, location, date_str):
-    """Sync a specific location for a specific date."""
-    api_name = location['api_name']
-    display_name = location['display_name']
-    
-    # Fetch from API
-    menu_json = fetch_menu(api_name, date_str)
+    window = {}
+    for dining_court, date_str, key, name, meal_for_date, station, food_id in cursor.fetchall():
+        window.setdefault((dining_court, date_str), {})[key] = {
+            'name': name,
+            'meal_time': meal_for_date,
+            'station': station or 'Unknown',
+            'food_id': food_id
+        }
+    return window
+
+def fetch_location_date(location, date_str, session=None):
+    """
+    Fetch one location's menu for one date.
+
+    Returns:
+        None on API error, {'status': 'closed'} when closed or empty, else
+        {'status': 'ok', 'items': {key: item}}
+    """
+    menu_json = fetch_menu(location['api_name'], date_str, session)
     if not menu_json:
         return None
-    
+
     # Check if location is closed
     if menu_json.get('IsOpen') is False or menu_json.get('IsPublished') is False:
-        return {'status': 'closed', 'items': 0}
-    
-    # Extract API items
+        return {'status': 'closed'}
+
     api_items = extract_api_items(menu_json)
     if not api_items:
-        return {'status': 'closed', 'items': 0}
-    
-    # Get DB items
-    db_items, db_ids = get_db_items_for_date(cursor, display_name, date_str)
-    
-    changes = {'status': 'ok', 'added': 0, 'removed': 0, 'unchanged': 0}
-    
-    # Find items to add (in API but not in DB)
-    for key, item in api_items.items():
-        if key not in db_items:
-            # Need to add this item
-            add_item_to_schedule(cursor, conn, display_name, item, date_str)
-            changes['added'] += 1
-        else:
-            changes['unchanged'] += 1
-    
-    # Find items to remove (in DB but not in API)
-    for key, item in db_items.items():
-        if key not in api_items:
-            # Remove this date from the item's schedule
-            remove_date_from_schedule(cursor, conn, item['food_id'], date_str)
-            changes['removed'] += 1
-    
-    return changes
+        return {'status': 'closed'}
+    return {'status': 'ok', 'items': api_items}
 
-def add_item_to_schedule(cursor, conn, dining_court, item, date_str):
-    """Add an item or update its schedule."""
-    name = item['name']
-    meal_time = item['meal_time']
-    station = item['station']
-    
-    # Check if item exists
-    cursor.execute("""
-        SELECT id, next_available FROM foods
-        WHERE name = %s AND dining_court = %s AND meal_time = %s AND station = %s
-    """, (name, dining_court, meal_time, station))
-    
-    existing = cursor.fetchone()
-    day_name = datetime.strptime(date_str, '%Y-%m-%d').strftime('%A')
-    
-    if existing:
-        food_id, next_available = existing
-        schedule = next_available if isinstance(next_available, list) else []
-        
-        # Add date if not present
-        if not any(slot.get('date') == date_str for slot in schedule):
-            schedule.append({
-                'date': date_str,
-                'day_name': day_name,
-                'meal_time': meal_time
-            })
-            
-            cursor.execute("""
-                UPDATE foods SET next_available = %s, updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """, (json.dumps(schedule), food_id))
-            conn.commit()
-    else:
-        # Item doesn't exist - create with minimal data (will be enriched by full scraper)
-        schedule = [{'date': date_str, 'day_name': day_name, 'meal_time': meal_time}]
-        
+def fetch_window(locations, dates, concurrency=DEFAULT_CONCURRENCY, session=None):
+    """
+    Fetch every location-day menu in the window, at most concurrency at a time,
+    over one pooled session.
+
+    Returns:
+        Dict mapping (display_name, date_str) -> fetch_location_date result
+    """
+    concurrency = max(1, concurrency)
+    own_session = session is None
+    session = session or create_session(concurrency)
+    slots = [(location, date_str) for date_str in dates for location in locations]
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = pool.map(lambda slot: fetch_location_date(slot[0], slot[1], session), slots)
+            return {
+                (location['display_name'], date_str): result
+                for (location, date_str), result in zip(slots, results)
+            }
+    finally:
+        if own_session:
+            session.close()
+
+def diff_window(api_window, db_window):
+    """
+    Compare fetched menus with the DB schedule for every open (court, date) at once.
+
+    Closed days and API errors are left untouched, as before.
+
+    Returns:
+        Dict mapping (dining_court, date_str) -> {'added': [api items],
+        'removed': [db items], 'unchanged': count}
+    """
+    diffs = {}
+    for slot, fetched in api_window.items():
+        if not fetched or fetched['status'] != 'ok':
+            continue
+        api_items = fetched['items']
+        db_items = db_window.get(slot, {})
+        api_keys = api_items.keys()
+        db_keys = db_items.keys()
+        diffs[slot] = {
+            'added': [api_items[key] for key in sorted(api_keys - db_keys)],
+            'removed': [db_items[key] for key in sorted(db_keys - api_keys)],
+            'unchanged': len(api_keys & db_keys),
+        }
+    return diffs
+
+def build_plan(diffs):
+    """
+    Turn the per-court diffs into one changeset.
+
+    Returns:
+        Dict with 'add' (list of (dining_court, date_str, item)) and 'remove'
+        (list of (dining_court, date_str, db item)), ordered by date and court
+    """
+    plan = {'add': [], 'remove': []}
+    for (dining_court, date_str), diff in sorted(diffs.items(), key=lambda entry: (entry[0][1], entry[0][0])):
+        plan['add'].extend((dining_court, date_str, item) for item in diff['added'])
+        plan['remove'].extend((dining_court, date_str, item) for item in diff['removed'])
+    return plan
+
+def print_plan(plan):
+    """Print every change in the plan, one line each."""
+    for dining_court, date_str, item in plan['add']:
+        print(f"  + {date_str} {dining_court}: {item['name']} ({item['meal_time']}, {item['station']})")
+    for dining_court, date_str, item in plan['remove']:
+        print(f"  - {date_str} {dining_court}: {item['name']} ({item['meal_time']}, {item['station']})")
+
+def _refresh_next_available(cursor, plan, added_ids=()):
+    """Copy food_schedules into the deprecated foods.next_available for the foods a plan rescheduled (db/migrations/0013)."""
+    food_ids = sorted({item['food_id'] for _, _, item in plan['remove']} | set(added_ids))
+    if food_ids:
+        cursor.execute("SELECT refresh_foods_next_available(%s::int[])", (food_ids,))
+
+def apply_plan(cursor, plan):
+    """
+    Apply a plan with one statement per kind of change. The caller commits.
+
+    Removals are a single DELETE. Additions look up all their foods in one
+    foods.match_key index probe, create the missing ones (minimal rows, enriched later by the full
+    scraper) in one INSERT, and add every appearance in one more INSERT. The deprecated
+    foods.next_available is then refreshed for the foods whose schedule changed.
+
+    Returns:
+        (appearances added, appearances removed, foods created)
+    """
+    removed = 0
+    if plan['remove']:
         cursor.execute("""
-            INSERT INTO foods (name, calories, macros, dining_court, station, meal_time, next_available)
-            VALUES (%s, 0, %s, %s, %s, %s, %s)
+            DELETE FROM food_appearances a
+            USING unnest(%s::int[], %s::date[], %s::text[]) AS r(food_id, date, meal_time)
+            WHERE a.food_id = r.food_id AND a.date = r.date AND a.meal_time = r.meal_time
         """, (
-            name,
-            json.dumps({'protein': 0, 'carbs': 0, 'fats': 0, 'serving_size': '1 serving'}),
-            dining_court,
-            station,
-            meal_time,
-            json.dumps(schedule)
+            [item['food_id'] for _, _, item in plan['remove']],
+            [date_str for _, date_str, _ in plan['remove']],
+            [item['meal_time'] for _, _, item in plan['remove']],
         ))
-        conn.commit()
-
-def remove_date_from_schedule(cursor, conn, food_id, date_str):
-    """Remove a specific date from an item's schedule."""
-    cursor.execute("SELECT next_available FROM foods WHERE id = %s", (food_id,))
-    row = cursor.fetchone()
-    if not row:
-        return
-    
-    next_available = row[0]
-    schedule = next_available if isinstance(next_available, list) else []
-    
-    # Remove the date
-    schedule = [slot for slot in schedule if slot.get('date') != date_str]
-    
-    if schedule:
-        cursor.execute("""
-            UPDATE foods SET next_available = %s, updated_at = CURRENT_TIMESTAMP
-            WHERE id = %s
-        """, (json.dumps(schedule), food_id))
-    else:
+        removed = cursor.rowcount
+
+    if not plan['add']:
+        _refresh_next_available(cursor, plan)
+        return 0, removed, 0
+
+    def match_key(dining_court, item):
+        return food_match_key(dining_court, item['name'], item['meal_time'], item['station'])
+
+    wanted = {}
+    for dining_court, _, item in plan['add']:
+        wanted.setdefault(match_key(dining_court, item), (item['name'], dining_court, item['meal_time'], item['station']))
+    cursor.execute(
+        "SELECT match_key, id FROM foods WHERE match_key = ANY(%s)",
+        (sorted(wanted),)
+    )
+    food_ids = dict(cursor.fetchall())
+
+    missing = [wanted[key] for key in sorted(wanted) if key not in food_ids]
+    created = 0
+    if missing:
+        # Item doesn't exist - create with minimal data (will be enriched by full scraper).
+        # A food written since the lookup is kept as is; the no-op update only returns its id.
         cursor.execute("""
-            UPDATE foods SET next_available = NULL, updated_at = CURRENT_TIMESTAMP
-            WHERE id = %s
-        """, (food_id,))
-    
-    conn.commit()
+            INSERT INTO foods (name, calories, macros, dining_court, station, meal_time)
+            SELECT name, 0, %s::jsonb, dining_court, station, meal_time
+            FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[]) AS m(name, dining_court, meal_time, station)
+            ON CONFLICT (match_key) DO UPDATE SET name = foods.name
+            RETURNING match_key, id, xmax = 0
+        """, [json.dumps({'protein': 0, 'carbs': 0, 'fats': 0, 'serving_size': '1 serving'})]
+           + [list(column) for column in zip(*missing)])
+        for key, food_id, inserted in cursor.fetchall():
+            food_ids[key] = food_id
+            created += inserted
+
+    appearances = [
+        (food_ids[match_key(dining_court, item)], date_str, item['meal_time'])
+        for dining_court, date_str, item in plan['add']
+    ]
+    cursor.execute("""
+        INSERT INTO food_appearances (food_id, date, meal_time)
+        SELECT * FROM unnest(%s::int[], %s::date[], %s::text[])
+        ON CONFLICT DO NOTHING
+    """, [list(column) for column in zip(*appearances)])
+    added = cursor.rowcount
+    _refresh_next_available(cursor, plan, {food_id for food_id, _, _ in appearances})
+    return added, removed, created
 
 def main():
     parser = argparse.ArgumentParser(description='Sync menus with Purdue Dining API')
     parser.add_argument('--days', type=int, default=7, help='Days ahead to sync (default: 7)')
+    parser.add_argument('--dry-run', action='store_true', help='Print the planned changes without writing them')
+    parser.add_argument('--concurrency', type=int,
+                        default=int(os.getenv('SYNC_CONCURRENCY', DEFAULT_CONCURRENCY)),
+                        help=f'Menus fetched at once (default: SYNC_CONCURRENCY or {DEFAULT_CONCURRENCY})')
     args = parser.parse_args()
     
     database_url = os.getenv('DATABASE_URL')
@@ -304,45 +333,73 @@ def main():
         conn = psycopg2.connect(database_url)
         cursor = conn.cursor()
 
-        check_db_capacity_guard(conn, 'before sync run')
+        guard = CapacityGuard.from_env(conn=conn)
+        guard.check('before sync run')
         
-        total_added = 0
-        total_removed = 0
+        dates = [
+            (datetime.now() + timedelta(days=day_offset)).strftime('%Y-%m-%d')
+            for day_offset in range(args.days)
+        ]
+        courts = [location['display_name'] for location in DINING_LOCATIONS]
         
-        for day_offset in range(args.days):
-            check_db_capacity_guard(conn, f'before day offset {day_offset}')
-            date = datetime.now() + timedelta(days=day_offset)
-            date_str = date.strftime('%Y-%m-%d')
-            day_name = date.strftime('%A')
-            
-            print(f"\n{day_name}, {date.strftime('%B %d, %Y')} ({date_str})")
+        # Fetch every menu first, then load the DB side for the whole window in one query
+        started = time.monotonic()
+        api_window = fetch_window(DINING_LOCATIONS, dates, args.concurrency)
+        print(f"Fetched {len(api_window)} location-day menus in {time.monotonic() - started:.1f}s "
+              f"({args.concurrency} concurrent)")
+        db_window = get_db_items_for_window(cursor, courts, dates[0], dates[-1]) if dates else {}
+        diffs = diff_window(api_window, db_window)
+        plan = build_plan(diffs)
+        
+        for date_str in dates:
+            date = datetime.strptime(date_str, '%Y-%m-%d')
+            print(f"\n{date.strftime('%A')}, {date.strftime('%B %d, %Y')} ({date_str})")
             print("-" * 60)
             
-            for location in DINING_LOCATIONS:
-                result = sync_location_date(cursor, conn, location, date_str)
+            for display_name in courts:
+                fetched = api_window[(display_name, date_str)]
                 
-                if result is None:
-                    print(f"  {location['display_name']:25} - API Error")
-                elif result['status'] == 'closed':
-                    print(f"  {location['display_name']:25} - Closed")
+                if fetched is None:
+                    print(f"  {display_name:25} - API Error")
+                elif fetched['status'] == 'closed':
+                    print(f"  {display_name:25} - Closed")
                 else:
+                    diff = diffs[(display_name, date_str)]
                     status = []
-                    if result['added'] > 0:
-                        status.append(f"+{result['added']}")
-                        total_added += result['added']
-                    if result['removed'] > 0:
-                        status.append(f"-{result['removed']}")
-                        total_removed += result['removed']
+                    if diff['added']:
+                        status.append(f"+{len(diff['added'])}")
+                    if diff['removed']:
+                        status.append(f"-{len(diff['removed'])}")
                     if not status:
                         status = ['✓']
                     
-                    print(f"  {location['display_name']:25} - {' '.join(status)}")
+                    print(f"  {display_name:25} - {' '.join(status)}")
         
+        print(f"\n{'='*60}")
+        if args.dry_run:
+            print(f"Plan: +{len(plan['add'])} to add, -{len(plan['remove'])} to remove (dry run, nothing written)")
+            print(f"{'='*60}")
+            print_plan(plan)
+            cursor.close()
+            conn.close()
+            return 0
+        
+        if plan['add'] or plan['remove']:
+            guard.check('before applying plan', pending_rows=len(plan['add']))
+            try:
+                added, removed, created = apply_plan(cursor, plan)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        else:
+            added, removed, created = 0, 0, 0
+        
+        guard.report()
         cursor.close()
         conn.close()
         
-        print(f"\n{'='*60}")
-        print(f"Sync complete: +{total_added} added, -{total_removed} removed")
+        print(f"Sync complete: +{added} added, -{removed} removed ({created} new foods)")
         print(f"{'='*60}")
         
         return 0